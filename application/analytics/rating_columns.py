@@ -0,0 +1,162 @@
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.entities.form import Form
+from domain.entities.response import Response
+from domain.value_objects.question_type import QuestionType
+from domain.value_objects.response_columns import (
+    MISSING_CODE,
+    MISSING_INTEGER,
+    EncodedColumn,
+    ResponseColumns,
+)
+
+MISSING_TIMESTAMP = -1
+MICROS_PER_SECOND = 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class RatingScale:
+    question_id: str
+    min_rating: int
+    max_rating: int
+
+
+@dataclass(frozen=True, slots=True)
+class RatingColumns:
+    scales: tuple[RatingScale, ...]
+    question_index: npt.NDArray[np.int16]
+    rating: npt.NDArray[np.int16]
+    submitted_at: npt.NDArray[np.int64]
+    tag_codes: dict[str, npt.NDArray[np.int32]]
+    tag_values: dict[str, tuple[str, ...]]
+
+    def __len__(self) -> int:
+        return len(self.rating)
+
+    def for_question(self, index: int) -> npt.NDArray[np.bool_]:
+        return np.equal(self.question_index, index)
+
+
+class RatingColumnBuilder:
+    def __init__(self, form: Form) -> None:
+        questions = [q for q in form.questions if q.type == QuestionType.RATING]
+        self._scales = tuple(
+            RatingScale(str(q.id), q.min_rating or 0, q.max_rating or 0) for q in questions
+        )
+        self._positions = {scale.question_id: i for i, scale in enumerate(self._scales)}
+        self._question_index = array("h")
+        self._rating = array("h")
+        self._submitted_at = array("q")
+        self._tag_codes: dict[str, array[int]] = {}
+        self._tag_dictionaries: dict[str, dict[str, int]] = {}
+
+    def add(self, responses: Iterable[Response]) -> None:
+        positions = self._positions
+        scales = self._scales
+        for response in responses:
+            timestamp = (
+                int(response.submitted_at.timestamp())
+                if response.submitted_at
+                else MISSING_TIMESTAMP
+            )
+            for answer in response.answers:
+                position = positions.get(answer.question_id.value)
+                value = answer.value
+                if position is None or not isinstance(value, int) or isinstance(value, bool):
+                    continue
+                scale = scales[position]
+                if not scale.min_rating <= value <= scale.max_rating:
+                    continue
+                self._question_index.append(position)
+                self._rating.append(value)
+                self._submitted_at.append(timestamp)
+                self._append_tags(response.tags)
+
+    def add_columns(self, columns: ResponseColumns) -> None:
+        selections: list[tuple[int, npt.NDArray[np.intp], npt.NDArray[np.int64]]] = []
+        for position, scale in enumerate(self._scales):
+            column = columns.ratings.get(scale.question_id)
+            if column is None:
+                continue
+            ratings = np.asarray(column, dtype=np.int64)
+            selected = np.flatnonzero((ratings >= scale.min_rating) & (ratings <= scale.max_rating))
+            if len(selected):
+                selections.append((position, selected, ratings[selected]))
+        if not selections:
+            return
+        micros = np.asarray(columns.submitted_at, dtype=np.int64)
+        seconds = np.where(
+            micros == MISSING_INTEGER, MISSING_TIMESTAMP, micros // MICROS_PER_SECOND
+        )
+        remaps = self._tag_remaps(
+            columns.tags, np.unique(np.concatenate([selected for _, selected, _ in selections]))
+        )
+        for position, selected, ratings in selections:
+            row = len(self._rating)
+            self._question_index.frombytes(
+                np.full(len(selected), position, dtype=np.int16).tobytes()
+            )
+            self._rating.frombytes(ratings.astype(np.int16).tobytes())
+            self._submitted_at.frombytes(seconds[selected].tobytes())
+            for key in remaps.keys() - self._tag_codes.keys():
+                self._tag_codes[key] = array("i", [MISSING_CODE]) * row
+            for key, codes in self._tag_codes.items():
+                remap = remaps.get(key)
+                if remap is None:
+                    codes.extend(array("i", [MISSING_CODE]) * len(selected))
+                else:
+                    page_codes = np.asarray(columns.tags[key].codes, dtype=np.intp)[selected]
+                    codes.frombytes(remap[page_codes].tobytes())
+
+    def build(self) -> RatingColumns:
+        return RatingColumns(
+            scales=self._scales,
+            question_index=np.frombuffer(self._question_index, dtype=np.int16).copy(),
+            rating=np.frombuffer(self._rating, dtype=np.int16).copy(),
+            submitted_at=np.frombuffer(self._submitted_at, dtype=np.int64).copy(),
+            tag_codes={
+                key: np.frombuffer(codes, dtype=np.int32).copy()
+                for key, codes in self._tag_codes.items()
+            },
+            tag_values={
+                key: tuple(dictionary) for key, dictionary in self._tag_dictionaries.items()
+            },
+        )
+
+    def _tag_remaps(
+        self, tags: Mapping[str, EncodedColumn], rows: npt.NDArray[np.intp]
+    ) -> dict[str, npt.NDArray[np.int32]]:
+        remaps = {}
+        for key, column in tags.items():
+            codes = np.asarray(column.codes, dtype=np.intp)[rows]
+            used, first_rows = np.unique(codes, return_index=True)
+            known = used != MISSING_CODE
+            if not known.any():
+                continue
+            dictionary = self._tag_dictionaries.setdefault(key, {})
+            remap = np.full(len(column.values) + 1, MISSING_CODE, dtype=np.int32)
+            for code in used[known][np.argsort(first_rows[known])]:
+                remap[code] = dictionary.setdefault(column.values[code], len(dictionary))
+            remaps[key] = remap
+        return remaps
+
+    def _append_tags(self, tags: dict[str, str]) -> None:
+        row = len(self._rating) - 1
+        for key in tags.keys() - self._tag_codes.keys():
+            self._tag_codes[key] = array("i", [MISSING_CODE]) * row
+            self._tag_dictionaries[key] = {}
+        for key, codes in self._tag_codes.items():
+            value = tags.get(key)
+            if value is None:
+                codes.append(MISSING_CODE)
+                continue
+            dictionary = self._tag_dictionaries[key]
+            code = dictionary.get(value)
+            if code is None:
+                code = dictionary[value] = len(dictionary)
+            codes.append(code)
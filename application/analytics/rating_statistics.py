@@ -0,0 +1,101 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from application.analytics.rating_columns import MISSING_TIMESTAMP, RatingScale
+from domain.value_objects.response_columns import MISSING_CODE
+
+NPS_SCALE = 10
+NPS_PROMOTER_MIN = 9
+NPS_DETRACTOR_MAX = 6
+CSAT_TOP_BOX = 2
+DEFAULT_PERCENTILES = (25, 50, 75, 90)
+
+Ratings = npt.NDArray[np.int16]
+
+
+@dataclass(frozen=True, slots=True)
+class BucketMean:
+    start: int
+    count: int
+    mean: float
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentStats:
+    value: str
+    count: int
+    mean: float
+    nps: float | None
+
+
+def percentiles(
+    ratings: Ratings, quantiles: Sequence[int] = DEFAULT_PERCENTILES
+) -> dict[int, float]:
+    if not len(ratings):
+        return {}
+    values = np.percentile(ratings, quantiles)
+    return {q: float(v) for q, v in zip(quantiles, values, strict=True)}
+
+
+def net_promoter_score(ratings: Ratings, scale: RatingScale) -> float | None:
+    if not len(ratings):
+        return None
+    span = scale.max_rating - scale.min_rating
+    promoter_min = scale.min_rating - (-NPS_PROMOTER_MIN * span // NPS_SCALE)
+    detractor_max = scale.min_rating + NPS_DETRACTOR_MAX * span // NPS_SCALE
+    promoters = np.count_nonzero(ratings >= promoter_min)
+    detractors = np.count_nonzero(ratings <= detractor_max)
+    return float(100 * (promoters - detractors) / len(ratings))
+
+
+def csat(ratings: Ratings, scale: RatingScale) -> float | None:
+    if not len(ratings):
+        return None
+    satisfied = np.count_nonzero(ratings > scale.max_rating - CSAT_TOP_BOX)
+    return float(100 * satisfied / len(ratings))
+
+
+def time_bucket_means(
+    submitted_at: npt.NDArray[np.int64], ratings: Ratings, bucket_seconds: int
+) -> list[BucketMean]:
+    known = submitted_at != MISSING_TIMESTAMP
+    buckets = submitted_at[known] // bucket_seconds
+    if not len(buckets):
+        return []
+    starts, inverse = np.unique(buckets, return_inverse=True)
+    counts = np.bincount(inverse)
+    sums = np.bincount(inverse, weights=ratings[known])
+    return [
+        BucketMean(start=int(start) * bucket_seconds, count=int(count), mean=float(total / count))
+        for start, count, total in zip(starts, counts, sums, strict=True)
+    ]
+
+
+def segment_breakdown(
+    codes: npt.NDArray[np.int32],
+    values: Sequence[str],
+    ratings: Ratings,
+    scale: RatingScale,
+) -> list[SegmentStats]:
+    if not values:
+        return []
+    known = codes != MISSING_CODE
+    known_codes = codes[known]
+    known_ratings = ratings[known]
+    counts = np.bincount(known_codes, minlength=len(values))
+    sums = np.bincount(known_codes, weights=known_ratings, minlength=len(values))
+    order = np.argsort(known_codes, kind="stable")
+    groups = np.split(known_ratings[order], np.cumsum(counts)[:-1])
+    return [
+        SegmentStats(
+            value=value,
+            count=int(count),
+            mean=float(total / count),
+            nps=net_promoter_score(group, scale),
+        )
+        for value, count, total, group in zip(values, counts, sums, groups, strict=True)
+        if count
+    ]
@@ -0,0 +1,117 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from domain.entities.response import Response
+from domain.repositories.response_repository import ResponseRepository
+
+K = TypeVar("K", str, int)
+
+
+@dataclass(slots=True)
+class QuestionAggregate:
+    answer_count: int = 0
+    rating_count: int = 0
+    rating_sum: int = 0
+    rating_sum_squares: int = 0
+    rating_histogram: dict[int, int] = field(default_factory=dict)
+    option_counts: dict[str, int] = field(default_factory=dict)
+
+    def apply(self, value: str | int | list[str], delta: int) -> None:
+        self.answer_count += delta
+        if isinstance(value, bool):
+            return
+        if isinstance(value, int):
+            self.rating_count += delta
+            self.rating_sum += delta * value
+            self.rating_sum_squares += delta * value * value
+            _add_count(self.rating_histogram, value, delta)
+        elif isinstance(value, list):
+            for option in value:
+                _add_count(self.option_counts, option, delta)
+
+    @property
+    def rating_mean(self) -> float | None:
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+
+    @property
+    def rating_variance(self) -> float | None:
+        if not self.rating_count:
+            return None
+        n = self.rating_count
+        return (n * self.rating_sum_squares - self.rating_sum**2) / (n * n)
+
+
+@dataclass(slots=True)
+class FormAggregate:
+    response_count: int = 0
+    questions: dict[str, QuestionAggregate] = field(default_factory=dict)
+
+
+class FormAggregateStore(ABC):
+    @abstractmethod
+    async def get(self, form_id: str) -> FormAggregate | None:
+        pass
+
+
+class ResponseAggregator:
+    def __init__(self) -> None:
+        self._forms: dict[str, FormAggregate] = {}
+
+    def add(self, response: Response) -> None:
+        self._apply(response, 1)
+
+    def add_many(self, responses: Iterable[Response]) -> None:
+        for response in responses:
+            self._apply(response, 1)
+
+    def remove(self, response: Response) -> None:
+        self._apply(response, -1)
+
+    def get(self, form_id: str) -> FormAggregate | None:
+        return self._forms.get(form_id)
+
+    async def rebuild(self, response_repository: ResponseRepository) -> None:
+        self.clear()
+        async for page in response_repository.iter_pages():
+            self.add_many(page)
+
+    def aggregates(self) -> dict[str, FormAggregate]:
+        return dict(self._forms)
+
+    def restore(self, aggregates: Mapping[str, FormAggregate]) -> None:
+        self._forms = dict(aggregates)
+
+    def clear(self) -> None:
+        self._forms.clear()
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def _apply(self, response: Response, delta: int) -> None:
+        form_id = str(response.form_id)
+        aggregate = self._forms.get(form_id)
+        if aggregate is None:
+            if delta < 0:
+                return
+            aggregate = self._forms[form_id] = FormAggregate()
+        aggregate.response_count += delta
+        for answer in response.answers:
+            question_id = answer.question_id.value
+            question = aggregate.questions.get(question_id)
+            if question is None:
+                question = aggregate.questions[question_id] = QuestionAggregate()
+            question.apply(answer.value, delta)
+        if aggregate.response_count <= 0:
+            del self._forms[form_id]
+
+
+def _add_count(counts: dict[K, int], key: K, delta: int) -> None:
+    count = counts.get(key, 0) + delta
+    if count > 0:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
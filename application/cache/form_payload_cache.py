@@ -0,0 +1,100 @@
+import hashlib
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+ETAG_DIGEST_SIZE = 16
+
+
+@dataclass(frozen=True, slots=True)
+class FormPayload:
+    body: bytes
+    etag: str
+
+
+@dataclass(slots=True)
+class _CachedForm:
+    expires_at: float = math.inf
+    languages: tuple[str, ...] = ()
+    payloads: dict[str | None, FormPayload] = field(default_factory=dict)
+
+
+def compute_form_etag(
+    form_id: str,
+    updated_at: datetime | None,
+    body: bytes,
+    language: str | None = None,
+) -> str:
+    source = f"{form_id}:{language or ''}:{updated_at.isoformat()}".encode() if updated_at else body
+    return f'"{hashlib.blake2b(source, digest_size=ETAG_DIGEST_SIZE).hexdigest()}"'
+
+
+class FormPayloadCache:
+    def __init__(
+        self,
+        refresh: Callable[[], None] | None = None,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._forms: dict[str, _CachedForm] = {}
+        self._generations: dict[str, int] = {}
+        self._cleared_generation = 0
+        self._last_generation = 0
+        self._refresh = refresh
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def get(self, form_id: str, language: str | None = None) -> FormPayload | None:
+        cached = self._cached(form_id)
+        return cached.payloads.get(language) if cached else None
+
+    def get_languages(self, form_id: str) -> tuple[str, ...] | None:
+        cached = self._cached(form_id)
+        return cached.languages if cached and cached.languages else None
+
+    def set(
+        self,
+        form_id: str,
+        payload: FormPayload,
+        language: str | None = None,
+        languages: tuple[str, ...] = (),
+        generation: int | None = None,
+    ) -> None:
+        if generation is not None and generation != self.generation(form_id):
+            return
+        cached = self._forms.get(form_id)
+        if cached is None:
+            cached = self._forms[form_id] = _CachedForm()
+            if self._ttl_seconds is not None:
+                cached.expires_at = self._clock() + self._ttl_seconds
+        cached.payloads[language] = payload
+        if languages:
+            cached.languages = languages
+
+    def generation(self, form_id: str) -> int:
+        return max(self._generations.get(form_id, 0), self._cleared_generation)
+
+    def invalidate(self, form_id: str) -> None:
+        self._last_generation += 1
+        self._generations[form_id] = self._last_generation
+        self._forms.pop(form_id, None)
+
+    def clear(self) -> None:
+        self._last_generation += 1
+        self._cleared_generation = self._last_generation
+        self._generations.clear()
+        self._forms.clear()
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def _cached(self, form_id: str) -> _CachedForm | None:
+        if self._refresh is not None:
+            self._refresh()
+        cached = self._forms.get(form_id)
+        if cached is not None and cached.expires_at <= self._clock():
+            del self._forms[form_id]
+            return None
+        return cached
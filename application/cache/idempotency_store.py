@@ -0,0 +1,74 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from domain.exceptions import IdempotencyKeyConflictException
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Entry(Generic[T]):
+    fingerprint: str
+    result: "asyncio.Future[T]"
+    expires_at: float
+
+
+class IdempotencyStore(Generic[T]):
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 86_400,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[T]] = OrderedDict()
+
+    async def run(self, key: str, fingerprint: str, operation: Callable[[], Awaitable[T]]) -> T:
+        now = self._clock()
+        self._evict_expired(now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                msg = f"Idempotency key {key} was already used for a different request"
+                raise IdempotencyKeyConflictException(msg)
+            return await asyncio.shield(entry.result)
+
+        result: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._entries[key] = _Entry(fingerprint, result, now + self._ttl_seconds)
+        self._evict_overflow()
+        try:
+            value = await operation()
+        except Exception as e:
+            self._entries.pop(key, None)
+            result.set_exception(e)
+            result.exception()
+            raise
+        except BaseException:
+            self._entries.pop(key, None)
+            result.cancel()
+            raise
+        result.set_result(value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_expired(self, now: float) -> None:
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now:
+                return
+            del self._entries[key]
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,34 @@
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def run(self, key: Hashable, operation: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            self.leaders += 1
+            call = asyncio.ensure_future(operation())
+            self._calls[key] = call
+            call.add_done_callback(partial(self._forget, key))
+        else:
+            self.followers += 1
+        result: T = await asyncio.shield(call)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, call: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            call.exception()
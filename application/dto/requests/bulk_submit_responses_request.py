@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+from application.dto.requests.submit_response_request import SubmitResponseRequest
+
+MAX_BULK_ITEMS = 500
+
+
+class BulkSubmitResponsesRequest(BaseModel):
+    items: list[SubmitResponseRequest] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ResponseFilterRequest(BaseModel):
+    form_id: str | None = None
+    tags: dict[str, str] = Field(default_factory=dict)
+    since: datetime | None = None
+    until: datetime | None = None
@@ -0,0 +1,24 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+from application.dto.responses.response_response import ResponseResponse
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    FORM_NOT_FOUND = "form_not_found"
+    INVALID_ANSWER = "invalid_answer"
+
+
+class BulkSubmitItemResponse(BaseModel):
+    index: int
+    status: BulkItemStatus
+    response: ResponseResponse | None = None
+    error: str | None = None
+
+
+class BulkSubmitResponsesResponse(BaseModel):
+    results: list[BulkSubmitItemResponse]
+    created: int
+    failed: int
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class RatingStatsResponse(BaseModel):
+    count: int
+    mean: float | None = None
+    variance: float | None = None
+    std_dev: float | None = None
+    histogram: dict[int, int] = {}
+
+
+class QuestionStatsResponse(BaseModel):
+    question_id: str
+    type: str
+    answer_count: int
+    rating: RatingStatsResponse | None = None
+    option_counts: dict[str, int] | None = None
+
+
+class FormStatsResponse(BaseModel):
+    form_id: str
+    response_count: int
+    questions: list[QuestionStatsResponse] = []
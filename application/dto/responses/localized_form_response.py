@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class LocalizedOptionResponse(BaseModel):
+    value: str
+    label: str
+
+
+class LocalizedQuestionResponse(BaseModel):
+    id: str
+    type: str
+    text: str
+    required: bool
+    options: list[LocalizedOptionResponse] | None = None
+    min_rating: int | None = None
+    max_rating: int | None = None
+
+
+class LocalizedFormResponse(BaseModel):
+    id: str
+    type: str
+    language: str
+    name: str
+    description: str | None = None
+    questions: list[LocalizedQuestionResponse] = []
+    created_at: str | None = None
+    updated_at: str | None = None
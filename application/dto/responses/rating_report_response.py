@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+
+class TimeBucketResponse(BaseModel):
+    start: str
+    count: int
+    mean: float
+
+
+class SegmentResponse(BaseModel):
+    value: str
+    count: int
+    mean: float
+    nps: float | None = None
+
+
+class RatingQuestionReportResponse(BaseModel):
+    question_id: str
+    count: int
+    mean: float | None = None
+    percentiles: dict[str, float] = {}
+    nps: float | None = None
+    csat: float | None = None
+    time_buckets: list[TimeBucketResponse] = []
+    segments: list[SegmentResponse] | None = None
+
+
+class RatingReportResponse(BaseModel):
+    form_id: str
+    bucket: str
+    segment_by: str | None = None
+    questions: list[RatingQuestionReportResponse] = []
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from application.dto.responses.response_response import ResponseResponse
+
+
+class ResponsePageResponse(BaseModel):
+    items: list[ResponseResponse] = []
+    limit: int
+    next_cursor: str | None = None
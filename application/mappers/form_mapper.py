@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from application.dto.requests.create_form_request import CreateFormRequest
 from application.dto.requests.update_form_request import UpdateFormRequest
 from application.dto.responses.form_response import FormResponse
+from application.dto.responses.localized_form_response import LocalizedFormResponse
 from application.mappers.question_mapper import QuestionMapper
 from domain.entities.form import Form
 from domain.value_objects.form_id import FormId
@@ -15,7 +16,7 @@ class FormMapper:
     @staticmethod
     def to_domain(request: CreateFormRequest, form_id: str | None = None) -> Form:
         questions = [QuestionMapper.to_domain(q) for q in request.questions]
-        return Form(
+        form = Form(
             id=FormId(form_id or str(uuid.uuid4())),
             type=FormType(request.type),
             name=MultilingualText(request.name),
@@ -24,6 +25,8 @@ class FormMapper:
             created_at=datetime.now(tz=UTC),
             updated_at=datetime.now(tz=UTC),
         )
+        form.compile_validator()
+        return form
 
     @staticmethod
     def update_domain(form: Form, request: UpdateFormRequest) -> Form:
@@ -36,6 +39,7 @@ class FormMapper:
         if request.questions is not None:
             form.questions = [QuestionMapper.to_domain(q) for q in request.questions]
         form.updated_at = datetime.now(tz=UTC)
+        form.compile_validator()
         return form
 
     @staticmethod
@@ -49,3 +53,16 @@ class FormMapper:
             created_at=form.created_at.isoformat() if form.created_at else None,
             updated_at=form.updated_at.isoformat() if form.updated_at else None,
         )
+
+    @staticmethod
+    def to_localized_response(form: Form, language: str) -> LocalizedFormResponse:
+        return LocalizedFormResponse(
+            id=str(form.id),
+            type=form.type.value,
+            language=language,
+            name=form.name.get_text(language),
+            description=form.description.get_text(language) if form.description else None,
+            questions=[QuestionMapper.to_localized_response(q, language) for q in form.questions],
+            created_at=form.created_at.isoformat() if form.created_at else None,
+            updated_at=form.updated_at.isoformat() if form.updated_at else None,
+        )
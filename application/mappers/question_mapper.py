@@ -2,8 +2,12 @@ import uuid
 from datetime import UTC, datetime
 
 from application.dto.requests.create_question_request import CreateQuestionRequest
+from application.dto.responses.localized_form_response import (
+    LocalizedOptionResponse,
+    LocalizedQuestionResponse,
+)
 from application.dto.responses.question_response import QuestionResponse
-from domain.entities.question import Question
+from domain.entities.question import OPTION_VALUE_LANGUAGE, Question
 from domain.value_objects.multilingual_text import MultilingualText
 from domain.value_objects.question_id import QuestionId
 from domain.value_objects.question_type import QuestionType
@@ -45,3 +49,25 @@ class QuestionMapper:
             created_at=question.created_at.isoformat() if question.created_at else None,
             updated_at=question.updated_at.isoformat() if question.updated_at else None,
         )
+
+    @staticmethod
+    def to_localized_response(question: Question, language: str) -> LocalizedQuestionResponse:
+        options = None
+        if question.options:
+            options = [
+                LocalizedOptionResponse(
+                    value=opt.get_text(OPTION_VALUE_LANGUAGE),
+                    label=opt.get_text(language),
+                )
+                for opt in question.options
+            ]
+
+        return LocalizedQuestionResponse(
+            id=str(question.id),
+            type=question.type.value,
+            text=question.text.get_text(language),
+            required=question.required,
+            options=options,
+            min_rating=question.min_rating,
+            max_rating=question.max_rating,
+        )
@@ -1,3 +1,6 @@
+import base64
+import binascii
+import json
 import uuid
 from datetime import UTC, datetime
 
@@ -8,6 +11,7 @@ from domain.entities.answer import Answer
 from domain.entities.response import Response
 from domain.value_objects.form_id import FormId
 from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_cursor import ResponseCursor
 from domain.value_objects.response_id import ResponseId
 
 
@@ -47,3 +51,22 @@ class ResponseMapper:
             user_id=response.user_id,
             submitted_at=response.submitted_at.isoformat() if response.submitted_at else None,
         )
+
+    @staticmethod
+    def to_cursor_token(response: Response) -> str:
+        submitted_at = response.submitted_at.isoformat() if response.submitted_at else None
+        payload = json.dumps([submitted_at, str(response.id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def cursor_from_token(token: str) -> ResponseCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            submitted_at, response_id = json.loads(base64.urlsafe_b64decode(padded))
+            return ResponseCursor(
+                submitted_at=datetime.fromisoformat(submitted_at) if submitted_at else None,
+                response_id=response_id,
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            msg = "Invalid pagination cursor"
+            raise ValueError(msg) from e
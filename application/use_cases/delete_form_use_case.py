@@ -1,5 +1,6 @@
 import logging
 
+from application.cache.form_payload_cache import FormPayloadCache
 from domain.exceptions import FormNotFoundException
 from domain.repositories.form_repository import FormRepository
 from domain.value_objects.form_id import FormId
@@ -8,8 +9,13 @@ logger = logging.getLogger(__name__)
 
 
 class DeleteFormUseCase:
-    def __init__(self, form_repository: FormRepository) -> None:
+    def __init__(
+        self,
+        form_repository: FormRepository,
+        payload_cache: FormPayloadCache | None = None,
+    ) -> None:
         self._form_repository = form_repository
+        self._payload_cache = payload_cache if payload_cache is not None else FormPayloadCache()
 
     async def execute(self, form_id: str) -> None:
         logger.info("Deleting form", extra={"form_id": form_id})
@@ -19,4 +25,5 @@ class DeleteFormUseCase:
             msg = f"Form with id {form_id} not found"
             raise FormNotFoundException(msg)
         await self._form_repository.delete(FormId(form_id))
+        self._payload_cache.invalidate(form_id)
         logger.info("Form deleted successfully", extra={"form_id": form_id})
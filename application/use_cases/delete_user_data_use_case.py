@@ -1,17 +1,26 @@
 import logging
 
+from application.analytics.response_aggregator import ResponseAggregator
 from domain.repositories.response_repository import ResponseRepository
 
 logger = logging.getLogger(__name__)
 
 
 class DeleteUserDataUseCase:
-    def __init__(self, response_repository: ResponseRepository) -> None:
+    def __init__(
+        self,
+        response_repository: ResponseRepository,
+        aggregator: ResponseAggregator | None = None,
+    ) -> None:
         self._response_repository = response_repository
+        self._aggregator = aggregator if aggregator is not None else ResponseAggregator()
 
     async def execute(self, user_id: str) -> int:
         logger.info("Deleting user data", extra={"user_id": user_id})
-        deleted_count = await self._response_repository.delete_by_user_id(user_id)
+        deleted = await self._response_repository.delete_by_user_id(user_id)
+        for response in deleted:
+            self._aggregator.remove(response)
+        deleted_count = len(deleted)
         logger.info(
             "User data deleted successfully",
             extra={"user_id": user_id, "deleted_responses": deleted_count},
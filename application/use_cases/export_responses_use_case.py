@@ -0,0 +1,151 @@
+import csv
+import io
+import json
+import logging
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC
+from enum import Enum
+from itertools import repeat
+from typing import Any
+
+import numpy as np
+
+from application.mappers.response_mapper import ResponseMapper
+from domain.entities.form import Form
+from domain.exceptions import FormNotFoundException
+from domain.repositories.form_repository import FormRepository
+from domain.repositories.response_repository import ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.response_columns import MISSING_CODE, MISSING_INTEGER, ResponseColumns
+
+logger = logging.getLogger(__name__)
+
+CSV_FIXED_COLUMNS = ("response_id", "form_id", "user_id", "submitted_at", "tags")
+CSV_LIST_SEPARATOR = ";"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ExportResponsesUseCase:
+    def __init__(
+        self, form_repository: FormRepository, response_repository: ResponseRepository
+    ) -> None:
+        self._form_repository = form_repository
+        self._response_repository = response_repository
+
+    async def execute(
+        self, export_format: ExportFormat, form_id: str | None = None
+    ) -> AsyncIterator[str]:
+        logger.info(
+            "Exporting responses", extra={"form_id": form_id, "format": export_format.value}
+        )
+        if export_format == ExportFormat.NDJSON:
+            return self._stream_ndjson(form_id)
+        if not form_id:
+            msg = "CSV export requires a form_id"
+            raise ValueError(msg)
+        form = await self._form_repository.get_by_id(FormId(form_id))
+        if not form:
+            msg = f"Form {form_id} not found"
+            raise FormNotFoundException(msg)
+        return self._stream_csv(form)
+
+    async def _stream_ndjson(self, form_id: str | None) -> AsyncIterator[str]:
+        count = 0
+        async for page in self._response_repository.iter_pages(
+            form_id=FormId(form_id) if form_id else None
+        ):
+            count += len(page)
+            yield "".join(
+                ResponseMapper.to_response(response).model_dump_json() + "\n" for response in page
+            )
+        logger.info("Responses exported", extra={"form_id": form_id, "count": count})
+
+    async def _stream_csv(self, form: Form) -> AsyncIterator[str]:
+        question_ids = [str(question.id) for question in form.questions]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([*CSV_FIXED_COLUMNS, *question_ids])
+        yield self._drain(buffer)
+        count = 0
+        async for page in self._response_repository.iter_columns(form_id=form.id):
+            count += len(page)
+            writer.writerows(self._to_csv_rows(page, str(form.id), question_ids))
+            yield self._drain(buffer)
+        logger.info("Responses exported", extra={"form_id": str(form.id), "count": count})
+
+    @staticmethod
+    def _to_csv_rows(
+        columns: ResponseColumns, form_id: str, question_ids: list[str]
+    ) -> Iterator[tuple[Any, ...]]:
+        return zip(
+            columns.response_ids,
+            repeat(form_id, len(columns)),
+            [user_id or "" for user_id in columns.user_ids.decode()],
+            _timestamp_cells(columns),
+            _tag_cells(columns),
+            *(_answer_cells(columns, question_id) for question_id in question_ids),
+            strict=True,
+        )
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+
+def _timestamp_cells(columns: ResponseColumns) -> list[str]:
+    timestamps = np.asarray(columns.submitted_at, dtype=np.int64).astype("datetime64[us]")
+    return [
+        timestamp.replace(tzinfo=UTC).isoformat() if timestamp else ""
+        for timestamp in timestamps.tolist()
+    ]
+
+
+def _tag_cells(columns: ResponseColumns) -> list[str]:
+    if not columns.tags:
+        return [""] * len(columns)
+    keys = list(columns.tags)
+    values = [column.values for column in columns.tags.values()]
+    cells: dict[tuple[int, ...], str] = {}
+    result = []
+    for codes in zip(*(column.codes for column in columns.tags.values()), strict=True):
+        cell = cells.get(codes)
+        if cell is None:
+            tags = {
+                key: options[code]
+                for key, options, code in zip(keys, values, codes, strict=True)
+                if code != MISSING_CODE
+            }
+            cell = cells[codes] = json.dumps(tags, ensure_ascii=False) if tags else ""
+        result.append(cell)
+    return result
+
+
+def _answer_cells(columns: ResponseColumns, question_id: str) -> list[str | int]:
+    ratings = columns.ratings.get(question_id)
+    others = columns.answers.get(question_id)
+    if others is None:
+        if ratings is None:
+            return [""] * len(columns)
+        return [rating if rating != MISSING_INTEGER else "" for rating in ratings]
+    cells = [_format_csv_value(value) for value in others]
+    if ratings is None:
+        return cells
+    return [
+        rating if rating != MISSING_INTEGER else cell
+        for rating, cell in zip(ratings, cells, strict=True)
+    ]
+
+
+def _format_csv_value(value: str | int | list[str] | None) -> str | int:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    return value
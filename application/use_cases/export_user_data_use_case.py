@@ -1,27 +1,55 @@
+import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator
 
-from application.use_cases.get_user_data_use_case import GetUserDataUseCase
+from application.mappers.response_mapper import ResponseMapper
+from domain.entities.response import Response
+from domain.repositories.response_repository import ResponseRepository
 
 logger = logging.getLogger(__name__)
 
 
 class ExportUserDataUseCase:
-    def __init__(self, get_user_data_use_case: GetUserDataUseCase) -> None:
-        self._get_user_data_use_case = get_user_data_use_case
+    def __init__(self, response_repository: ResponseRepository) -> None:
+        self._response_repository = response_repository
 
-    async def execute(self, user_id: str) -> str:
+    async def execute(self, user_id: str) -> AsyncIterator[str]:
         logger.info("Exporting user data", extra={"user_id": user_id})
-        responses = await self._get_user_data_use_case.execute(user_id)
-        export_data = {
-            "user_id": user_id,
-            "exported_at": responses[0].submitted_at if responses else None,
-            "total_responses": len(responses),
-            "responses": [response.model_dump() for response in responses],
-        }
-        export_json = json.dumps(export_data, indent=2, ensure_ascii=False)
+        pages = aiter(self._response_repository.iter_pages(user_id=user_id))
+        first_page: list[Response] = await anext(pages, [])
+        return self._stream(user_id, first_page, pages)
+
+    async def _stream(
+        self, user_id: str, first_page: list[Response], pages: AsyncIterator[list[Response]]
+    ) -> AsyncIterator[str]:
+        yield f'{{"user_id": {json.dumps(user_id, ensure_ascii=False)}, "responses": ['
+        total_responses = 0
+        exported_at: str | None = None
+        page = first_page
+        try:
+            while page:
+                items = [ResponseMapper.to_response(response) for response in page]
+                if exported_at is None:
+                    exported_at = items[0].submitted_at
+                separator = ",\n" if total_responses else "\n"
+                yield separator + ",\n".join(
+                    json.dumps(item.model_dump(), ensure_ascii=False) for item in items
+                )
+                total_responses += len(items)
+                await asyncio.sleep(0)
+                page = await anext(pages, [])
+        except Exception:
+            logger.exception(
+                "User data export failed mid-stream",
+                extra={"user_id": user_id, "response_count": total_responses},
+            )
+            raise
+        yield (
+            f'\n], "exported_at": {json.dumps(exported_at)}, '
+            f'"total_responses": {total_responses}}}\n'
+        )
         logger.info(
             "User data exported successfully",
-            extra={"user_id": user_id, "response_count": len(responses)},
+            extra={"user_id": user_id, "response_count": total_responses},
         )
-        return export_json
@@ -0,0 +1,87 @@
+import logging
+import math
+
+from application.analytics.response_aggregator import (
+    FormAggregateStore,
+    QuestionAggregate,
+    ResponseAggregator,
+)
+from application.dto.responses.form_stats_response import (
+    FormStatsResponse,
+    QuestionStatsResponse,
+    RatingStatsResponse,
+)
+from domain.entities.question import OPTION_VALUE_LANGUAGE, Question
+from domain.exceptions import FormNotFoundException
+from domain.repositories.form_repository import FormRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_type import QuestionType
+
+logger = logging.getLogger(__name__)
+
+
+class GetFormStatsUseCase:
+    def __init__(
+        self,
+        form_repository: FormRepository,
+        aggregator: ResponseAggregator,
+        aggregate_store: FormAggregateStore | None = None,
+    ) -> None:
+        self._form_repository = form_repository
+        self._aggregator = aggregator
+        self._aggregate_store = aggregate_store
+
+    async def execute(self, form_id: str) -> FormStatsResponse:
+        logger.info("Getting form stats", extra={"form_id": form_id})
+        form = await self._form_repository.get_by_id(FormId(form_id))
+        if not form:
+            logger.warning("Form not found", extra={"form_id": form_id})
+            msg = f"Form with id {form_id} not found"
+            raise FormNotFoundException(msg)
+        aggregate = (
+            await self._aggregate_store.get(form_id)
+            if self._aggregate_store is not None
+            else self._aggregator.get(form_id)
+        )
+        empty = QuestionAggregate()
+        return FormStatsResponse(
+            form_id=form_id,
+            response_count=aggregate.response_count if aggregate else 0,
+            questions=[
+                self._to_question_stats(
+                    question,
+                    aggregate.questions.get(str(question.id), empty) if aggregate else empty,
+                )
+                for question in form.questions
+            ],
+        )
+
+    @staticmethod
+    def _to_question_stats(
+        question: Question, aggregate: QuestionAggregate
+    ) -> QuestionStatsResponse:
+        stats = QuestionStatsResponse(
+            question_id=str(question.id),
+            type=question.type.value,
+            answer_count=aggregate.answer_count,
+        )
+        if question.type == QuestionType.RATING:
+            variance = aggregate.rating_variance
+            histogram = dict.fromkeys(
+                range(question.min_rating or 0, (question.max_rating or 0) + 1), 0
+            )
+            histogram.update(aggregate.rating_histogram)
+            stats.rating = RatingStatsResponse(
+                count=aggregate.rating_count,
+                mean=aggregate.rating_mean,
+                variance=variance,
+                std_dev=math.sqrt(max(variance, 0.0)) if variance is not None else None,
+                histogram=histogram,
+            )
+        elif question.type == QuestionType.MULTIPLE_CHOICE:
+            option_counts = dict.fromkeys(
+                (option.get_text(OPTION_VALUE_LANGUAGE) for option in question.options or ()), 0
+            )
+            option_counts.update(aggregate.option_counts)
+            stats.option_counts = option_counts
+        return stats
@@ -1,23 +1,142 @@
 import logging
+from collections.abc import Callable
 
+from application.cache.form_payload_cache import (
+    FormPayload,
+    FormPayloadCache,
+    compute_form_etag,
+)
+from application.cache.single_flight import SingleFlight
 from application.dto.responses.form_response import FormResponse
 from application.mappers.form_mapper import FormMapper
+from domain.entities.form import Form
 from domain.exceptions import FormNotFoundException
 from domain.repositories.form_repository import FormRepository
 from domain.value_objects.form_id import FormId
+from domain.value_objects.multilingual_text import negotiate_language
 
 logger = logging.getLogger(__name__)
 
 
 class GetFormUseCase:
-    def __init__(self, form_repository: FormRepository) -> None:
+    def __init__(
+        self,
+        form_repository: FormRepository,
+        payload_cache: FormPayloadCache | None = None,
+        single_flight: SingleFlight | None = None,
+    ) -> None:
         self._form_repository = form_repository
+        self._payload_cache = payload_cache if payload_cache is not None else FormPayloadCache()
+        self._single_flight = single_flight if single_flight is not None else SingleFlight()
 
     async def execute(self, form_id: str) -> FormResponse:
+        return await self._single_flight.run(
+            ("response", form_id), lambda: self._load_response(form_id)
+        )
+
+    async def execute_serialized(
+        self, form_id: str, is_current: Callable[[str], bool] | None = None
+    ) -> FormPayload:
+        payload = self._payload_cache.get(form_id)
+        if payload is not None:
+            return payload
+        if is_current is not None:
+            generation = self._payload_cache.generation(form_id)
+            form = await self._single_flight.run(("form", form_id), lambda: self._get_form(form_id))
+            etag = _version_etag(form_id, form)
+            if etag is not None and is_current(etag):
+                return FormPayload(body=b"", etag=etag)
+            return await self._single_flight.run(
+                ("payload", form_id), lambda: self._build_payload(form_id, form, generation)
+            )
+        return await self._single_flight.run(
+            ("payload", form_id), lambda: self._load_payload(form_id)
+        )
+
+    async def execute_localized(
+        self,
+        form_id: str,
+        preferred_languages: list[str],
+        is_current: Callable[[str], bool] | None = None,
+    ) -> FormPayload:
+        languages = self._payload_cache.get_languages(form_id)
+        if languages is not None:
+            payload = self._payload_cache.get(
+                form_id, negotiate_language(preferred_languages, languages)
+            )
+            if payload is not None:
+                return payload
+        key = ("localized", form_id, tuple(preferred_languages))
+        if is_current is not None:
+            generation = self._payload_cache.generation(form_id)
+            form = await self._single_flight.run(("form", form_id), lambda: self._get_form(form_id))
+            language = form.name.negotiate_language(preferred_languages)
+            etag = _version_etag(form_id, form, language)
+            if etag is not None and is_current(etag):
+                return FormPayload(body=b"", etag=etag)
+            return await self._single_flight.run(
+                key, lambda: self._build_localized_payload(form_id, form, language, generation)
+            )
+        return await self._single_flight.run(
+            key, lambda: self._load_localized_payload(form_id, preferred_languages)
+        )
+
+    async def _load_response(self, form_id: str) -> FormResponse:
         logger.info("Getting form", extra={"form_id": form_id})
+        form = await self._get_form(form_id)
+        return FormMapper.to_response(form)
+
+    async def _load_payload(self, form_id: str) -> FormPayload:
+        logger.info("Getting form", extra={"form_id": form_id})
+        generation = self._payload_cache.generation(form_id)
+        form = await self._get_form(form_id)
+        return await self._build_payload(form_id, form, generation)
+
+    async def _build_payload(self, form_id: str, form: Form, generation: int) -> FormPayload:
+        body = FormMapper.to_response(form).model_dump_json().encode()
+        payload = FormPayload(body=body, etag=compute_form_etag(form_id, form.updated_at, body))
+        self._payload_cache.set(form_id, payload, generation=generation)
+        return payload
+
+    async def _load_localized_payload(
+        self, form_id: str, preferred_languages: list[str]
+    ) -> FormPayload:
+        logger.info(
+            "Getting localized form",
+            extra={"form_id": form_id, "languages": preferred_languages},
+        )
+        generation = self._payload_cache.generation(form_id)
+        form = await self._get_form(form_id)
+        language = form.name.negotiate_language(preferred_languages)
+        return await self._build_localized_payload(form_id, form, language, generation)
+
+    async def _build_localized_payload(
+        self, form_id: str, form: Form, language: str, generation: int
+    ) -> FormPayload:
+        body = FormMapper.to_localized_response(form, language).model_dump_json().encode()
+        payload = FormPayload(
+            body=body,
+            etag=compute_form_etag(form_id, form.updated_at, body, language),
+        )
+        self._payload_cache.set(
+            form_id,
+            payload,
+            language=language,
+            languages=tuple(form.name.get_available_languages()),
+            generation=generation,
+        )
+        return payload
+
+    async def _get_form(self, form_id: str) -> Form:
         form = await self._form_repository.get_by_id(FormId(form_id))
         if not form:
             logger.warning("Form not found", extra={"form_id": form_id})
             msg = f"Form with id {form_id} not found"
             raise FormNotFoundException(msg)
-        return FormMapper.to_response(form)
+        return form
+
+
+def _version_etag(form_id: str, form: Form, language: str | None = None) -> str | None:
+    if form.updated_at is None:
+        return None
+    return compute_form_etag(form_id, form.updated_at, b"", language)
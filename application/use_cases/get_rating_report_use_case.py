@@ -0,0 +1,109 @@
+import logging
+from datetime import UTC, datetime
+from enum import Enum
+
+from application.analytics.rating_columns import RatingColumnBuilder, RatingColumns
+from application.analytics.rating_statistics import (
+    csat,
+    net_promoter_score,
+    percentiles,
+    segment_breakdown,
+    time_bucket_means,
+)
+from application.dto.responses.rating_report_response import (
+    RatingQuestionReportResponse,
+    RatingReportResponse,
+    SegmentResponse,
+    TimeBucketResponse,
+)
+from domain.exceptions import FormNotFoundException
+from domain.repositories.form_repository import FormRepository
+from domain.repositories.response_repository import ResponseRepository
+from domain.value_objects.form_id import FormId
+
+logger = logging.getLogger(__name__)
+
+
+class ReportBucket(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+
+BUCKET_SECONDS = {
+    ReportBucket.HOUR: 3600,
+    ReportBucket.DAY: 86400,
+    ReportBucket.WEEK: 7 * 86400,
+}
+
+
+class GetRatingReportUseCase:
+    def __init__(
+        self, form_repository: FormRepository, response_repository: ResponseRepository
+    ) -> None:
+        self._form_repository = form_repository
+        self._response_repository = response_repository
+
+    async def execute(
+        self,
+        form_id: str,
+        bucket: ReportBucket = ReportBucket.DAY,
+        segment_by: str | None = None,
+    ) -> RatingReportResponse:
+        logger.info("Building rating report", extra={"form_id": form_id})
+        form = await self._form_repository.get_by_id(FormId(form_id))
+        if not form:
+            logger.warning("Form not found", extra={"form_id": form_id})
+            msg = f"Form with id {form_id} not found"
+            raise FormNotFoundException(msg)
+        builder = RatingColumnBuilder(form)
+        async for page in self._response_repository.iter_columns(form_id=form.id):
+            builder.add_columns(page)
+        columns = builder.build()
+        logger.info("Rating columns extracted", extra={"form_id": form_id, "rows": len(columns)})
+        return RatingReportResponse(
+            form_id=form_id,
+            bucket=bucket.value,
+            segment_by=segment_by,
+            questions=[
+                self._question_report(columns, index, BUCKET_SECONDS[bucket], segment_by)
+                for index in range(len(columns.scales))
+            ],
+        )
+
+    @staticmethod
+    def _question_report(
+        columns: RatingColumns, index: int, bucket_seconds: int, segment_by: str | None
+    ) -> RatingQuestionReportResponse:
+        scale = columns.scales[index]
+        mask = columns.for_question(index)
+        ratings = columns.rating[mask]
+        report = RatingQuestionReportResponse(
+            question_id=scale.question_id,
+            count=len(ratings),
+            mean=float(ratings.mean()) if len(ratings) else None,
+            percentiles={f"p{q}": v for q, v in percentiles(ratings).items()},
+            nps=net_promoter_score(ratings, scale),
+            csat=csat(ratings, scale),
+            time_buckets=[
+                TimeBucketResponse(
+                    start=datetime.fromtimestamp(b.start, tz=UTC).isoformat(),
+                    count=b.count,
+                    mean=b.mean,
+                )
+                for b in time_bucket_means(columns.submitted_at[mask], ratings, bucket_seconds)
+            ],
+        )
+        if segment_by is not None:
+            codes = columns.tag_codes.get(segment_by)
+            report.segments = (
+                [
+                    SegmentResponse(value=s.value, count=s.count, mean=s.mean, nps=s.nps)
+                    for s in segment_breakdown(
+                        codes[mask], columns.tag_values[segment_by], ratings, scale
+                    )
+                ]
+                if codes is not None
+                else []
+            )
+        return report
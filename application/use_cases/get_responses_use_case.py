@@ -1,7 +1,10 @@
 import logging
 
+from application.dto.requests.response_filter_request import ResponseFilterRequest
+from application.dto.responses.response_page_response import ResponsePageResponse
 from application.dto.responses.response_response import ResponseResponse
 from application.mappers.response_mapper import ResponseMapper
+from domain.exceptions import InvalidCursorException
 from domain.repositories.response_repository import ResponseRepository
 from domain.value_objects.form_id import FormId
 
@@ -12,11 +15,50 @@ class GetResponsesUseCase:
     def __init__(self, response_repository: ResponseRepository) -> None:
         self._response_repository = response_repository
 
-    async def execute(self, form_id: str | None = None) -> list[ResponseResponse]:
-        logger.info("Getting responses", extra={"form_id": form_id})
-        if form_id:
-            responses = await self._response_repository.get_by_form_id(FormId(form_id))
+    async def execute(self, filters: ResponseFilterRequest | None = None) -> list[ResponseResponse]:
+        filters = filters or ResponseFilterRequest()
+        logger.info("Getting responses", extra={"form_id": filters.form_id, "tags": filters.tags})
+        if filters.tags or filters.since or filters.until:
+            responses = await self._response_repository.query(
+                form_id=FormId(filters.form_id) if filters.form_id else None,
+                tags=filters.tags or None,
+                since=filters.since,
+                until=filters.until,
+            )
+        elif filters.form_id:
+            responses = await self._response_repository.get_by_form_id(FormId(filters.form_id))
         else:
             responses = await self._response_repository.get_all()
         logger.info("Responses retrieved", extra={"count": len(responses)})
         return [ResponseMapper.to_response(response) for response in responses]
+
+    async def execute_page(
+        self,
+        limit: int,
+        filters: ResponseFilterRequest | None = None,
+        cursor: str | None = None,
+    ) -> ResponsePageResponse:
+        filters = filters or ResponseFilterRequest()
+        try:
+            after = ResponseMapper.cursor_from_token(cursor) if cursor else None
+        except ValueError as e:
+            raise InvalidCursorException(str(e)) from e
+        responses = await self._response_repository.query(
+            form_id=FormId(filters.form_id) if filters.form_id else None,
+            tags=filters.tags or None,
+            since=filters.since,
+            until=filters.until,
+            after=after,
+            limit=limit + 1,
+        )
+        page = responses[:limit]
+        has_more = len(responses) > limit
+        logger.info(
+            "Response page retrieved",
+            extra={"form_id": filters.form_id, "count": len(page), "has_more": has_more},
+        )
+        return ResponsePageResponse(
+            items=[ResponseMapper.to_response(response) for response in page],
+            limit=limit,
+            next_cursor=ResponseMapper.to_cursor_token(page[-1]) if has_more else None,
+        )
@@ -1,8 +1,18 @@
+import hashlib
 import logging
 
+from application.analytics.response_aggregator import ResponseAggregator
+from application.cache.idempotency_store import IdempotencyStore
 from application.dto.requests.submit_response_request import SubmitResponseRequest
+from application.dto.responses.bulk_submit_responses_response import (
+    BulkItemStatus,
+    BulkSubmitItemResponse,
+    BulkSubmitResponsesResponse,
+)
 from application.dto.responses.response_response import ResponseResponse
 from application.mappers.response_mapper import ResponseMapper
+from domain.entities.form import Form
+from domain.entities.response import Response
 from domain.exceptions import FormNotFoundException, InvalidAnswerException
 from domain.repositories.form_repository import FormRepository
 from domain.repositories.response_repository import ResponseRepository
@@ -16,11 +26,29 @@ class SubmitResponseUseCase:
         self,
         form_repository: FormRepository,
         response_repository: ResponseRepository,
+        aggregator: ResponseAggregator | None = None,
+        idempotency_store: IdempotencyStore[ResponseResponse] | None = None,
     ) -> None:
         self._form_repository = form_repository
         self._response_repository = response_repository
+        self._aggregator = aggregator if aggregator is not None else ResponseAggregator()
+        self._idempotency_store = (
+            idempotency_store if idempotency_store is not None else IdempotencyStore()
+        )
+
+    async def execute(
+        self, request: SubmitResponseRequest, idempotency_key: str | None = None
+    ) -> ResponseResponse:
+        if idempotency_key is None:
+            return await self._submit(request)
+        fingerprint = hashlib.blake2b(
+            request.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
+        return await self._idempotency_store.run(
+            idempotency_key, fingerprint, lambda: self._submit(request)
+        )
 
-    async def execute(self, request: SubmitResponseRequest) -> ResponseResponse:
+    async def _submit(self, request: SubmitResponseRequest) -> ResponseResponse:
         logger.info("Submitting response", extra={"form_id": request.form_id})
         form = await self._form_repository.get_by_id(FormId(request.form_id))
         if not form:
@@ -29,28 +57,90 @@ class SubmitResponseUseCase:
             raise FormNotFoundException(msg)
 
         response = ResponseMapper.to_domain(request)
+        self._validate_answers(form, response)
+
+        created_response = await self._response_repository.create(response)
+        self._aggregator.add(created_response)
+        logger.info(
+            "Response submitted successfully", extra={"response_id": str(created_response.id)}
+        )
+        return ResponseMapper.to_response(created_response)
+
+    async def execute_many(
+        self, requests: list[SubmitResponseRequest]
+    ) -> BulkSubmitResponsesResponse:
+        logger.info("Submitting responses in bulk", extra={"count": len(requests)})
+        forms: dict[str, Form | None] = {}
+        for form_id in dict.fromkeys(request.form_id for request in requests):
+            forms[form_id] = await self._form_repository.get_by_id(FormId(form_id))
+
+        results: list[BulkSubmitItemResponse | None] = [None] * len(requests)
+        accepted: list[tuple[int, Response]] = []
+        for index, request in enumerate(requests):
+            form = forms[request.form_id]
+            if form is None:
+                results[index] = BulkSubmitItemResponse(
+                    index=index,
+                    status=BulkItemStatus.FORM_NOT_FOUND,
+                    error=f"Form with id {request.form_id} not found",
+                )
+                continue
+            try:
+                response = ResponseMapper.to_domain(request)
+                self._validate_answers(form, response)
+            except (InvalidAnswerException, ValueError) as e:
+                results[index] = BulkSubmitItemResponse(
+                    index=index, status=BulkItemStatus.INVALID_ANSWER, error=str(e)
+                )
+                continue
+            accepted.append((index, response))
 
+        if accepted:
+            created = await self._response_repository.create_many(
+                [response for _, response in accepted]
+            )
+            self._aggregator.add_many(created)
+            for (index, _), created_response in zip(accepted, created, strict=True):
+                results[index] = BulkSubmitItemResponse(
+                    index=index,
+                    status=BulkItemStatus.CREATED,
+                    response=ResponseMapper.to_response(created_response),
+                )
+
+        items = [result for result in results if result is not None]
+        logger.info(
+            "Bulk responses submitted",
+            extra={"created_count": len(accepted), "failed_count": len(items) - len(accepted)},
+        )
+        return BulkSubmitResponsesResponse(
+            results=items, created=len(accepted), failed=len(items) - len(accepted)
+        )
+
+    @staticmethod
+    def _validate_answers(form: Form, response: Response) -> None:
+        form_id = str(form.id)
+        validator = form.get_validator()
         for answer in response.answers:
-            question = form.get_question(str(answer.question_id))
+            question = validator.get(answer.question_id.value)
             if not question:
                 logger.warning(
                     "Question not found in form",
-                    extra={"form_id": request.form_id, "question_id": str(answer.question_id)},
+                    extra={"form_id": form_id, "question_id": str(answer.question_id)},
                 )
-                msg = f"Question {answer.question_id} not found in form {request.form_id}"
+                msg = f"Question {answer.question_id} not found in form {form_id}"
                 raise InvalidAnswerException(msg)
             if question.required:
                 if isinstance(answer.value, str) and not answer.value.strip():
                     logger.warning(
                         "Required question not answered",
-                        extra={"form_id": request.form_id, "question_id": str(answer.question_id)},
+                        extra={"form_id": form_id, "question_id": str(answer.question_id)},
                     )
                     msg = f"Question {answer.question_id} is required but not answered"
                     raise InvalidAnswerException(msg)
                 if isinstance(answer.value, list) and len(answer.value) == 0:
                     logger.warning(
                         "Required question not answered",
-                        extra={"form_id": request.form_id, "question_id": str(answer.question_id)},
+                        extra={"form_id": form_id, "question_id": str(answer.question_id)},
                     )
                     msg = f"Question {answer.question_id} is required but not answered"
                     raise InvalidAnswerException(msg)
@@ -58,16 +148,10 @@ class SubmitResponseUseCase:
                 logger.warning(
                     "Invalid answer value",
                     extra={
-                        "form_id": request.form_id,
+                        "form_id": form_id,
                         "question_id": str(answer.question_id),
                         "question_type": question.type.value,
                     },
                 )
                 msg = f"Invalid answer value for question {answer.question_id}"
                 raise InvalidAnswerException(msg)
-
-        created_response = await self._response_repository.create(response)
-        logger.info(
-            "Response submitted successfully", extra={"response_id": str(created_response.id)}
-        )
-        return ResponseMapper.to_response(created_response)
@@ -1,5 +1,6 @@
 import logging
 
+from application.cache.form_payload_cache import FormPayloadCache
 from application.dto.requests.update_form_request import UpdateFormRequest
 from application.dto.responses.form_response import FormResponse
 from application.mappers.form_mapper import FormMapper
@@ -11,8 +12,13 @@ logger = logging.getLogger(__name__)
 
 
 class UpdateFormUseCase:
-    def __init__(self, form_repository: FormRepository) -> None:
+    def __init__(
+        self,
+        form_repository: FormRepository,
+        payload_cache: FormPayloadCache | None = None,
+    ) -> None:
         self._form_repository = form_repository
+        self._payload_cache = payload_cache if payload_cache is not None else FormPayloadCache()
 
     async def execute(self, form_id: str, request: UpdateFormRequest) -> FormResponse:
         logger.info("Updating form", extra={"form_id": form_id})
@@ -23,5 +29,6 @@ class UpdateFormUseCase:
             raise FormNotFoundException(msg)
         updated_form = FormMapper.update_domain(form, request)
         saved_form = await self._form_repository.update(updated_form)
+        self._payload_cache.invalidate(form_id)
         logger.info("Form updated successfully", extra={"form_id": str(saved_form.id)})
         return FormMapper.to_response(saved_form)
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+import infrastructure.config.dependencies as deps
+from application.dto.requests.bulk_submit_responses_request import MAX_BULK_ITEMS
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.repositories.form_repository import FormRepository
+from domain.repositories.response_repository import ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from infrastructure.persistence import (
+    MockFormRepository,
+    MockResponseRepository,
+    SQLiteDatabase,
+    SQLiteFormRepository,
+    SQLiteResponseRepository,
+)
+from presentation.api.main import app
+
+DEFAULT_RESPONSE_COUNT = 10_000
+FORM_COUNT = 5
+SUBMIT_URL = "/api/v1/mobile/responses"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _form(index: int) -> Form:
+    return Form(
+        id=FormId(f"form-{index}"),
+        type=FormType.SURVEY,
+        name=MultilingualText({"en": "Survey"}),
+        questions=[
+            Question(
+                id=QuestionId("q-rating"),
+                type=QuestionType.RATING,
+                text=MultilingualText({"en": "Rate"}),
+                required=True,
+                min_rating=1,
+                max_rating=5,
+            ),
+            Question(
+                id=QuestionId("q-comment"),
+                type=QuestionType.TEXT,
+                text=MultilingualText({"en": "Comment"}),
+                required=False,
+            ),
+        ],
+    )
+
+
+def _payload(index: int) -> dict[str, object]:
+    return {
+        "form_id": f"form-{index % FORM_COUNT}",
+        "answers": [
+            {"question_id": "q-rating", "value": index % 5 + 1},
+            {"question_id": "q-comment", "value": "Synced from offline queue"},
+        ],
+        "tags": {"source": "offline"},
+        "user_id": f"user-{index}",
+    }
+
+
+def _submit_one_by_one(client: TestClient, bodies: list[bytes]) -> None:
+    for body in bodies:
+        client.post(SUBMIT_URL, content=body, headers=JSON_HEADERS).raise_for_status()
+
+
+def _submit_in_bulk(client: TestClient, bodies: list[bytes]) -> None:
+    for body in bodies:
+        client.post(f"{SUBMIT_URL}/bulk", content=body, headers=JSON_HEADERS).raise_for_status()
+
+
+async def _timed(
+    repositories: Callable[[], tuple[FormRepository, ResponseRepository]],
+    submit: Callable[[TestClient, list[bytes]], None],
+    bodies: list[bytes],
+) -> float:
+    deps.reset_dependencies()
+    deps._form_repository, deps._response_repository = repositories()
+    for i in range(FORM_COUNT):
+        await deps._form_repository.create(_form(i))
+    with TestClient(app) as client:
+        started = time.perf_counter()
+        submit(client, bodies)
+        return time.perf_counter() - started
+
+
+async def _compare(
+    label: str,
+    repositories: Callable[[], tuple[FormRepository, ResponseRepository]],
+    response_count: int,
+) -> None:
+    singles = [json.dumps(_payload(i)).encode() for i in range(response_count)]
+    batches = [
+        json.dumps(
+            {
+                "items": [
+                    _payload(i) for i in range(start, min(start + MAX_BULK_ITEMS, response_count))
+                ]
+            }
+        ).encode()
+        for start in range(0, response_count, MAX_BULK_ITEMS)
+    ]
+    single_elapsed = await _timed(repositories, _submit_one_by_one, singles)
+    bulk_elapsed = await _timed(repositories, _submit_in_bulk, batches)
+    print(f"{label} one-by-one: {response_count / single_elapsed:12,.0f} responses/s")  # noqa: T201
+    print(f"{label} bulk:       {response_count / bulk_elapsed:12,.0f} responses/s")  # noqa: T201
+    print(f"{label} speedup:    {single_elapsed / bulk_elapsed:12,.1f}x")  # noqa: T201
+
+
+async def main(response_count: int) -> None:
+    print(f"responses: {response_count:,} (batches of {MAX_BULK_ITEMS})")  # noqa: T201
+    await _compare(
+        "memory", lambda: (MockFormRepository(), MockResponseRepository()), response_count
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        databases: list[SQLiteDatabase] = []
+
+        def sqlite_repositories() -> tuple[FormRepository, ResponseRepository]:
+            database = SQLiteDatabase(str(Path(directory) / f"bench-{len(databases)}.db"))
+            databases.append(database)
+            return SQLiteFormRepository(database), SQLiteResponseRepository(database)
+
+        try:
+            await _compare("sqlite", sqlite_repositories, response_count)
+        finally:
+            for database in databases:
+                database.close()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSE_COUNT
+    asyncio.run(main(count))
@@ -0,0 +1,125 @@
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+from application.use_cases.export_responses_use_case import ExportFormat, ExportResponsesUseCase
+from application.use_cases.get_rating_report_use_case import GetRatingReportUseCase
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.entities.response import Response
+from domain.repositories.response_repository import ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.columnar_response_repository import ColumnarResponseRepository
+from infrastructure.persistence.mock_form_repository import MockFormRepository
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+DEFAULT_RESPONSE_COUNT = 200_000
+FORM_ID = "form-analytics"
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+OPTIONS = ("price", "speed", "support", "design")
+COMMENTS = ("Great service", "Too slow at checkout", "Would recommend to friends")
+
+
+def _form() -> Form:
+    return Form(
+        id=FormId(FORM_ID),
+        type=FormType.SURVEY,
+        name=MultilingualText({"en": "Analytics"}),
+        questions=[
+            Question(
+                id=QuestionId("q-nps"),
+                type=QuestionType.RATING,
+                text=MultilingualText({"en": "Recommend?"}),
+                required=True,
+                min_rating=0,
+                max_rating=10,
+            ),
+            Question(
+                id=QuestionId("q-csat"),
+                type=QuestionType.RATING,
+                text=MultilingualText({"en": "Satisfied?"}),
+                required=True,
+                min_rating=1,
+                max_rating=5,
+            ),
+            Question(
+                id=QuestionId("q-topics"),
+                type=QuestionType.MULTIPLE_CHOICE,
+                text=MultilingualText({"en": "Topics"}),
+                required=False,
+                options=[MultilingualText({"en": option}) for option in OPTIONS],
+            ),
+            Question(
+                id=QuestionId("q-comment"),
+                type=QuestionType.TEXT,
+                text=MultilingualText({"en": "Comment"}),
+                required=False,
+            ),
+        ],
+    )
+
+
+def _response(i: int) -> Response:
+    return Response(
+        id=ResponseId(f"response-{i}"),
+        form_id=FormId(FORM_ID),
+        answers=[
+            Answer(question_id=QuestionId("q-nps"), value=i % 11),
+            Answer(question_id=QuestionId("q-csat"), value=i % 5 + 1),
+            Answer(
+                question_id=QuestionId("q-topics"), value=[OPTIONS[i % 4], OPTIONS[(i + 1) % 4]]
+            ),
+            Answer(question_id=QuestionId("q-comment"), value=COMMENTS[i % 3]),
+        ],
+        tags={"campaign": f"campaign-{i % 20}", "source": f"source-{i % 3}"},
+        user_id=f"user-{i % 50_000}",
+        submitted_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+async def _measure(label: str, repository: ResponseRepository, response_count: int) -> None:
+    forms = MockFormRepository()
+    await forms.create(_form())
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for i in range(response_count):
+        await repository.create(_response(i))
+    gc.collect()
+    stored, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    await GetRatingReportUseCase(forms, repository).execute(FORM_ID, segment_by="campaign")
+    report_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    chunks = await ExportResponsesUseCase(forms, repository).execute(ExportFormat.CSV, FORM_ID)
+    exported = sum([len(chunk) async for chunk in chunks])
+    export_elapsed = time.perf_counter() - started
+
+    print(  # noqa: T201
+        f"{label:<9} {(stored - baseline) / response_count:8,.0f} B/response"
+        f"  rating report {report_elapsed * 1000:9.1f} ms"
+        f"  csv export {export_elapsed * 1000:9.1f} ms ({exported / 2**20:.1f} MiB)"
+    )
+
+
+async def main(response_count: int) -> None:
+    print(f"responses: {response_count:,}")  # noqa: T201
+    await _measure("memory", MockResponseRepository(), response_count)
+    await _measure("columnar", ColumnarResponseRepository(), response_count)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSE_COUNT
+    asyncio.run(main(count))
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.journal import Journal
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+DEFAULT_RESPONSE_COUNT = 50_000
+FSYNC_EVERY_WRITE_COUNT = 2_000
+FORM_COUNT = 100
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _response(i: int) -> Response:
+    return Response(
+        id=ResponseId(f"response-{i}"),
+        form_id=FormId(f"form-{i % FORM_COUNT}"),
+        answers=[
+            Answer(question_id=QuestionId("q-rating"), value=i % 5 + 1),
+            Answer(question_id=QuestionId("q-comment"), value=f"comment {i}"),
+        ],
+        tags={"campaign": f"campaign-{i % 50}"},
+        user_id=f"user-{i % 20_000}",
+        submitted_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+async def _write(journal: Journal | None, count: int) -> float:
+    repository = MockResponseRepository(journal)
+    started = perf_counter()
+    for i in range(count):
+        await repository.create(_response(i))
+    elapsed = perf_counter() - started
+    if journal is not None:
+        await journal.wait_for_snapshot()
+        journal.close()
+    return elapsed / count * 1e6
+
+
+def _recover(directory: Path) -> float:
+    started = perf_counter()
+    journal = Journal(directory, "responses")
+    MockResponseRepository(journal)
+    elapsed = perf_counter() - started
+    journal.close()
+    return elapsed
+
+
+async def main(response_count: int) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        base = Path(root)
+        unjournaled = await _write(None, response_count)
+        batched = await _write(
+            Journal(base / "batched", "responses", snapshot_every=response_count + 1),
+            response_count,
+        )
+        every_write = await _write(
+            Journal(base / "sync", "responses", fsync_interval_seconds=0),
+            FSYNC_EVERY_WRITE_COUNT,
+        )
+        await _write(
+            Journal(base / "snapshot", "responses", snapshot_every=response_count - 100),
+            response_count,
+        )
+        log_only = _recover(base / "batched")
+        snapshot_and_tail = _recover(base / "snapshot")
+
+    print(f"responses:                      {response_count:,}")  # noqa: T201
+    print(f"create, no journal:             {unjournaled:8.1f} µs")  # noqa: T201
+    print(f"create, fsync batched (1 s):    {batched:8.1f} µs")  # noqa: T201
+    print(f"create, fsync every write:      {every_write:8.1f} µs")  # noqa: T201
+    print(f"recovery from log:              {log_only * 1000:8.1f} ms")  # noqa: T201
+    print(f"recovery from snapshot + tail:  {snapshot_and_tail * 1000:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSE_COUNT
+    asyncio.run(main(count))
@@ -0,0 +1,50 @@
+import sys
+import time
+
+import numpy as np
+
+from application.analytics.rating_columns import RatingScale
+from application.analytics.rating_statistics import net_promoter_score
+from domain.entities.answer import Answer
+from domain.value_objects.question_id import QuestionId
+
+DEFAULT_RATING_COUNT = 5_000_000
+SCALE = RatingScale("q-nps", 0, 10)
+
+
+def _python_nps(answers: list[Answer]) -> float:
+    promoters = detractors = 0
+    for answer in answers:
+        value = answer.value
+        if not isinstance(value, int):
+            continue
+        if value >= 9:  # noqa: PLR2004
+            promoters += 1
+        elif value <= 6:  # noqa: PLR2004
+            detractors += 1
+    return 100 * (promoters - detractors) / len(answers)
+
+
+def main(rating_count: int) -> None:
+    generator = np.random.default_rng(42)
+    ratings = generator.integers(0, 11, size=rating_count, dtype=np.int16)
+    question_id = QuestionId("q-nps")
+    answers = [Answer(question_id=question_id, value=int(r)) for r in ratings]
+    print(f"ratings: {rating_count:,}")  # noqa: T201
+
+    started = time.perf_counter()
+    loop_score = _python_nps(answers)
+    loop_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vector_score = net_promoter_score(ratings, SCALE)
+    vector_elapsed = time.perf_counter() - started
+
+    print(f"python loop over Answer  {loop_elapsed * 1000:10.2f} ms  nps={loop_score:.2f}")  # noqa: T201
+    print(f"numpy over rating column {vector_elapsed * 1000:10.2f} ms  nps={vector_score:.2f}")  # noqa: T201
+    print(f"speedup: {loop_elapsed / vector_elapsed:,.0f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RATING_COUNT
+    main(count)
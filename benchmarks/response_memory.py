@@ -0,0 +1,60 @@
+import asyncio
+import gc
+import sys
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+DEFAULT_RESPONSE_COUNT = 200_000
+FORM_COUNT = 100
+USER_COUNT = 20_000
+CAMPAIGN_COUNT = 50
+CHOICES = ("Low", "Medium", "High")
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _response(i: int) -> Response:
+    # Every id and tag is built per request, as it would be when parsed from a JSON body.
+    return Response(
+        id=ResponseId(f"response-{i}"),
+        form_id=FormId(f"form-{i % FORM_COUNT}"),
+        answers=[
+            Answer(question_id=QuestionId(f"q-rating-{i % FORM_COUNT}"), value=i % 5 + 1),
+            Answer(question_id=QuestionId(f"q-choice-{i % FORM_COUNT}"), value=CHOICES[i % 3]),
+            Answer(
+                question_id=QuestionId(f"q-multi-{i % FORM_COUNT}"),
+                value=[f"option-{i % 4}", f"option-{(i + 1) % 4}"],
+            ),
+        ],
+        tags={"campaign": f"campaign-{i % CAMPAIGN_COUNT}", "source": f"source-{i % 3}"},
+        user_id=f"user-{i % USER_COUNT}",
+        submitted_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+async def main(response_count: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    repository = MockResponseRepository()
+    for i in range(response_count):
+        await repository.create(_response(i))
+    gc.collect()
+    stored, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_response = (stored - baseline) / response_count
+    print(f"responses stored: {response_count:,}")  # noqa: T201
+    print(f"retained memory:  {(stored - baseline) / 2**20:,.1f} MiB")  # noqa: T201
+    print(f"peak memory:      {(peak - baseline) / 2**20:,.1f} MiB")  # noqa: T201
+    print(f"bytes/response:   {per_response:,.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSE_COUNT
+    asyncio.run(main(count))
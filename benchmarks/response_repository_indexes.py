@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+DEFAULT_RESPONSE_COUNT = 1_000_000
+FORM_COUNT = 1_000
+USER_COUNT = 100_000
+CAMPAIGN_COUNT = 10_000
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+WINDOW = timedelta(hours=1)
+SCAN_LOOKUPS = 10
+INDEX_LOOKUPS = 1_000
+
+
+async def _timed(label: str, lookup: Callable[[int], Awaitable[object]], lookups: int) -> float:
+    started = time.perf_counter()
+    for i in range(lookups):
+        await lookup(i)
+    elapsed = (time.perf_counter() - started) / lookups
+    print(f"{label:<26} {elapsed * 1000:10.4f} ms/lookup")  # noqa: T201
+    return elapsed
+
+
+async def main(response_count: int) -> None:
+    repository = MockResponseRepository()
+    question_id = QuestionId("q-1")
+    for i in range(response_count):
+        await repository.create(
+            Response(
+                id=ResponseId(f"response-{i}"),
+                form_id=FormId(f"form-{i % FORM_COUNT}"),
+                answers=[Answer(question_id=question_id, value=i % 5 + 1)],
+                user_id=f"user-{i % USER_COUNT}",
+                tags={"campaign": f"campaign-{i % CAMPAIGN_COUNT}", "source": f"source-{i % 3}"},
+                submitted_at=BASE_TIME + timedelta(seconds=i),
+            )
+        )
+    print(f"responses stored: {response_count:,}")  # noqa: T201
+
+    async def scan_by_form(i: int) -> list[Response]:
+        form_id = f"form-{i}"
+        return [
+            r.to_response() for r in repository._responses.values() if str(r.form_id) == form_id
+        ]
+
+    async def scan_by_user(i: int) -> list[Response]:
+        user_id = f"user-{i}"
+        return [r.to_response() for r in repository._responses.values() if r.user_id == user_id]
+
+    async def index_by_form(i: int) -> list[Response]:
+        return await repository.get_by_form_id(FormId(f"form-{i % FORM_COUNT}"))
+
+    async def index_by_user(i: int) -> list[Response]:
+        return await repository.get_by_user_id(f"user-{i}")
+
+    async def scan_by_campaign(i: int) -> list[Response]:
+        campaign = f"campaign-{i}"
+        return [
+            r.to_response()
+            for r in repository._responses.values()
+            if r.tags.get("campaign") == campaign
+        ]
+
+    async def index_by_campaign(i: int) -> list[Response]:
+        tags = {"campaign": f"campaign-{i % CAMPAIGN_COUNT}", "source": f"source-{i % 3}"}
+        return await repository.query(tags=tags)
+
+    async def scan_by_window(i: int) -> list[Response]:
+        since = BASE_TIME + timedelta(seconds=i * 7)
+        until = since + WINDOW
+        return [
+            r.to_response()
+            for r in repository._responses.values()
+            if r.submitted_at and since <= r.submitted_at < until
+        ]
+
+    async def index_by_window(i: int) -> list[Response]:
+        since = BASE_TIME + timedelta(seconds=i * 7 % response_count)
+        return await repository.query(since=since, until=since + WINDOW)
+
+    scan_form = await _timed("get_by_form_id (scan)", scan_by_form, SCAN_LOOKUPS)
+    index_form = await _timed("get_by_form_id (index)", index_by_form, INDEX_LOOKUPS)
+    scan_user = await _timed("get_by_user_id (scan)", scan_by_user, SCAN_LOOKUPS)
+    index_user = await _timed("get_by_user_id (index)", index_by_user, INDEX_LOOKUPS)
+    scan_campaign = await _timed("query by tags (scan)", scan_by_campaign, SCAN_LOOKUPS)
+    index_campaign = await _timed("query by tags (index)", index_by_campaign, INDEX_LOOKUPS)
+    scan_window = await _timed("query 1h window (scan)", scan_by_window, SCAN_LOOKUPS)
+    index_window = await _timed("query 1h window (index)", index_by_window, INDEX_LOOKUPS)
+    print(f"speedup by form: {scan_form / index_form:,.0f}x")  # noqa: T201
+    print(f"speedup by user: {scan_user / index_user:,.0f}x")  # noqa: T201
+    print(f"speedup by tags: {scan_campaign / index_campaign:,.0f}x")  # noqa: T201
+    print(f"speedup by window: {scan_window / index_window:,.0f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSE_COUNT
+    asyncio.run(main(count))
@@ -0,0 +1,60 @@
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from application.analytics.response_aggregator import ResponseAggregator
+from benchmarks.response_memory import _response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.binary_snapshot import BinarySnapshot, write_snapshot
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+from infrastructure.persistence.snapshot_response_repository import SnapshotResponseRepository
+
+DEFAULT_RESPONSE_COUNT = 200_000
+PAGE_SIZE = 50
+
+
+async def main(response_count: int) -> None:
+    responses = [_response(i) for i in range(response_count)]
+
+    started = perf_counter()
+    repository = MockResponseRepository()
+    await repository.create_many(responses)
+    aggregator = ResponseAggregator()
+    await aggregator.rebuild(repository)
+    rebuild = perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as root:
+        path = Path(root) / "state.snapshot"
+        started = perf_counter()
+        write_snapshot(path, [], responses, aggregator.aggregates())
+        written = perf_counter() - started
+
+        started = perf_counter()
+        snapshot = BinarySnapshot(path)
+        mapped = SnapshotResponseRepository(snapshot)
+        ResponseAggregator().restore(snapshot.aggregates())
+        warm = perf_counter() - started
+
+        started = perf_counter()
+        page = await mapped.query(form_id=FormId("form-7"), limit=PAGE_SIZE)
+        first_page = perf_counter() - started
+        started = perf_counter()
+        await mapped.get_by_id(ResponseId(f"response-{response_count // 2}"))
+        lookup = perf_counter() - started
+        size = path.stat().st_size
+
+    assert len(page) == PAGE_SIZE
+    print(f"responses:                    {response_count:,}")  # noqa: T201
+    print(f"rebuild objects + indexes:    {rebuild * 1000:9.1f} ms")  # noqa: T201
+    print(f"write snapshot:               {written * 1000:9.1f} ms ({size / 2**20:.1f} MiB)")  # noqa: T201
+    print(f"map snapshot (warm start):    {warm * 1000:9.1f} ms")  # noqa: T201
+    print(f"first form page ({PAGE_SIZE} rows):    {first_page * 1000:9.1f} ms")  # noqa: T201
+    print(f"get_by_id:                    {lookup * 1000:9.3f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSE_COUNT
+    asyncio.run(main(count))
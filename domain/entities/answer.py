@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from domain.value_objects.question_id import QuestionId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Answer:
     question_id: QuestionId
     value: str | int | list[str]
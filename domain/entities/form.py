@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from domain.entities.form_validator import FormValidator
 from domain.entities.question import Question
 from domain.value_objects.form_id import FormId
 from domain.value_objects.form_type import FormType
@@ -16,18 +17,36 @@ class Form:
     questions: list[Question] = field(default_factory=list)
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    _validator: FormValidator | None = field(default=None, init=False, repr=False, compare=False)
+    _validated_questions: list[Question] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_question(self, question: Question) -> None:
-        if question.id in [q.id for q in self.questions]:
+        if self.get_question(str(question.id)) is not None:
             msg = f"Question with id {question.id} already exists in form"
             raise ValueError(msg)
         self.questions.append(question)
+        self.invalidate_validator()
 
     def remove_question(self, question_id: str) -> None:
         self.questions = [q for q in self.questions if str(q.id) != question_id]
+        self.invalidate_validator()
 
     def get_question(self, question_id: str) -> Question | None:
-        for question in self.questions:
-            if str(question.id) == question_id:
-                return question
-        return None
+        compiled = self.get_validator().get(question_id)
+        return compiled.question if compiled else None
+
+    def compile_validator(self) -> FormValidator:
+        self._validator = FormValidator(self.questions)
+        self._validated_questions = self.questions
+        return self._validator
+
+    def get_validator(self) -> FormValidator:
+        if self._validator is None or self._validated_questions is not self.questions:
+            return self.compile_validator()
+        return self._validator
+
+    def invalidate_validator(self) -> None:
+        self._validator = None
+        self._validated_questions = None
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from domain.entities.question import Question
+from domain.value_objects.question_type import QuestionType
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledQuestion:
+    question: Question
+    type: QuestionType
+    required: bool
+    allowed_options: frozenset[str]
+    min_rating: int | None
+    max_rating: int | None
+
+    @classmethod
+    def from_question(cls, question: Question) -> "CompiledQuestion":
+        return cls(
+            question=question,
+            type=question.type,
+            required=question.required,
+            allowed_options=question.get_option_values(),
+            min_rating=question.min_rating,
+            max_rating=question.max_rating,
+        )
+
+    def validate_answer(self, answer_value: str | int | list[str]) -> bool:  # noqa: PLR0911
+        if self.type is QuestionType.TEXT:
+            return isinstance(answer_value, str) and len(answer_value.strip()) > 0
+        if self.type is QuestionType.RATING:
+            if not isinstance(answer_value, int):
+                return False
+            if self.min_rating is None or self.max_rating is None:
+                return False
+            return self.min_rating <= answer_value <= self.max_rating
+        if self.type is QuestionType.MULTIPLE_CHOICE:
+            if not isinstance(answer_value, list) or not self.allowed_options:
+                return False
+            return self.allowed_options.issuperset(answer_value)
+        return False
+
+
+class FormValidator:
+    __slots__ = ("_questions",)
+
+    def __init__(self, questions: list[Question]) -> None:
+        self._questions = {q.id.value: CompiledQuestion.from_question(q) for q in questions}
+
+    def get(self, question_id: str) -> CompiledQuestion | None:
+        return self._questions.get(question_id)
+
+    def __len__(self) -> int:
+        return len(self._questions)
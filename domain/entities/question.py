@@ -6,6 +6,7 @@ from domain.value_objects.question_id import QuestionId
 from domain.value_objects.question_type import QuestionType
 
 MIN_MULTIPLE_CHOICE_OPTIONS = 2
+OPTION_VALUE_LANGUAGE = "en"
 
 
 @dataclass
@@ -38,6 +39,11 @@ class Question:
             msg = "Text questions should not have options or rating constraints"
             raise ValueError(msg)
 
+    def get_option_values(self) -> frozenset[str]:
+        if not self.options:
+            return frozenset()
+        return frozenset(opt.get_text(OPTION_VALUE_LANGUAGE) for opt in self.options)
+
     def validate_answer(self, answer_value: str | int | list[str]) -> bool:  # noqa: PLR0911
         if self.type == QuestionType.TEXT:
             return isinstance(answer_value, str) and len(answer_value.strip()) > 0
@@ -52,6 +58,5 @@ class Question:
                 return False
             if not self.options:
                 return False
-            available_options = [opt.get_text("en") for opt in self.options]
-            return all(opt in available_options for opt in answer_value)
+            return self.get_option_values().issuperset(answer_value)
         return False
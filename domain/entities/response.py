@@ -6,7 +6,7 @@ from domain.value_objects.form_id import FormId
 from domain.value_objects.response_id import ResponseId
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     id: ResponseId
     form_id: FormId
@@ -20,3 +20,11 @@ class InvalidAnswerException(DomainException):
 
 class DuplicateQuestionException(DomainException):
     pass
+
+
+class InvalidCursorException(DomainException):
+    pass
+
+
+class IdempotencyKeyConflictException(DomainException):
+    pass
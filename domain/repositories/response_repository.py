@@ -1,15 +1,25 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
 from domain.entities.response import Response
 from domain.value_objects.form_id import FormId
+from domain.value_objects.response_columns import ResponseColumns
+from domain.value_objects.response_cursor import ResponseCursor
 from domain.value_objects.response_id import ResponseId
 
+DEFAULT_PAGE_SIZE = 500
+
 
 class ResponseRepository(ABC):
     @abstractmethod
     async def create(self, response: Response) -> Response:
         pass
 
+    @abstractmethod
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, response_id: ResponseId) -> Response | None:
         pass
@@ -27,5 +37,53 @@ class ResponseRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete_by_user_id(self, user_id: str) -> int:
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        pass
+
+    @abstractmethod
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        pass
+
+    async def iter_pages(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[list[Response]]:
+        after: ResponseCursor | None = None
+        while True:
+            page = await self.query(
+                form_id=form_id,
+                user_id=user_id,
+                tags=tags,
+                since=since,
+                until=until,
+                after=after,
+                limit=page_size,
+            )
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            last = page[-1]
+            after = ResponseCursor(submitted_at=last.submitted_at, response_id=str(last.id))
+
+    @abstractmethod
+    def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
         pass
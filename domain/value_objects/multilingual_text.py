@@ -1,6 +1,19 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 
+def negotiate_language(preferred: Sequence[str], available: Sequence[str]) -> str:
+    available_by_code = {code.lower(): code for code in available}
+    for tag in preferred:
+        normalized = tag.lower()
+        if normalized in available_by_code:
+            return available_by_code[normalized]
+        primary = normalized.split("-", 1)[0]
+        if primary in available_by_code:
+            return available_by_code[primary]
+    return available[0]
+
+
 @dataclass(frozen=True)
 class MultilingualText:
     translations: dict[str, str]
@@ -25,5 +38,8 @@ class MultilingualText:
     def get_available_languages(self) -> list[str]:
         return list(self.translations.keys())
 
+    def negotiate_language(self, preferred: Sequence[str]) -> str:
+        return negotiate_language(preferred, self.get_available_languages())
+
     def __str__(self) -> str:
         return next(iter(self.translations.values())) if self.translations else ""
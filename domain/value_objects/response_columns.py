@@ -0,0 +1,32 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+MISSING_CODE = -1
+MISSING_INTEGER = -(2**63)
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedColumn:
+    codes: Sequence[int]
+    values: Sequence[str]
+
+    def get(self, row: int) -> str | None:
+        code = self.codes[row]
+        return self.values[code] if code != MISSING_CODE else None
+
+    def decode(self) -> list[str | None]:
+        values = self.values
+        return [values[code] if code != MISSING_CODE else None for code in self.codes]
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseColumns:
+    response_ids: Sequence[str]
+    submitted_at: Sequence[int]
+    user_ids: EncodedColumn
+    tags: Mapping[str, EncodedColumn] = field(default_factory=dict)
+    ratings: Mapping[str, Sequence[int]] = field(default_factory=dict)
+    answers: Mapping[str, Sequence[str | list[str] | None]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.response_ids)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ResponseCursor:
+    submitted_at: datetime | None
+    response_id: str
+
+    def __post_init__(self) -> None:
+        if not self.response_id or not isinstance(self.response_id, str):
+            msg = "ResponseCursor response_id must be a non-empty string"
+            raise ValueError(msg)
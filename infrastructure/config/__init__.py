@@ -1,17 +1,32 @@
 from infrastructure.config.dependencies import (
+    close_dependencies,
     get_create_form_use_case,
     get_delete_form_use_case,
     get_delete_user_data_use_case,
+    get_export_responses_use_case,
     get_export_user_data_use_case,
+    get_form_catalog,
+    get_form_load_flight,
+    get_form_payload_cache,
     get_form_repository,
+    get_get_form_stats_use_case,
     get_get_form_use_case,
+    get_get_rating_report_use_case,
     get_get_responses_use_case,
     get_get_user_data_use_case,
+    get_idempotency_store,
     get_list_forms_use_case,
+    get_response_aggregator,
     get_response_repository,
+    get_service_metrics,
+    get_snapshot,
     get_submit_response_use_case,
     get_update_form_use_case,
     reset_dependencies,
+    response_aggregator_enabled,
+    seeding_enabled,
+    shutdown_dependencies,
+    snapshot_enabled,
 )
 from infrastructure.config.settings import Settings, get_settings
 
@@ -20,6 +35,7 @@ __all__ = [
     "get_settings",
     "get_form_repository",
     "get_response_repository",
+    "get_form_payload_cache",
     "get_create_form_use_case",
     "get_get_form_use_case",
     "get_list_forms_use_case",
@@ -31,4 +47,18 @@ __all__ = [
     "get_delete_user_data_use_case",
     "get_export_user_data_use_case",
     "reset_dependencies",
+    "close_dependencies",
+    "get_export_responses_use_case",
+    "get_response_aggregator",
+    "get_get_form_stats_use_case",
+    "get_get_rating_report_use_case",
+    "get_idempotency_store",
+    "get_form_catalog",
+    "get_form_load_flight",
+    "get_service_metrics",
+    "get_snapshot",
+    "response_aggregator_enabled",
+    "seeding_enabled",
+    "snapshot_enabled",
+    "shutdown_dependencies",
 ]
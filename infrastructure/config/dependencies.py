@@ -1,8 +1,21 @@
+import asyncio
+from functools import partial
+from pathlib import Path
+from typing import TypeVar
+
+from application.analytics.response_aggregator import FormAggregateStore, ResponseAggregator
+from application.cache.form_payload_cache import FormPayloadCache
+from application.cache.idempotency_store import IdempotencyStore
+from application.cache.single_flight import SingleFlight
+from application.dto.responses.response_response import ResponseResponse
 from application.use_cases.create_form_use_case import CreateFormUseCase
 from application.use_cases.delete_form_use_case import DeleteFormUseCase
 from application.use_cases.delete_user_data_use_case import DeleteUserDataUseCase
+from application.use_cases.export_responses_use_case import ExportResponsesUseCase
 from application.use_cases.export_user_data_use_case import ExportUserDataUseCase
+from application.use_cases.get_form_stats_use_case import GetFormStatsUseCase
 from application.use_cases.get_form_use_case import GetFormUseCase
+from application.use_cases.get_rating_report_use_case import GetRatingReportUseCase
 from application.use_cases.get_responses_use_case import GetResponsesUseCase
 from application.use_cases.get_user_data_use_case import GetUserDataUseCase
 from application.use_cases.list_forms_use_case import ListFormsUseCase
@@ -10,67 +23,349 @@ from application.use_cases.submit_response_use_case import SubmitResponseUseCase
 from application.use_cases.update_form_use_case import UpdateFormUseCase
 from domain.repositories.form_repository import FormRepository
 from domain.repositories.response_repository import ResponseRepository
-from infrastructure.persistence import MockFormRepository, MockResponseRepository
+from infrastructure.config.settings import PersistenceBackend, get_settings
+from infrastructure.metrics import (
+    InstrumentedFormRepository,
+    InstrumentedResponseRepository,
+    ServiceMetrics,
+    UseCaseInstrumentation,
+)
+from infrastructure.persistence import (
+    BatchingResponseRepository,
+    BinarySnapshot,
+    CachingFormRepository,
+    ColumnarResponseRepository,
+    Journal,
+    MockFormRepository,
+    MockResponseRepository,
+    SharedFormCatalog,
+    SharedFormRepository,
+    SnapshotResponseRepository,
+    SQLiteDatabase,
+    SQLiteFormAggregateStore,
+    SQLiteFormRepository,
+    SQLiteResponseRepository,
+)
+
+T = TypeVar("T")
 
+_sqlite_database: SQLiteDatabase | None = None
 _form_repository: FormRepository | None = None
 _response_repository: ResponseRepository | None = None
+_response_write_batcher: BatchingResponseRepository | None = None
+_form_aggregate_store: FormAggregateStore | None = None
+_journals: list[Journal] = []
+_snapshot: BinarySnapshot | None = None
+_form_catalog: SharedFormCatalog | None = None
+_form_payload_cache: FormPayloadCache | None = None
+_response_aggregator: ResponseAggregator | None = None
+_idempotency_store: IdempotencyStore[ResponseResponse] | None = None
+_form_load_flight: SingleFlight | None = None
+_service_metrics: ServiceMetrics | None = None
+_use_case_instrumentation: UseCaseInstrumentation | None = None
+
+
+def get_sqlite_database() -> SQLiteDatabase:
+    global _sqlite_database  # noqa: PLW0603
+    if _sqlite_database is None:
+        _sqlite_database = SQLiteDatabase(get_settings().sqlite_path)
+    return _sqlite_database
+
+
+def get_service_metrics() -> ServiceMetrics:
+    global _service_metrics  # noqa: PLW0603
+    if _service_metrics is None:
+        _service_metrics = ServiceMetrics()
+    return _service_metrics
+
+
+def _instrumented(use_case: T) -> T:
+    global _use_case_instrumentation  # noqa: PLW0603
+    if not get_settings().metrics_enabled:
+        return use_case
+    if _use_case_instrumentation is None:
+        _use_case_instrumentation = UseCaseInstrumentation(get_service_metrics().use_case_duration)
+    return _use_case_instrumentation.wrap(use_case)
+
+
+def get_form_catalog() -> SharedFormCatalog:
+    global _form_catalog  # noqa: PLW0603
+    if _form_catalog is None:
+        _form_catalog = SharedFormCatalog(get_settings().form_catalog_path)
+    return _form_catalog
 
 
 def get_form_repository() -> FormRepository:
     global _form_repository  # noqa: PLW0603
     if _form_repository is None:
-        _form_repository = MockFormRepository()
+        settings = get_settings()
+        metrics = get_service_metrics()
+        repository: FormRepository
+        if settings.persistence_backend == PersistenceBackend.SQLITE:
+            repository = SQLiteFormRepository(get_sqlite_database())
+            if settings.form_cache_enabled:
+                cache = CachingFormRepository(
+                    repository,
+                    max_entries=settings.form_cache_max_entries,
+                    ttl_seconds=settings.form_cache_ttl_seconds,
+                )
+                metrics.form_cache_entries.bind(partial(len, cache))
+                metrics.form_cache_hits.bind(lambda: cache.hits)
+                metrics.form_cache_misses.bind(lambda: cache.misses)
+                metrics.form_cache_evictions.bind(lambda: cache.evictions)
+                repository = cache
+        elif settings.form_catalog_shared:
+            repository = SharedFormRepository(get_form_catalog())
+            metrics.forms_stored.bind(partial(len, repository))
+        else:
+            snapshot = get_snapshot()
+            repository = MockFormRepository(
+                _journal("forms"), snapshot.forms() if snapshot is not None else ()
+            )
+            metrics.forms_stored.bind(partial(len, repository))
+        if settings.metrics_enabled:
+            repository = InstrumentedFormRepository(repository, metrics.repository_duration)
+        _form_repository = repository
     return _form_repository
 
 
 def get_response_repository() -> ResponseRepository:
-    global _response_repository  # noqa: PLW0603
+    global _response_repository, _response_write_batcher, _form_aggregate_store  # noqa: PLW0603
     if _response_repository is None:
-        _response_repository = MockResponseRepository()
+        settings = get_settings()
+        metrics = get_service_metrics()
+        repository: ResponseRepository
+        if settings.persistence_backend == PersistenceBackend.SQLITE:
+            repository = SQLiteResponseRepository(get_sqlite_database())
+            _form_aggregate_store = SQLiteFormAggregateStore(get_sqlite_database())
+        elif settings.persistence_backend == PersistenceBackend.COLUMNAR:
+            repository = ColumnarResponseRepository()
+            metrics.responses_stored.bind(partial(len, repository))
+        else:
+            snapshot = get_snapshot()
+            if snapshot is not None:
+                repository = SnapshotResponseRepository(snapshot)
+            else:
+                repository = MockResponseRepository(_journal("responses"))
+            metrics.responses_stored.bind(partial(len, repository))
+        if settings.response_write_batching:
+            repository = _response_write_batcher = BatchingResponseRepository(
+                repository,
+                max_batch_size=settings.response_write_batch_size,
+                max_delay_seconds=settings.response_write_batch_delay_ms / 1000,
+            )
+        if settings.metrics_enabled:
+            repository = InstrumentedResponseRepository(repository, metrics.repository_duration)
+        _response_repository = repository
     return _response_repository
 
 
+def get_form_aggregate_store() -> FormAggregateStore | None:
+    get_response_repository()
+    return _form_aggregate_store
+
+
+def response_aggregator_enabled() -> bool:
+    return get_settings().persistence_backend != PersistenceBackend.SQLITE
+
+
+def seeding_enabled() -> bool:
+    settings = get_settings()
+    return (
+        settings.persistence_backend != PersistenceBackend.SQLITE
+        and not settings.journal_enabled
+        and not settings.form_catalog_shared
+    )
+
+
+def snapshot_enabled() -> bool:
+    settings = get_settings()
+    return (
+        settings.snapshot_path is not None
+        and settings.persistence_backend == PersistenceBackend.MEMORY
+        and not settings.journal_enabled
+    )
+
+
+def get_snapshot() -> BinarySnapshot | None:
+    global _snapshot  # noqa: PLW0603
+    if _snapshot is None and snapshot_enabled():
+        path = Path(get_settings().snapshot_path or "")
+        if path.exists():
+            _snapshot = BinarySnapshot(path)
+    return _snapshot
+
+
+def _journal(name: str) -> Journal | None:
+    settings = get_settings()
+    if not settings.journal_enabled:
+        return None
+    journal = Journal(
+        settings.journal_directory,
+        name,
+        fsync_interval_seconds=settings.journal_fsync_interval_ms / 1000,
+        snapshot_every=settings.journal_snapshot_every,
+    )
+    _journals.append(journal)
+    return journal
+
+
+def get_form_payload_cache() -> FormPayloadCache:
+    global _form_payload_cache  # noqa: PLW0603
+    if _form_payload_cache is None:
+        settings = get_settings()
+        if (
+            settings.form_catalog_shared
+            and settings.persistence_backend != PersistenceBackend.SQLITE
+        ):
+            catalog = get_form_catalog()
+            _form_payload_cache = FormPayloadCache(refresh=catalog.refresh)
+            catalog.subscribe(_form_payload_cache.invalidate)
+        elif settings.persistence_backend == PersistenceBackend.SQLITE:
+            _form_payload_cache = FormPayloadCache(ttl_seconds=settings.form_cache_ttl_seconds)
+        else:
+            _form_payload_cache = FormPayloadCache()
+        get_service_metrics().form_payload_cache_forms.bind(partial(len, _form_payload_cache))
+    return _form_payload_cache
+
+
+def get_response_aggregator() -> ResponseAggregator:
+    global _response_aggregator  # noqa: PLW0603
+    if _response_aggregator is None:
+        _response_aggregator = ResponseAggregator()
+        get_service_metrics().aggregated_forms.bind(partial(len, _response_aggregator))
+    return _response_aggregator
+
+
+def get_idempotency_store() -> IdempotencyStore[ResponseResponse]:
+    global _idempotency_store  # noqa: PLW0603
+    if _idempotency_store is None:
+        settings = get_settings()
+        _idempotency_store = IdempotencyStore(
+            max_entries=settings.idempotency_max_keys,
+            ttl_seconds=settings.idempotency_ttl_seconds,
+        )
+        get_service_metrics().idempotency_keys.bind(partial(len, _idempotency_store))
+    return _idempotency_store
+
+
+def get_form_load_flight() -> SingleFlight:
+    global _form_load_flight  # noqa: PLW0603
+    if _form_load_flight is None:
+        flight = SingleFlight()
+        metrics = get_service_metrics()
+        metrics.form_loads.bind(lambda: flight.leaders)
+        metrics.form_loads_coalesced.bind(lambda: flight.followers)
+        _form_load_flight = flight
+    return _form_load_flight
+
+
 def get_create_form_use_case() -> CreateFormUseCase:
-    return CreateFormUseCase(get_form_repository())
+    return _instrumented(CreateFormUseCase(get_form_repository()))
 
 
 def get_get_form_use_case() -> GetFormUseCase:
-    return GetFormUseCase(get_form_repository())
+    return _instrumented(
+        GetFormUseCase(get_form_repository(), get_form_payload_cache(), get_form_load_flight())
+    )
 
 
 def get_list_forms_use_case() -> ListFormsUseCase:
-    return ListFormsUseCase(get_form_repository())
+    return _instrumented(ListFormsUseCase(get_form_repository()))
 
 
 def get_update_form_use_case() -> UpdateFormUseCase:
-    return UpdateFormUseCase(get_form_repository())
+    return _instrumented(UpdateFormUseCase(get_form_repository(), get_form_payload_cache()))
 
 
 def get_delete_form_use_case() -> DeleteFormUseCase:
-    return DeleteFormUseCase(get_form_repository())
+    return _instrumented(DeleteFormUseCase(get_form_repository(), get_form_payload_cache()))
 
 
 def get_submit_response_use_case() -> SubmitResponseUseCase:
-    return SubmitResponseUseCase(get_form_repository(), get_response_repository())
+    return _instrumented(
+        SubmitResponseUseCase(
+            get_form_repository(),
+            get_response_repository(),
+            get_response_aggregator(),
+            get_idempotency_store(),
+        )
+    )
 
 
 def get_get_responses_use_case() -> GetResponsesUseCase:
-    return GetResponsesUseCase(get_response_repository())
+    return _instrumented(GetResponsesUseCase(get_response_repository()))
+
+
+def get_export_responses_use_case() -> ExportResponsesUseCase:
+    return _instrumented(ExportResponsesUseCase(get_form_repository(), get_response_repository()))
+
+
+def get_get_form_stats_use_case() -> GetFormStatsUseCase:
+    return _instrumented(
+        GetFormStatsUseCase(
+            get_form_repository(),
+            get_response_aggregator(),
+            get_form_aggregate_store(),
+        )
+    )
+
+
+def get_get_rating_report_use_case() -> GetRatingReportUseCase:
+    return _instrumented(GetRatingReportUseCase(get_form_repository(), get_response_repository()))
 
 
 def get_get_user_data_use_case() -> GetUserDataUseCase:
-    return GetUserDataUseCase(get_response_repository())
+    return _instrumented(GetUserDataUseCase(get_response_repository()))
 
 
 def get_delete_user_data_use_case() -> DeleteUserDataUseCase:
-    return DeleteUserDataUseCase(get_response_repository())
+    return _instrumented(
+        DeleteUserDataUseCase(get_response_repository(), get_response_aggregator())
+    )
 
 
 def get_export_user_data_use_case() -> ExportUserDataUseCase:
-    return ExportUserDataUseCase(get_get_user_data_use_case())
+    return _instrumented(ExportUserDataUseCase(get_response_repository()))
 
 
-def reset_dependencies() -> None:
-    global _form_repository, _response_repository  # noqa: PLW0603
+async def shutdown_dependencies() -> None:
+    if _response_write_batcher is not None:
+        await _response_write_batcher.flush()
+    await asyncio.gather(
+        *(journal.wait_for_snapshot() for journal in _journals), return_exceptions=True
+    )
+    close_dependencies()
+
+
+def close_dependencies() -> None:
+    global _sqlite_database, _form_catalog, _response_write_batcher, _snapshot  # noqa: PLW0603
+    global _form_repository, _response_repository, _form_payload_cache  # noqa: PLW0603
+    global _form_aggregate_store  # noqa: PLW0603
+    if _service_metrics is not None:
+        _service_metrics.unbind_sources()
     _form_repository = None
     _response_repository = None
+    _response_write_batcher = None
+    _form_aggregate_store = None
+    _form_payload_cache = None
+    if _sqlite_database is not None:
+        _sqlite_database.close()
+    _sqlite_database = None
+    if _form_catalog is not None:
+        _form_catalog.close()
+    _form_catalog = None
+    if _snapshot is not None:
+        _snapshot.close()
+    _snapshot = None
+    for journal in _journals:
+        journal.close()
+    _journals.clear()
+
+
+def reset_dependencies() -> None:
+    global _response_aggregator, _idempotency_store, _form_load_flight  # noqa: PLW0603
+    close_dependencies()
+    _response_aggregator = None
+    _idempotency_store = None
+    _form_load_flight = None
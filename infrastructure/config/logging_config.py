@@ -0,0 +1,137 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TextIO
+
+_RESERVED_ATTRIBUTES = frozenset(vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        log_data: dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRIBUTES and key not in log_data:
+                log_data[key] = value
+        return json.dumps(log_data, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(
+        self, rates: dict[str, float], random_value: Callable[[], float] = random.random
+    ) -> None:
+        super().__init__()
+        self._rates = rates
+        self._random = random_value
+        self._resolved: dict[str, float | None] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate(record.name)
+        return rate is None or self._random() < rate
+
+    def _rate(self, name: str) -> float | None:
+        if name in self._resolved:
+            return self._resolved[name]
+        rate = None
+        candidate = name
+        while candidate:
+            if candidate in self._rates:
+                rate = self._rates[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+        self._resolved[name] = rate
+        return rate
+
+
+class DroppingQueueHandler(QueueHandler):
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingPipeline:
+    def __init__(self, handler: DroppingQueueHandler, listener: QueueListener) -> None:
+        self.handler = handler
+        self._listener = listener
+        self._running = False
+
+    def start(self) -> None:
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        if self._running:
+            self._listener.stop()
+            self._running = False
+
+
+_pipeline: LoggingPipeline | None = None
+
+
+def configure_logging(
+    level: str = "INFO",
+    sampling: dict[str, float] | None = None,
+    queue_size: int = 10_000,
+    stream: TextIO | None = None,
+) -> LoggingPipeline:
+    global _pipeline  # noqa: PLW0603
+    writer = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    writer.setFormatter(JSONFormatter())
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    handler = DroppingQueueHandler(log_queue)
+    if sampling:
+        handler.addFilter(SamplingFilter(sampling))
+    pipeline = LoggingPipeline(handler, QueueListener(log_queue, writer))
+
+    root = logging.getLogger()
+    if _pipeline is not None:
+        root.removeHandler(_pipeline.handler)
+        _pipeline.stop()
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    pipeline.start()
+    _pipeline = pipeline
+    return pipeline
+
+
+def shutdown_logging() -> None:
+    if _pipeline is not None:
+        _pipeline.stop()
+
+
+atexit.register(shutdown_logging)
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Annotated
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -10,6 +11,12 @@ class Environment(str, Enum):
     TESTING = "testing"
 
 
+class PersistenceBackend(str, Enum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    COLUMNAR = "columnar"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -31,6 +38,35 @@ class Settings(BaseSettings):
     backoffice_password: str = Field(default="admin")
 
     log_level: str = Field(default="INFO")
+    log_sampling: dict[str, Annotated[float, Field(ge=0, le=1)]] = Field(default_factory=dict)
+    log_queue_size: int = Field(default=10_000, ge=1)
+
+    persistence_backend: PersistenceBackend = Field(default=PersistenceBackend.MEMORY)
+    sqlite_path: str = Field(default="feedback.db")
+
+    journal_enabled: bool = Field(default=False)
+    journal_directory: str = Field(default="data")
+    journal_fsync_interval_ms: float = Field(default=1_000, ge=0)
+    journal_snapshot_every: int = Field(default=100_000, ge=1)
+
+    snapshot_path: str | None = Field(default=None)
+    snapshot_write_on_shutdown: bool = Field(default=True)
+
+    response_write_batching: bool = Field(default=False)
+    response_write_batch_size: int = Field(default=100, ge=1)
+    response_write_batch_delay_ms: float = Field(default=5.0, ge=0)
+
+    idempotency_max_keys: int = Field(default=10_000, ge=1)
+    idempotency_ttl_seconds: float = Field(default=86_400, gt=0)
+
+    form_cache_enabled: bool = Field(default=True)
+    form_cache_max_entries: int = Field(default=1_024, ge=1)
+    form_cache_ttl_seconds: float = Field(default=300, gt=0)
+
+    form_catalog_shared: bool = Field(default=False)
+    form_catalog_path: str = Field(default="data/forms.catalog")
+
+    metrics_enabled: bool = Field(default=True)
 
     @field_validator("environment")
     @classmethod
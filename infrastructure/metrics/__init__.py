@@ -0,0 +1,16 @@
+from infrastructure.metrics.instrumentation import (
+    InstrumentedFormRepository,
+    InstrumentedResponseRepository,
+    UseCaseInstrumentation,
+)
+from infrastructure.metrics.registry import CONTENT_TYPE, MetricsRegistry
+from infrastructure.metrics.service_metrics import ServiceMetrics
+
+__all__ = [
+    "CONTENT_TYPE",
+    "InstrumentedFormRepository",
+    "InstrumentedResponseRepository",
+    "MetricsRegistry",
+    "ServiceMetrics",
+    "UseCaseInstrumentation",
+]
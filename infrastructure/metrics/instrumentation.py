@@ -0,0 +1,197 @@
+import inspect
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from datetime import datetime
+from time import perf_counter
+from typing import Any, TypeVar, cast
+
+from domain.entities.form import Form
+from domain.entities.response import Response
+from domain.repositories.form_repository import FormRepository
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE, ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.response_columns import ResponseColumns
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+from infrastructure.metrics.registry import Histogram, HistogramChild
+
+T = TypeVar("T")
+
+
+class OperationTimer:
+    __slots__ = ("_component", "_errors", "_histogram", "_successes")
+
+    def __init__(self, histogram: Histogram, component: str) -> None:
+        self._histogram = histogram
+        self._component = component
+        self._successes: dict[str, HistogramChild] = {}
+        self._errors: dict[str, HistogramChild] = {}
+
+    async def time(self, operation: str, call: Awaitable[T]) -> T:
+        started = perf_counter()
+        try:
+            result = await call
+        except BaseException:
+            self._child(self._errors, operation, "error").observe(perf_counter() - started)
+            raise
+        self._child(self._successes, operation, "ok").observe(perf_counter() - started)
+        return result
+
+    async def time_iteration(
+        self, operation: str, items: AsyncGenerator[T, None]
+    ) -> AsyncIterator[T]:
+        started = perf_counter()
+        completed = False
+        try:
+            async with aclosing(items) as iterator:
+                async for item in iterator:
+                    yield item
+            completed = True
+        finally:
+            elapsed = perf_counter() - started
+            if completed:
+                self._child(self._successes, operation, "ok").observe(elapsed)
+            else:
+                self._child(self._errors, operation, "error").observe(elapsed)
+
+    def _child(
+        self, children: dict[str, HistogramChild], operation: str, outcome: str
+    ) -> HistogramChild:
+        child = children.get(operation)
+        if child is None:
+            child = children[operation] = self._histogram.labels(
+                self._component, operation, outcome
+            )
+        return child
+
+
+class _InstrumentedUseCase:
+    __slots__ = ("_target", "_timer")
+
+    def __init__(self, target: object, timer: OperationTimer) -> None:
+        self._target = target
+        self._timer = timer
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if inspect.isasyncgenfunction(attribute):
+            return self._timed_iteration(name, attribute)
+        if inspect.iscoroutinefunction(attribute):
+            return self._timed_call(name, attribute)
+        return attribute
+
+    def _timed_call(self, name: str, method: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+        timer = self._timer
+
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            return await timer.time(name, method(*args, **kwargs))
+
+        return timed
+
+    def _timed_iteration(
+        self, name: str, method: Callable[..., AsyncGenerator[Any, None]]
+    ) -> Callable[..., AsyncIterator[Any]]:
+        timer = self._timer
+
+        def timed(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            return timer.time_iteration(name, method(*args, **kwargs))
+
+        return timed
+
+
+class UseCaseInstrumentation:
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._timers: dict[type, OperationTimer] = {}
+
+    def wrap(self, use_case: T) -> T:
+        use_case_type = type(use_case)
+        timer = self._timers.get(use_case_type)
+        if timer is None:
+            timer = self._timers[use_case_type] = OperationTimer(
+                self._histogram, use_case_type.__name__
+            )
+        return cast("T", _InstrumentedUseCase(use_case, timer))
+
+
+class InstrumentedFormRepository(FormRepository):
+    def __init__(self, repository: FormRepository, histogram: Histogram) -> None:
+        self._repository = repository
+        self._timer = OperationTimer(histogram, "forms")
+
+    async def create(self, form: Form) -> Form:
+        return await self._timer.time("create", self._repository.create(form))
+
+    async def get_by_id(self, form_id: FormId) -> Form | None:
+        return await self._timer.time("get_by_id", self._repository.get_by_id(form_id))
+
+    async def get_all(self, form_type: FormType | None = None) -> list[Form]:
+        return await self._timer.time("get_all", self._repository.get_all(form_type))
+
+    async def update(self, form: Form) -> Form:
+        return await self._timer.time("update", self._repository.update(form))
+
+    async def delete(self, form_id: FormId) -> None:
+        await self._timer.time("delete", self._repository.delete(form_id))
+
+
+class InstrumentedResponseRepository(ResponseRepository):
+    def __init__(self, repository: ResponseRepository, histogram: Histogram) -> None:
+        self._repository = repository
+        self._timer = OperationTimer(histogram, "responses")
+
+    async def create(self, response: Response) -> Response:
+        return await self._timer.time("create", self._repository.create(response))
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        return await self._timer.time("create_many", self._repository.create_many(responses))
+
+    async def get_by_id(self, response_id: ResponseId) -> Response | None:
+        return await self._timer.time("get_by_id", self._repository.get_by_id(response_id))
+
+    async def get_by_form_id(self, form_id: FormId) -> list[Response]:
+        return await self._timer.time("get_by_form_id", self._repository.get_by_form_id(form_id))
+
+    async def get_all(self) -> list[Response]:
+        return await self._timer.time("get_all", self._repository.get_all())
+
+    async def get_by_user_id(self, user_id: str) -> list[Response]:
+        return await self._timer.time("get_by_user_id", self._repository.get_by_user_id(user_id))
+
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        return await self._timer.time(
+            "delete_by_user_id", self._repository.delete_by_user_id(user_id)
+        )
+
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        return await self._timer.time(
+            "query",
+            self._repository.query(
+                form_id=form_id,
+                user_id=user_id,
+                tags=tags,
+                since=since,
+                until=until,
+                after=after,
+                limit=limit,
+            ),
+        )
+
+    def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
+        columns = self._repository.iter_columns(form_id=form_id, page_size=page_size)
+        return self._timer.time_iteration(
+            "iter_columns", cast("AsyncGenerator[ResponseColumns, None]", columns)
+        )
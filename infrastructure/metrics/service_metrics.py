@@ -0,0 +1,81 @@
+from infrastructure.metrics.registry import CallbackMetric, MetricsRegistry
+
+
+class ServiceMetrics:
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry if registry is not None else MetricsRegistry()
+        metrics = self.registry
+        self.http_requests = metrics.counter(
+            "http_requests_total",
+            "HTTP requests by method, route template and status code",
+            ("method", "route", "status"),
+        )
+        self.http_request_duration = metrics.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by method and route template",
+            ("method", "route"),
+        )
+        self.http_requests_in_flight = metrics.gauge(
+            "http_requests_in_flight", "HTTP requests currently being served"
+        )
+        self.use_case_duration = metrics.histogram(
+            "use_case_duration_seconds",
+            "Use case call latency",
+            ("use_case", "method", "outcome"),
+        )
+        self.repository_duration = metrics.histogram(
+            "repository_operation_duration_seconds",
+            "Repository call latency",
+            ("repository", "operation", "outcome"),
+        )
+        self.forms_stored = metrics.callback("forms_stored", "Forms held in memory")
+        self.responses_stored = metrics.callback("responses_stored", "Responses held in memory")
+        self.aggregated_forms = metrics.callback(
+            "response_aggregator_forms", "Forms with incremental response analytics"
+        )
+        self.idempotency_keys = metrics.callback(
+            "idempotency_keys", "Idempotency keys currently remembered"
+        )
+        self.form_payload_cache_forms = metrics.callback(
+            "form_payload_cache_forms", "Forms with cached serialized payloads"
+        )
+        self.form_cache_entries = metrics.callback(
+            "form_cache_entries", "Entries in the form repository cache"
+        )
+        self.form_cache_hits = metrics.callback(
+            "form_cache_hits_total", "Form repository cache hits", "counter"
+        )
+        self.form_cache_misses = metrics.callback(
+            "form_cache_misses_total", "Form repository cache misses", "counter"
+        )
+        self.form_cache_evictions = metrics.callback(
+            "form_cache_evictions_total", "Form repository cache LRU evictions", "counter"
+        )
+        self.form_loads = metrics.callback(
+            "form_loads_total", "Form loads started after coalescing", "counter"
+        )
+        self.form_loads_coalesced = metrics.callback(
+            "form_loads_coalesced_total", "Form loads that joined one already in flight", "counter"
+        )
+
+    def sources(self) -> list[CallbackMetric]:
+        return [
+            self.forms_stored,
+            self.responses_stored,
+            self.aggregated_forms,
+            self.idempotency_keys,
+            self.form_payload_cache_forms,
+            self.form_cache_entries,
+            self.form_cache_hits,
+            self.form_cache_misses,
+            self.form_cache_evictions,
+            self.form_loads,
+            self.form_loads_coalesced,
+        ]
+
+    def unbind_sources(self) -> None:
+        for metric in self.sources():
+            metric.bind(None)
+
+    def render(self) -> str:
+        return self.registry.render()
@@ -1,7 +1,32 @@
+from infrastructure.persistence.batching_response_repository import BatchingResponseRepository
+from infrastructure.persistence.binary_snapshot import BinarySnapshot, write_snapshot
+from infrastructure.persistence.caching_form_repository import CachingFormRepository
+from infrastructure.persistence.columnar_response_repository import ColumnarResponseRepository
+from infrastructure.persistence.journal import Journal
 from infrastructure.persistence.mock_form_repository import MockFormRepository
 from infrastructure.persistence.mock_response_repository import MockResponseRepository
+from infrastructure.persistence.shared_form_catalog import SharedFormCatalog
+from infrastructure.persistence.shared_form_repository import SharedFormRepository
+from infrastructure.persistence.snapshot_response_repository import SnapshotResponseRepository
+from infrastructure.persistence.sqlite_database import SQLiteDatabase
+from infrastructure.persistence.sqlite_form_aggregate_store import SQLiteFormAggregateStore
+from infrastructure.persistence.sqlite_form_repository import SQLiteFormRepository
+from infrastructure.persistence.sqlite_response_repository import SQLiteResponseRepository
 
 __all__ = [
+    "BatchingResponseRepository",
+    "BinarySnapshot",
+    "CachingFormRepository",
+    "ColumnarResponseRepository",
+    "Journal",
     "MockFormRepository",
     "MockResponseRepository",
+    "SQLiteDatabase",
+    "SQLiteFormAggregateStore",
+    "SQLiteFormRepository",
+    "SQLiteResponseRepository",
+    "SharedFormCatalog",
+    "SharedFormRepository",
+    "SnapshotResponseRepository",
+    "write_snapshot",
 ]
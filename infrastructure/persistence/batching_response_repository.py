@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from domain.entities.response import Response
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE, ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.response_columns import ResponseColumns
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+
+logger = logging.getLogger(__name__)
+
+PendingWrite = tuple[Response, "asyncio.Future[Response]"]
+
+
+class BatchingResponseRepository(ResponseRepository):
+    def __init__(
+        self,
+        repository: ResponseRepository,
+        max_batch_size: int = 100,
+        max_delay_seconds: float = 0.005,
+    ) -> None:
+        self._repository = repository
+        self._max_batch_size = max_batch_size
+        self._max_delay_seconds = max_delay_seconds
+        self._pending: list[PendingWrite] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def create(self, response: Response) -> Response:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Response] = loop.create_future()
+        self._pending.append((response, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_delay_seconds, self._start_flush)
+        return await future
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        return await self._repository.create_many(responses)
+
+    async def get_by_id(self, response_id: ResponseId) -> Response | None:
+        return await self._repository.get_by_id(response_id)
+
+    async def get_by_form_id(self, form_id: FormId) -> list[Response]:
+        return await self._repository.get_by_form_id(form_id)
+
+    async def get_all(self) -> list[Response]:
+        return await self._repository.get_all()
+
+    async def get_by_user_id(self, user_id: str) -> list[Response]:
+        return await self._repository.get_by_user_id(user_id)
+
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        await self.flush()
+        return await self._repository.delete_by_user_id(user_id)
+
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        return await self._repository.query(
+            form_id=form_id,
+            user_id=user_id,
+            tags=tags,
+            since=since,
+            until=until,
+            after=after,
+            limit=limit,
+        )
+
+    def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
+        return self._repository.iter_columns(form_id=form_id, page_size=page_size)
+
+    async def flush(self) -> None:
+        self._start_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks)
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: list[PendingWrite]) -> None:
+        try:
+            created = await self._repository.create_many([response for response, _ in batch])
+        except Exception:
+            logger.warning(
+                "Batched response write failed, retrying individually",
+                extra={"batch_size": len(batch)},
+            )
+            await self._flush_individually(batch)
+            return
+        for (_, future), result in zip(batch, created, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+    async def _flush_individually(self, batch: list[PendingWrite]) -> None:
+        for response, future in batch:
+            try:
+                result = await self._repository.create(response)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,325 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from application.analytics.response_aggregator import FormAggregate, QuestionAggregate
+from domain.entities.form import Form
+from domain.entities.response import Response
+from domain.value_objects.response_cursor import ResponseCursor
+from infrastructure.persistence.journal import fsync_directory
+from infrastructure.persistence.response_index import MISSING_TIMESTAMP, sort_key
+from infrastructure.persistence.serialization import (
+    form_from_dict,
+    form_to_dict,
+    response_from_dict,
+    response_to_dict,
+    to_epoch_micros,
+)
+
+MAGIC = b"FFSNAP\x00\x00"
+FORMAT_VERSION = 1
+
+Rows = npt.NDArray[np.int64]
+
+_HEADER = struct.Struct("<8sII")
+_SECTION = struct.Struct("<24sQQ")
+_ALIGNMENT = 8
+_INDEXES = ("form", "user", "tag")
+_NO_ROWS: Rows = np.empty(0, dtype=np.int64)
+
+
+class _StringTable:
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, offsets: Rows, data: memoryview) -> None:
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        return str(self.raw(position), "utf-8")
+
+    def raw(self, position: int) -> bytes:
+        return bytes(self._data[self._offsets[position] : self._offsets[position + 1]])
+
+    def find(self, value: str) -> int | None:
+        position = bisect_left(self, value)
+        if position < len(self) and self[position] == value:
+            return position
+        return None
+
+
+_NO_STRINGS = _StringTable(np.zeros(1, dtype=np.int64), memoryview(b""))
+
+
+class _SortedView:
+    __slots__ = ("_order", "_table")
+
+    def __init__(self, table: _StringTable, order: Rows) -> None:
+        self._table = table
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, position: int) -> str:
+        return self._table[int(self._order[position])]
+
+    def find(self, value: str) -> int | None:
+        position = bisect_left(self, value)
+        if position < len(self) and self[position] == value:
+            return int(self._order[position])
+        return None
+
+
+class _Postings:
+    __slots__ = ("_keys", "_offsets", "_rows")
+
+    def __init__(self, keys: _StringTable, offsets: Rows, rows: Rows) -> None:
+        self._keys = keys
+        self._offsets = offsets
+        self._rows = rows
+
+    def get(self, key: str) -> Rows:
+        position = self._keys.find(key)
+        if position is None:
+            return _NO_ROWS
+        return self._rows[self._offsets[position] : self._offsets[position + 1]]
+
+
+class BinarySnapshot:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._buffer) < _HEADER.size:
+            msg = f"{self.path} is not a response snapshot"
+            raise ValueError(msg)
+        magic, version, section_count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            msg = f"{self.path} is not a response snapshot"
+            raise ValueError(msg)
+        if version != FORMAT_VERSION:
+            msg = f"Snapshot {self.path} has format version {version}, expected {FORMAT_VERSION}"
+            raise ValueError(msg)
+        self._sections: dict[str, tuple[int, int]] = {}
+        for position in range(section_count):
+            name, offset, length = _SECTION.unpack_from(
+                self._buffer, _HEADER.size + position * _SECTION.size
+            )
+            if offset + length > len(self._buffer):
+                msg = f"Snapshot {self.path} is truncated"
+                raise ValueError(msg)
+            self._sections[name.rstrip(b"\x00").decode()] = (offset, length)
+        self._meta: dict[str, Any] = json.loads(bytes(self._view("meta")))
+        self._timestamps = self._array("timestamps")
+        self._ids = self._strings("ids")
+        self._ids_by_value = _SortedView(self._ids, self._array("ids.order"))
+        self._records = self._strings("records")
+        self._postings = {
+            name: _Postings(
+                self._strings(f"{name}.keys"),
+                self._array(f"{name}.offsets"),
+                self._array(f"{name}.rows"),
+            )
+            for name in _INDEXES
+        }
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def close(self) -> None:
+        self._timestamps = _NO_ROWS
+        self._ids = self._records = _NO_STRINGS
+        self._ids_by_value = _SortedView(_NO_STRINGS, _NO_ROWS)
+        self._postings = {}
+        self._buffer.close()
+
+    def forms(self) -> list[Form]:
+        return [form_from_dict(form) for form in self._meta["forms"]]
+
+    def aggregates(self) -> dict[str, FormAggregate]:
+        return {
+            form_id: _aggregate_from_dict(aggregate)
+            for form_id, aggregate in self._meta["aggregates"].items()
+        }
+
+    def response(self, row: int) -> Response:
+        return response_from_dict(json.loads(self._records.raw(row)))
+
+    def row(self, response_id: str) -> int | None:
+        return self._ids_by_value.find(response_id)
+
+    def form_rows(self, form_id: str) -> Rows:
+        return self._postings["form"].get(form_id)
+
+    def user_rows(self, user_id: str) -> Rows:
+        return self._postings["user"].get(user_id)
+
+    def tag_rows(self, key: str, value: str) -> Rows:
+        return self._postings["tag"].get(_tag_key(key, value))
+
+    def bounds(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+    ) -> tuple[int, int]:
+        timestamps = self._timestamps
+        start = 0
+        if after is not None:
+            timestamp, response_id = sort_key(after.submitted_at, after.response_id)
+            first = int(np.searchsorted(timestamps, timestamp, side="left"))
+            last = int(np.searchsorted(timestamps, timestamp, side="right"))
+            start = bisect_right(self._ids, response_id, first, last)
+        if since is not None or until is not None:
+            lower = max(
+                to_epoch_micros(since) if since else MISSING_TIMESTAMP + 1, MISSING_TIMESTAMP + 1
+            )
+            start = max(start, int(np.searchsorted(timestamps, lower, side="left")))
+        stop = len(timestamps)
+        if until is not None:
+            stop = int(np.searchsorted(timestamps, to_epoch_micros(until), side="left"))
+        return start, max(start, stop)
+
+    def _view(self, name: str) -> memoryview:
+        offset, length = self._sections[name]
+        return memoryview(self._buffer)[offset : offset + length]
+
+    def _array(self, name: str) -> Rows:
+        offset, length = self._sections[name]
+        return np.frombuffer(self._buffer, dtype=np.int64, count=length // 8, offset=offset)
+
+    def _strings(self, name: str) -> _StringTable:
+        return _StringTable(self._array(f"{name}.offsets"), self._view(f"{name}.data"))
+
+
+def write_snapshot(
+    path: str | Path,
+    forms: Iterable[Form],
+    responses: Iterable[Response],
+    aggregates: Mapping[str, FormAggregate],
+) -> None:
+    ordered = sorted(
+        ((sort_key(response.submitted_at, str(response.id)), response) for response in responses),
+        key=lambda item: item[0],
+    )
+    ids = [key[1] for key, _ in ordered]
+    records: list[bytes] = []
+    postings: dict[str, dict[str, list[int]]] = {name: {} for name in _INDEXES}
+    for row, (_, response) in enumerate(ordered):
+        records.append(_encode(response_to_dict(response)))
+        postings["form"].setdefault(str(response.form_id), []).append(row)
+        if response.user_id is not None:
+            postings["user"].setdefault(response.user_id, []).append(row)
+        for key, value in response.tags.items():
+            postings["tag"].setdefault(_tag_key(key, value), []).append(row)
+
+    sections: dict[str, bytes] = {
+        "meta": _encode(
+            {
+                "forms": [form_to_dict(form) for form in forms],
+                "aggregates": {
+                    form_id: asdict(aggregate) for form_id, aggregate in aggregates.items()
+                },
+            }
+        ),
+        "timestamps": _int64([key[0] for key, _ in ordered]),
+        "ids.order": _int64(sorted(range(len(ids)), key=ids.__getitem__)),
+        **_string_table("ids", [response_id.encode() for response_id in ids]),
+        **_string_table("records", records),
+    }
+    for name, index in postings.items():
+        keys = sorted(index)
+        sections.update(_string_table(f"{name}.keys", [key.encode() for key in keys]))
+        sections[f"{name}.offsets"] = _int64(_cumulative(len(index[key]) for key in keys))
+        sections[f"{name}.rows"] = _int64([row for key in keys for row in index[key]])
+    _write_sections(Path(path), sections)
+
+
+def _write_sections(path: Path, sections: Mapping[str, bytes]) -> None:
+    offset = _aligned(_HEADER.size + len(sections) * _SECTION.size)
+    table: list[bytes] = []
+    for name, data in sections.items():
+        table.append(_SECTION.pack(name.encode(), offset, len(data)))
+        offset = _aligned(offset + len(data))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    ) as file:
+        temporary = Path(file.name)
+        try:
+            file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+            file.write(b"".join(table))
+            for data in sections.values():
+                file.write(b"\x00" * (_aligned(file.tell()) - file.tell()))
+                file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        except BaseException:
+            temporary.unlink()
+            raise
+    temporary.replace(path)
+    fsync_directory(path.parent)
+
+
+def _string_table(name: str, values: Sequence[bytes]) -> dict[str, bytes]:
+    return {
+        f"{name}.offsets": _int64(_cumulative(len(value) for value in values)),
+        f"{name}.data": b"".join(values),
+    }
+
+
+def _cumulative(sizes: Iterable[int]) -> list[int]:
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+    return offsets
+
+
+def _int64(values: Sequence[int]) -> bytes:
+    return np.asarray(values, dtype=np.int64).tobytes()
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _tag_key(key: str, value: str) -> str:
+    return f"{key}\x00{value}"
+
+
+def _aggregate_from_dict(data: dict[str, Any]) -> FormAggregate:
+    return FormAggregate(
+        response_count=data["response_count"],
+        questions={
+            question_id: QuestionAggregate(
+                answer_count=question["answer_count"],
+                rating_count=question["rating_count"],
+                rating_sum=question["rating_sum"],
+                rating_sum_squares=question["rating_sum_squares"],
+                rating_histogram={
+                    int(rating): count for rating, count in question["rating_histogram"].items()
+                },
+                option_counts=question["option_counts"],
+            )
+            for question_id, question in data["questions"].items()
+        },
+    )
@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from domain.entities.form import Form
+from domain.repositories.form_repository import FormRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    form: Form | None
+    expires_at: float
+
+
+class CachingFormRepository(FormRepository):
+    def __init__(
+        self,
+        repository: FormRepository,
+        max_entries: int = 1_024,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._repository = repository
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def create(self, form: Form) -> Form:
+        try:
+            return await self._repository.create(form)
+        finally:
+            self.invalidate(str(form.id))
+
+    async def get_by_id(self, form_id: FormId) -> Form | None:
+        key = str(form_id)
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.form
+
+        self.misses += 1
+        generation = self._generation
+        form = await self._repository.get_by_id(form_id)
+        if generation == self._generation:
+            self._store(key, form, now)
+        return form
+
+    async def get_all(self, form_type: FormType | None = None) -> list[Form]:
+        return await self._repository.get_all(form_type)
+
+    async def update(self, form: Form) -> Form:
+        try:
+            return await self._repository.update(form)
+        finally:
+            self.invalidate(str(form.id))
+
+    async def delete(self, form_id: FormId) -> None:
+        try:
+            await self._repository.delete(form_id)
+        finally:
+            self.invalidate(str(form_id))
+
+    def invalidate(self, form_id: str) -> None:
+        self._generation += 1
+        self._entries.pop(form_id, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, form: Form | None, now: float) -> None:
+        self._entries[key] = _Entry(form, now + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,500 @@
+import asyncio
+import logging
+from array import array
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from datetime import datetime
+from functools import partial
+from sys import intern
+from typing import Any, Protocol, TypeVar, overload
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE, ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_columns import (
+    MISSING_CODE,
+    MISSING_INTEGER,
+    EncodedColumn,
+    ResponseColumns,
+)
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.response_index import ResponseIndex, sort_key
+from infrastructure.persistence.serialization import from_epoch_micros, to_epoch_micros
+
+logger = logging.getLogger(__name__)
+
+RATING = 0
+CHOICE = 1
+TEXT = 2
+
+COMPACTION_BATCH_SIZE = 1_024
+
+Layout = tuple[tuple[str, int], ...]
+Rows = range | list[int]
+
+
+class _Column(Protocol):
+    def append(self, value: Any) -> None: ...
+
+
+C = TypeVar("C", bound=_Column)
+V = TypeVar("V")
+
+
+class _DictionaryColumn:
+    __slots__ = ("codes", "lookup", "values")
+
+    def __init__(self, rows: int = 0) -> None:
+        self.codes = array("i", [MISSING_CODE]) * rows
+        self.values: list[str] = []
+        self.lookup: dict[str, int] = {}
+
+    def append(self, value: str | None) -> None:
+        self.codes.append(self.encode(value) if value is not None else MISSING_CODE)
+
+    def encode(self, value: str) -> int:
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(intern(value))
+        return code
+
+    def get(self, row: int) -> str | None:
+        code = self.codes[row]
+        return self.values[code] if code != MISSING_CODE else None
+
+    def encoded(self, rows: Rows) -> EncodedColumn:
+        return EncodedColumn(_take(self.codes, rows), self.values)
+
+
+class _RatingColumn:
+    __slots__ = ("values",)
+
+    def __init__(self, rows: int = 0) -> None:
+        self.values = array("q", [MISSING_INTEGER]) * rows
+
+    def append(self, value: int | None) -> None:
+        self.values.append(value if value is not None else MISSING_INTEGER)
+
+
+class _ChoiceColumn:
+    __slots__ = ("codes", "offsets", "options")
+
+    def __init__(self, rows: int = 0) -> None:
+        self.offsets = array("Q", [0]) * (rows + 1)
+        self.codes = array("i")
+        self.options = _DictionaryColumn()
+
+    def append(self, value: list[str] | None) -> None:
+        if value:
+            self.codes.extend(self.options.encode(option) for option in value)
+        self.offsets.append(len(self.codes))
+
+    def get(self, row: int) -> list[str] | None:
+        start, stop = self.offsets[row], self.offsets[row + 1]
+        if start == stop:
+            return None
+        options = self.options.values
+        return [options[code] for code in self.codes[start:stop]]
+
+    def erase(self, row: int) -> None:
+        start, stop = self.offsets[row], self.offsets[row + 1]
+        self.codes[start:stop] = array("i", [MISSING_CODE]) * (stop - start)
+
+
+class _TextColumn:
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, rows: int = 0) -> None:
+        self.offsets = array("Q", [0]) * (rows + 1)
+        self.data = bytearray()
+
+    def append(self, value: str | None) -> None:
+        if value:
+            self.data += value.encode()
+        self.offsets.append(len(self.data))
+
+    def get(self, row: int) -> str | None:
+        start, stop = self.offsets[row], self.offsets[row + 1]
+        return self.data[start:stop].decode() if start != stop else None
+
+    def erase(self, row: int) -> None:
+        start, stop = self.offsets[row], self.offsets[row + 1]
+        self.data[start:stop] = bytes(stop - start)
+
+
+class _ColumnView(Sequence[V]):
+    __slots__ = ("_read", "_rows")
+
+    def __init__(self, read: Callable[[int], V], rows: Rows) -> None:
+        self._read = read
+        self._rows = rows
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[V]: ...
+
+    def __getitem__(self, index: int | slice) -> V | list[V]:
+        if isinstance(index, slice):
+            return [self._read(row) for row in self._rows[index]]
+        return self._read(self._rows[index])
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[V]:
+        return map(self._read, self._rows)
+
+
+class _FormSegment:
+    def __init__(self, form_id: FormId) -> None:
+        self.form_id = form_id
+        self.response_ids: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.live = bytearray()
+        self.dead = 0
+        self.submitted_at = array("q")
+        self.user_ids = _DictionaryColumn()
+        self.layout_codes = array("i")
+        self.layouts: list[Layout] = []
+        self._layout_lookup: dict[Layout, int] = {}
+        self.question_ids: dict[str, QuestionId] = {}
+        self._rating_answers: dict[tuple[str, int], Answer] = {}
+        self.tags: dict[str, _DictionaryColumn] = {}
+        self.ratings: dict[str, _RatingColumn] = {}
+        self.choices: dict[str, _ChoiceColumn] = {}
+        self.texts: dict[str, _TextColumn] = {}
+
+    def __len__(self) -> int:
+        return len(self.response_ids)
+
+    def append(self, response: Response) -> None:
+        row = len(self.response_ids)
+        response_id = intern(str(response.id))
+        ratings: dict[str, int] = {}
+        choices: dict[str, list[str]] = {}
+        texts: dict[str, str] = {}
+        layout: list[tuple[str, int]] = []
+        for answer in response.answers:
+            question_id = str(answer.question_id)
+            if question_id not in self.question_ids:
+                self.question_ids[question_id] = QuestionId(intern(question_id))
+            value = answer.value
+            if isinstance(value, int):
+                ratings[question_id] = value
+                layout.append((question_id, RATING))
+            elif isinstance(value, list):
+                choices[question_id] = value
+                layout.append((question_id, CHOICE))
+            else:
+                texts[question_id] = value
+                layout.append((question_id, TEXT))
+
+        self.response_ids.append(response_id)
+        self.rows[response_id] = row
+        self.live.append(1)
+        self.submitted_at.append(
+            to_epoch_micros(response.submitted_at) if response.submitted_at else MISSING_INTEGER
+        )
+        self.user_ids.append(response.user_id)
+        self.layout_codes.append(self._layout_code(tuple(layout)))
+        _append_row(self.tags, response.tags, _DictionaryColumn, row)
+        _append_row(self.ratings, ratings, _RatingColumn, row)
+        _append_row(self.choices, choices, _ChoiceColumn, row)
+        _append_row(self.texts, texts, _TextColumn, row)
+
+    def remove(self, response_id: str) -> None:
+        row = self.rows.pop(response_id)
+        self.live[row] = 0
+        self.dead += 1
+        self.user_ids.codes[row] = MISSING_CODE
+        for tag in self.tags.values():
+            tag.codes[row] = MISSING_CODE
+        for rating in self.ratings.values():
+            rating.values[row] = MISSING_INTEGER
+        for choice in self.choices.values():
+            choice.erase(row)
+        for text in self.texts.values():
+            text.erase(row)
+
+    def needs_compaction(self) -> bool:
+        return self.dead * 2 > len(self)
+
+    def response(self, row: int) -> Response:
+        answers = [
+            self._answer(question_id, kind, row)
+            for question_id, kind in self.layouts[self.layout_codes[row]]
+        ]
+        tags = {
+            key: column.values[code]
+            for key, column in self.tags.items()
+            if (code := column.codes[row]) != MISSING_CODE
+        }
+        return Response(
+            id=ResponseId(self.response_ids[row]),
+            form_id=self.form_id,
+            answers=answers,
+            tags=tags,
+            user_id=self.user_ids.get(row),
+            submitted_at=self.submitted_at_datetime(row),
+        )
+
+    def submitted_at_datetime(self, row: int) -> datetime | None:
+        value = self.submitted_at[row]
+        return from_epoch_micros(value) if value != MISSING_INTEGER else None
+
+    def sort_key(self, row: int) -> tuple[int, str]:
+        return sort_key(self.submitted_at_datetime(row), self.response_ids[row])
+
+    def live_rows(self, start: int, stop: int) -> Rows:
+        if not self.dead:
+            return range(start, stop)
+        live = self.live
+        return [row for row in range(start, stop) if live[row]]
+
+    def columns(self, rows: Rows) -> ResponseColumns:
+        answers: dict[str, Sequence[str | list[str] | None]] = {
+            question_id: _ColumnView(column.get, rows)
+            for question_id, column in self.choices.items()
+        }
+        answers.update(
+            (question_id, _ColumnView(column.get, rows))
+            for question_id, column in self.texts.items()
+        )
+        return ResponseColumns(
+            response_ids=_take(self.response_ids, rows),
+            submitted_at=_take(self.submitted_at, rows),
+            user_ids=self.user_ids.encoded(rows),
+            tags={key: column.encoded(rows) for key, column in self.tags.items()},
+            ratings={
+                question_id: _take(column.values, rows)
+                for question_id, column in self.ratings.items()
+            },
+            answers=answers,
+        )
+
+    def _answer(self, question_id: str, kind: int, row: int) -> Answer:
+        if kind == RATING:
+            rating = self.ratings[question_id].values[row]
+            answer = self._rating_answers.get((question_id, rating))
+            if answer is None:
+                answer = self._rating_answers[question_id, rating] = Answer(
+                    question_id=self.question_ids[question_id], value=rating
+                )
+            return answer
+        value: str | list[str] | None = (
+            self.choices[question_id].get(row)
+            if kind == CHOICE
+            else self.texts[question_id].get(row)
+        )
+        if value is None:
+            msg = f"Missing stored value for question {question_id}"
+            raise ValueError(msg)
+        return Answer(question_id=self.question_ids[question_id], value=value)
+
+    def _layout_code(self, layout: Layout) -> int:
+        code = self._layout_lookup.get(layout)
+        if code is None:
+            code = self._layout_lookup[layout] = len(self.layouts)
+            self.layouts.append(layout)
+        return code
+
+
+class ColumnarResponseRepository(ResponseRepository):
+    def __init__(self) -> None:
+        self._segments: dict[str, _FormSegment] = {}
+        self._locations: dict[str, str] = {}
+        self._index = ResponseIndex()
+        self._compactions: dict[str, asyncio.Future[None]] = {}
+
+    async def create(self, response: Response) -> Response:
+        response_id = str(response.id)
+        if response_id in self._locations:
+            self._schedule_compaction(self._remove(response_id))
+        form_id = intern(str(response.form_id))
+        segment = self._segments.get(form_id)
+        if segment is None:
+            segment = self._segments[form_id] = _FormSegment(FormId(form_id))
+        segment.append(response)
+        self._locations[response_id] = form_id
+        self._index.add(
+            sort_key(response.submitted_at, response_id),
+            form_id,
+            response.user_id,
+            response.tags,
+        )
+        return response
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        return [await self.create(response) for response in responses]
+
+    async def get_by_id(self, response_id: ResponseId) -> Response | None:
+        key = str(response_id)
+        form_id = self._locations.get(key)
+        if form_id is None:
+            return None
+        segment = self._segments[form_id]
+        return segment.response(segment.rows[key])
+
+    async def get_by_form_id(self, form_id: FormId) -> list[Response]:
+        segment = self._segments.get(str(form_id))
+        if segment is None:
+            return []
+        return [segment.response(row) for row in segment.live_rows(0, len(segment))]
+
+    async def get_all(self) -> list[Response]:
+        return self._responses(list(self._locations))
+
+    async def get_by_user_id(self, user_id: str) -> list[Response]:
+        return self._responses(self._index.user_ids(user_id))
+
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        response_ids = self._index.user_ids(user_id)
+        deleted = self._responses(response_ids)
+        segments = {id(segment): segment for segment in map(self._remove, response_ids)}
+        for segment in segments.values():
+            self._schedule_compaction(segment)
+        return deleted
+
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        response_ids = self._index.page(
+            form_id=str(form_id) if form_id else None,
+            user_id=user_id,
+            tags=tags,
+            since=to_epoch_micros(since) if since else None,
+            until=to_epoch_micros(until) if until else None,
+            after=sort_key(after.submitted_at, after.response_id) if after else None,
+            limit=limit,
+        )
+        return self._responses(response_ids)
+
+    async def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
+        segment = self._segments.get(str(form_id))
+        if segment is None:
+            return
+        start = 0
+        while start < len(segment):
+            stop = min(start + page_size, len(segment))
+            rows = segment.live_rows(start, stop)
+            if rows:
+                yield segment.columns(rows)
+            start = stop
+
+    async def wait_for_compaction(self) -> None:
+        while self._compactions:
+            await asyncio.shield(next(iter(self._compactions.values())))
+
+    def clear(self) -> None:
+        for task in self._compactions.values():
+            task.cancel()
+        self._compactions.clear()
+        self._segments.clear()
+        self._locations.clear()
+        self._index.clear()
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def _responses(self, response_ids: list[str]) -> list[Response]:
+        segments = self._segments
+        locations = self._locations
+        responses = []
+        for response_id in response_ids:
+            segment = segments[locations[response_id]]
+            responses.append(segment.response(segment.rows[response_id]))
+        return responses
+
+    def _remove(self, response_id: str) -> _FormSegment:
+        form_id = self._locations.pop(response_id)
+        segment = self._segments[form_id]
+        row = segment.rows[response_id]
+        tags = {
+            key: column.values[code]
+            for key, column in segment.tags.items()
+            if (code := column.codes[row]) != MISSING_CODE
+        }
+        self._index.remove(segment.sort_key(row), form_id, segment.user_ids.get(row), tags)
+        segment.remove(response_id)
+        return segment
+
+    def _schedule_compaction(self, segment: _FormSegment) -> None:
+        form_id = str(segment.form_id)
+        if form_id in self._compactions or not segment.needs_compaction():
+            return
+        task = asyncio.ensure_future(self._compact(form_id))
+        task.add_done_callback(partial(self._compaction_done, form_id))
+        self._compactions[form_id] = task
+
+    async def _compact(self, form_id: str) -> None:
+        segment = self._segments[form_id]
+        compacted = _FormSegment(segment.form_id)
+        sources: dict[str, int] = {}
+        start = 0
+        while start < len(segment):
+            stop = min(start + COMPACTION_BATCH_SIZE, len(segment))
+            for row in segment.live_rows(start, stop):
+                response_id = segment.response_ids[row]
+                if response_id in compacted.rows:
+                    compacted.remove(response_id)
+                compacted.append(segment.response(row))
+                sources[response_id] = row
+            start = stop
+            await asyncio.sleep(0)
+        for response_id, row in sources.items():
+            if segment.rows.get(response_id) != row:
+                compacted.remove(response_id)
+        if compacted.rows:
+            self._segments[form_id] = compacted
+        else:
+            del self._segments[form_id]
+
+    def _compaction_done(self, form_id: str, task: "asyncio.Future[None]") -> None:
+        if self._compactions.get(form_id) is task:
+            del self._compactions[form_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Columnar segment compaction failed",
+                exc_info=task.exception(),
+                extra={"form_id": form_id},
+            )
+
+
+def _append_row(
+    columns: dict[str, C], values: Mapping[str, Any], factory: Callable[[int], C], row: int
+) -> None:
+    for key in values.keys() - columns.keys():
+        columns[key] = factory(row)
+    for key, column in columns.items():
+        column.append(values.get(key))
+
+
+@overload
+def _take(values: "array[int]", rows: Rows) -> "array[int]": ...
+
+
+@overload
+def _take(values: list[str], rows: Rows) -> list[str]: ...
+
+
+def _take(values: "array[int] | list[str]", rows: Rows) -> "array[int] | list[str]":
+    if isinstance(rows, range):
+        return values[rows.start : rows.stop]
+    if isinstance(values, list):
+        return [values[row] for row in rows]
+    return array(values.typecode, [values[row] for row in rows])
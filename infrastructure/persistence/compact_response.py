@@ -0,0 +1,104 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from sys import intern
+from types import MappingProxyType
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+
+TagItems = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CompactResponse:
+    id: ResponseId
+    form_id: FormId
+    answers: tuple[Answer, ...]
+    tags: Mapping[str, str]
+    user_id: str | None
+    submitted_at: datetime | None
+
+    def to_response(self) -> Response:
+        return Response(
+            id=self.id,
+            form_id=self.form_id,
+            answers=list(self.answers),
+            tags=dict(self.tags),
+            user_id=self.user_id,
+            submitted_at=self.submitted_at,
+        )
+
+
+@dataclass(slots=True)
+class _SharedTags:
+    tags: Mapping[str, str]
+    references: int = 0
+
+
+class ResponseCompactor:
+    def __init__(self) -> None:
+        self._form_ids: dict[str, FormId] = {}
+        self._question_ids: dict[str, QuestionId] = {}
+        self._scores: dict[tuple[str, int], Answer] = {}
+        self._tags: dict[TagItems, _SharedTags] = {}
+
+    def compact(self, response: Response) -> CompactResponse:
+        return CompactResponse(
+            id=response.id,
+            form_id=self._form_id(response.form_id),
+            answers=tuple(self._answer(answer) for answer in response.answers),
+            tags=self._shared_tags(response.tags),
+            user_id=response.user_id,
+            submitted_at=response.submitted_at,
+        )
+
+    def release(self, response: CompactResponse) -> None:
+        key = tuple(response.tags.items())
+        shared = self._tags.get(key)
+        if shared is None:
+            return
+        shared.references -= 1
+        if shared.references <= 0:
+            del self._tags[key]
+
+    def clear(self) -> None:
+        self._form_ids.clear()
+        self._question_ids.clear()
+        self._scores.clear()
+        self._tags.clear()
+
+    def _form_id(self, form_id: FormId) -> FormId:
+        key = str(form_id)
+        shared = self._form_ids.get(key)
+        if shared is None:
+            shared = self._form_ids[key] = FormId(intern(key))
+        return shared
+
+    def _answer(self, answer: Answer) -> Answer:
+        key = str(answer.question_id)
+        question_id = self._question_ids.get(key)
+        if question_id is None:
+            question_id = self._question_ids[key] = QuestionId(intern(key))
+        value = answer.value
+        if isinstance(value, int):
+            score = self._scores.get((key, value))
+            if score is None:
+                score = self._scores[key, value] = Answer(question_id=question_id, value=value)
+            return score
+        if isinstance(value, list):
+            return Answer(question_id=question_id, value=[intern(option) for option in value])
+        return Answer(question_id=question_id, value=value)
+
+    def _shared_tags(self, tags: Mapping[str, str]) -> Mapping[str, str]:
+        key = tuple(tags.items())
+        shared = self._tags.get(key)
+        if shared is None:
+            shared = self._tags[key] = _SharedTags(
+                MappingProxyType({intern(name): intern(value) for name, value in key})
+            )
+        shared.references += 1
+        return shared.tags
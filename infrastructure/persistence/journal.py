@@ -0,0 +1,241 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, TextIO
+
+logger = logging.getLogger(__name__)
+
+Record = dict[str, Any]
+
+PUT = "put"
+DELETE = "delete"
+DELETE_USER = "delete_user"
+
+
+class Journal:
+    def __init__(
+        self,
+        directory: str | Path,
+        name: str,
+        fsync_interval_seconds: float = 1.0,
+        snapshot_every: int = 100_000,
+    ) -> None:
+        self._directory = Path(directory)
+        self._log_path = self._directory / f"{name}.log"
+        self._rotated_path = self._directory / f"{name}.log.1"
+        self._snapshot_path = self._directory / f"{name}.snapshot"
+        self._lock_path = self._directory / f"{name}.lock"
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._snapshot_every = snapshot_every
+        self._sequence = 0
+        self._since_snapshot = 0
+        self._log: TextIO | None = None
+        self._lock: int | None = None
+        self._sync_handle: asyncio.TimerHandle | None = None
+        self._snapshot_task: asyncio.Future[None] | None = None
+        self._sync_task: asyncio.Future[None] | None = None
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def replay(self, apply: Callable[[Record], None]) -> int:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._acquire_lock()
+        try:
+            applied = self._replay(apply)
+        except BaseException:
+            self._release_lock()
+            raise
+        self._log = self._log_path.open("a", encoding="utf-8")
+        logger.info(
+            "Journal replayed",
+            extra={"journal": str(self._log_path), "records": applied, "sequence": self._sequence},
+        )
+        return applied
+
+    def _replay(self, apply: Callable[[Record], None]) -> int:
+        applied = 0
+        snapshot_sequence = 0
+        if self._snapshot_path.exists():
+            with self._snapshot_path.open(encoding="utf-8") as snapshot:
+                snapshot_sequence = json.loads(snapshot.readline())["sequence"]
+                for line in snapshot:
+                    apply(json.loads(line))
+                    applied += 1
+        self._sequence = snapshot_sequence
+        for path in (self._rotated_path, self._log_path):
+            if path.exists():
+                applied += self._replay_log(path, snapshot_sequence, apply)
+        self._since_snapshot = self._sequence - snapshot_sequence
+        return applied
+
+    def append(self, record: Record) -> bool:
+        if self._log is None:
+            msg = f"Journal {self._log_path} must be replayed before appending"
+            raise RuntimeError(msg)
+        self._sequence += 1
+        self._log.write(
+            json.dumps({"sequence": self._sequence, **record}, separators=(",", ":")) + "\n"
+        )
+        self._log.flush()
+        self._since_snapshot += 1
+        self._schedule_sync()
+        return self._since_snapshot >= self._snapshot_every and self._snapshot_task is None
+
+    async def commit(self) -> None:
+        if self._fsync_interval_seconds <= 0 and self._log is not None:
+            await asyncio.to_thread(_fsync_and_close, os.dup(self._log.fileno()))
+
+    def sync(self) -> None:
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        if self._log is not None:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+
+    def start_snapshot(self, records: Iterable[Record]) -> None:
+        if self._log is None or self._snapshot_task is not None:
+            return
+        self.sync()
+        self._log.close()
+        if self._rotated_path.exists():
+            with self._rotated_path.open("a", encoding="utf-8") as rotated:
+                rotated.write(self._log_path.read_text(encoding="utf-8"))
+                rotated.flush()
+                os.fsync(rotated.fileno())
+            self._log_path.unlink()
+        else:
+            self._log_path.replace(self._rotated_path)
+        self._log = self._log_path.open("a", encoding="utf-8")
+        self._since_snapshot = 0
+        task = asyncio.ensure_future(
+            asyncio.to_thread(self._write_snapshot, records, self._sequence)
+        )
+        task.add_done_callback(self._snapshot_done)
+        self._snapshot_task = task
+
+    async def wait_for_snapshot(self) -> None:
+        if self._snapshot_task is not None:
+            await asyncio.shield(self._snapshot_task)
+
+    def close(self) -> None:
+        self.sync()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self._release_lock()
+
+    def _schedule_sync(self) -> None:
+        if self._fsync_interval_seconds <= 0 or self._sync_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.sync()
+            return
+        self._sync_handle = loop.call_later(self._fsync_interval_seconds, self._sync_in_background)
+
+    def _sync_in_background(self) -> None:
+        self._sync_handle = None
+        if self._log is None or self._sync_task is not None:
+            return
+        task = asyncio.ensure_future(
+            asyncio.to_thread(_fsync_and_close, os.dup(self._log.fileno()))
+        )
+        task.add_done_callback(self._sync_done)
+        self._sync_task = task
+
+    def _sync_done(self, task: "asyncio.Future[None]") -> None:
+        self._sync_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Journal fsync failed",
+                exc_info=task.exception(),
+                extra={"journal": str(self._log_path)},
+            )
+
+    def _acquire_lock(self) -> None:
+        if self._lock is not None:
+            return
+        descriptor = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(descriptor)
+            msg = f"Journal {self._log_path} is already in use by another process"
+            raise RuntimeError(msg) from None
+        self._lock = descriptor
+
+    def _release_lock(self) -> None:
+        if self._lock is not None:
+            os.close(self._lock)
+            self._lock = None
+
+    def _replay_log(self, path: Path, after: int, apply: Callable[[Record], None]) -> int:
+        applied = 0
+        offset = 0
+        with path.open("rb") as log:
+            for line in log:
+                if not line.endswith(b"\n"):
+                    logger.warning(
+                        "Discarding torn journal record",
+                        extra={"journal": str(path), "offset": offset},
+                    )
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    msg = f"Corrupt journal record in {path} at byte {offset}"
+                    raise ValueError(msg) from e
+                offset += len(line)
+                sequence = record.pop("sequence")
+                if sequence > after:
+                    apply(record)
+                    applied += 1
+                self._sequence = max(self._sequence, sequence)
+        if offset < path.stat().st_size:
+            with path.open("r+b") as log:
+                log.truncate(offset)
+        return applied
+
+    def _write_snapshot(self, records: Iterable[Record], sequence: int) -> None:
+        temporary = self._snapshot_path.with_name(self._snapshot_path.name + ".tmp")
+        with temporary.open("w", encoding="utf-8") as snapshot:
+            snapshot.write(json.dumps({"sequence": sequence}) + "\n")
+            for record in records:
+                snapshot.write(json.dumps(record, separators=(",", ":")) + "\n")
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        temporary.replace(self._snapshot_path)
+        fsync_directory(self._directory)
+        self._rotated_path.unlink(missing_ok=True)
+
+    def _snapshot_done(self, task: "asyncio.Future[None]") -> None:
+        self._snapshot_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Journal snapshot failed",
+                exc_info=task.exception(),
+                extra={"journal": str(self._snapshot_path)},
+            )
+
+
+def _fsync_and_close(descriptor: int) -> None:
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def fsync_directory(directory: Path) -> None:
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -1,15 +1,24 @@
+from collections.abc import Iterable
+
 from domain.entities.form import Form
 from domain.repositories.form_repository import FormRepository
 from domain.value_objects.form_id import FormId
 from domain.value_objects.form_type import FormType
+from infrastructure.persistence.journal import DELETE, PUT, Journal, Record
+from infrastructure.persistence.serialization import form_from_dict, form_to_dict
 
 
 class MockFormRepository(FormRepository):
-    def __init__(self) -> None:
-        self._forms: dict[str, Form] = {}
+    def __init__(self, journal: Journal | None = None, forms: Iterable[Form] = ()) -> None:
+        self._forms: dict[str, Form] = {str(form.id): form for form in forms}
+        self._journal = journal
+        if journal is not None:
+            journal.replay(self._apply)
 
     async def create(self, form: Form) -> Form:
         self._forms[str(form.id)] = form
+        if self._journal is not None:
+            await self._record({"op": PUT, "form": form_to_dict(form)})
         return form
 
     async def get_by_id(self, form_id: FormId) -> Form | None:
@@ -26,6 +35,8 @@ class MockFormRepository(FormRepository):
             msg = f"Form with id {form.id} not found"
             raise ValueError(msg)
         self._forms[str(form.id)] = form
+        if self._journal is not None:
+            await self._record({"op": PUT, "form": form_to_dict(form)})
         return form
 
     async def delete(self, form_id: FormId) -> None:
@@ -33,3 +44,23 @@ class MockFormRepository(FormRepository):
             msg = f"Form with id {form_id} not found"
             raise ValueError(msg)
         del self._forms[str(form_id)]
+        if self._journal is not None:
+            await self._record({"op": DELETE, "id": str(form_id)})
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def _apply(self, record: Record) -> None:
+        if record["op"] == PUT:
+            form = form_from_dict(record["form"])
+            self._forms[str(form.id)] = form
+        else:
+            self._forms.pop(record["id"], None)
+
+    async def _record(self, record: Record) -> None:
+        if self._journal is None:
+            return
+        if self._journal.append(record):
+            forms = list(self._forms.values())
+            self._journal.start_snapshot({"op": PUT, "form": form_to_dict(f)} for f in forms)
+        await self._journal.commit()
@@ -1,36 +1,136 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from domain.entities.response import Response
-from domain.repositories.response_repository import ResponseRepository
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE, ResponseRepository
 from domain.value_objects.form_id import FormId
+from domain.value_objects.response_columns import ResponseColumns
+from domain.value_objects.response_cursor import ResponseCursor
 from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.compact_response import CompactResponse, ResponseCompactor
+from infrastructure.persistence.journal import DELETE_USER, PUT, Journal, Record
+from infrastructure.persistence.response_index import ResponseIndex, sort_key
+from infrastructure.persistence.serialization import (
+    response_from_dict,
+    response_to_dict,
+    responses_to_columns,
+    to_epoch_micros,
+)
 
 
 class MockResponseRepository(ResponseRepository):
-    def __init__(self) -> None:
-        self._responses: dict[str, Response] = {}
+    def __init__(self, journal: Journal | None = None) -> None:
+        self._responses: dict[str, CompactResponse] = {}
+        self._index = ResponseIndex()
+        self._compactor = ResponseCompactor()
+        self._journal = journal
+        if journal is not None:
+            journal.replay(self._apply)
 
     async def create(self, response: Response) -> Response:
-        self._responses[str(response.id)] = response
-        return response
+        stored = self._store(response).to_response()
+        if self._journal is not None:
+            await self._record({"op": PUT, "response": response_to_dict(stored)})
+        return stored
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        return [await self.create(response) for response in responses]
 
     async def get_by_id(self, response_id: ResponseId) -> Response | None:
-        return self._responses.get(str(response_id))
+        stored = self._responses.get(str(response_id))
+        return stored.to_response() if stored is not None else None
 
     async def get_by_form_id(self, form_id: FormId) -> list[Response]:
-        return [r for r in self._responses.values() if str(r.form_id) == str(form_id)]
+        return [self._responses[i].to_response() for i in self._index.form_ids(str(form_id))]
 
     async def get_all(self) -> list[Response]:
-        return list(self._responses.values())
+        return [stored.to_response() for stored in self._responses.values()]
 
     async def get_by_user_id(self, user_id: str) -> list[Response]:
-        return [r for r in self._responses.values() if r.user_id == user_id]
-
-    async def delete_by_user_id(self, user_id: str) -> int:
-        deleted_count = 0
-        response_ids_to_delete = [
-            str(response.id) for response in self._responses.values() if response.user_id == user_id
-        ]
-        for response_id in response_ids_to_delete:
-            if response_id in self._responses:
-                del self._responses[response_id]
-                deleted_count += 1
-        return deleted_count
+        return [self._responses[i].to_response() for i in self._index.user_ids(user_id)]
+
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        deleted = [response.to_response() for response in self._delete_user(user_id)]
+        if self._journal is not None:
+            await self._record({"op": DELETE_USER, "user_id": user_id})
+        return deleted
+
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        response_ids = self._index.page(
+            form_id=str(form_id) if form_id else None,
+            user_id=user_id,
+            tags=tags,
+            since=to_epoch_micros(since) if since else None,
+            until=to_epoch_micros(until) if until else None,
+            after=sort_key(after.submitted_at, after.response_id) if after else None,
+            limit=limit,
+        )
+        return [self._responses[i].to_response() for i in response_ids]
+
+    async def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
+        async for page in self.iter_pages(form_id=form_id, page_size=page_size):
+            yield responses_to_columns(page)
+
+    def clear(self) -> None:
+        self._responses.clear()
+        self._index.clear()
+        self._compactor.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def _store(self, response: Response) -> CompactResponse:
+        stored = self._compactor.compact(response)
+        response_id = str(stored.id)
+        if response_id in self._responses:
+            self._remove(response_id)
+        self._responses[response_id] = stored
+        self._index.add(
+            sort_key(stored.submitted_at, response_id),
+            str(stored.form_id),
+            stored.user_id,
+            stored.tags,
+        )
+        return stored
+
+    def _delete_user(self, user_id: str) -> list[CompactResponse]:
+        return [self._remove(response_id) for response_id in self._index.user_ids(user_id)]
+
+    def _apply(self, record: Record) -> None:
+        if record["op"] == PUT:
+            self._store(response_from_dict(record["response"]))
+        else:
+            self._delete_user(record["user_id"])
+
+    async def _record(self, record: Record) -> None:
+        if self._journal is None:
+            return
+        if self._journal.append(record):
+            responses = list(self._responses.values())
+            self._journal.start_snapshot(
+                {"op": PUT, "response": response_to_dict(r.to_response())} for r in responses
+            )
+        await self._journal.commit()
+
+    def _remove(self, response_id: str) -> CompactResponse:
+        response = self._responses.pop(response_id)
+        self._index.remove(
+            sort_key(response.submitted_at, response_id),
+            str(response.form_id),
+            response.user_id,
+            response.tags,
+        )
+        self._compactor.release(response)
+        return response
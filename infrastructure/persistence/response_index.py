@@ -0,0 +1,158 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TypeVar
+
+from infrastructure.persistence.serialization import to_epoch_micros
+
+MISSING_TIMESTAMP = -(2**63)
+
+SortKey = tuple[int, str]
+TagPair = tuple[str, str]
+K = TypeVar("K", bound=Hashable)
+
+
+def sort_key(submitted_at: datetime | None, response_id: str) -> SortKey:
+    timestamp = to_epoch_micros(submitted_at) if submitted_at else MISSING_TIMESTAMP
+    return (timestamp, response_id)
+
+
+@dataclass(slots=True)
+class _Posting:
+    members: dict[str, None] = field(default_factory=dict)
+    timeline: list[SortKey] = field(default_factory=list)
+
+    def add(self, key: SortKey) -> None:
+        self.members[key[1]] = None
+        _insert_sorted(self.timeline, key)
+
+    def remove(self, key: SortKey) -> None:
+        self.members.pop(key[1], None)
+        _remove_sorted(self.timeline, key)
+
+
+_EMPTY_POSTING = _Posting()
+
+
+class ResponseIndex:
+    def __init__(self) -> None:
+        self._timeline: list[SortKey] = []
+        self._by_form: dict[str, _Posting] = {}
+        self._by_user: dict[str, _Posting] = {}
+        self._by_tag: dict[TagPair, _Posting] = {}
+
+    def add(
+        self,
+        key: SortKey,
+        form_id: str,
+        user_id: str | None,
+        tags: Mapping[str, str] | None = None,
+    ) -> None:
+        _insert_sorted(self._timeline, key)
+        self._add_posting(self._by_form, form_id, key)
+        if user_id is not None:
+            self._add_posting(self._by_user, user_id, key)
+        for pair in (tags or {}).items():
+            self._add_posting(self._by_tag, pair, key)
+
+    def remove(
+        self,
+        key: SortKey,
+        form_id: str,
+        user_id: str | None,
+        tags: Mapping[str, str] | None = None,
+    ) -> None:
+        _remove_sorted(self._timeline, key)
+        self._remove_posting(self._by_form, form_id, key)
+        if user_id is not None:
+            self._remove_posting(self._by_user, user_id, key)
+        for pair in (tags or {}).items():
+            self._remove_posting(self._by_tag, pair, key)
+
+    def form_ids(self, form_id: str) -> list[str]:
+        return list(self._by_form.get(form_id, _EMPTY_POSTING).members)
+
+    def user_ids(self, user_id: str) -> list[str]:
+        return list(self._by_user.get(user_id, _EMPTY_POSTING).members)
+
+    def page(  # noqa: PLR0913
+        self,
+        *,
+        form_id: str | None = None,
+        user_id: str | None = None,
+        tags: Mapping[str, str] | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        after: SortKey | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        postings: list[_Posting] = []
+        if form_id is not None:
+            postings.append(self._by_form.get(form_id, _EMPTY_POSTING))
+        if user_id is not None:
+            postings.append(self._by_user.get(user_id, _EMPTY_POSTING))
+        postings.extend(self._by_tag.get(pair, _EMPTY_POSTING) for pair in (tags or {}).items())
+        postings.sort(key=lambda posting: len(posting.members))
+        timeline = postings[0].timeline if postings else self._timeline
+        memberships = [posting.members for posting in postings[1:]]
+        start, stop = self._bounds(timeline, since, until, after)
+        if not memberships:
+            end = stop if limit is None else min(stop, start + limit)
+            return [response_id for _, response_id in timeline[start:end]]
+        response_ids: list[str] = []
+        for position in range(start, stop):
+            response_id = timeline[position][1]
+            if all(response_id in members for members in memberships):
+                response_ids.append(response_id)
+                if len(response_ids) == limit:
+                    break
+        return response_ids
+
+    def clear(self) -> None:
+        self._timeline.clear()
+        self._by_form.clear()
+        self._by_user.clear()
+        self._by_tag.clear()
+
+    @staticmethod
+    def _bounds(
+        timeline: list[SortKey], since: int | None, until: int | None, after: SortKey | None
+    ) -> tuple[int, int]:
+        start = bisect_right(timeline, after) if after is not None else 0
+        if since is not None or until is not None:
+            lower = max(
+                since if since is not None else MISSING_TIMESTAMP + 1, MISSING_TIMESTAMP + 1
+            )
+            start = max(start, bisect_left(timeline, (lower, "")))
+        stop = bisect_left(timeline, (until, "")) if until is not None else len(timeline)
+        return start, max(start, stop)
+
+    @staticmethod
+    def _add_posting(index: dict[K, _Posting], value: K, key: SortKey) -> None:
+        posting = index.get(value)
+        if posting is None:
+            posting = index[value] = _Posting()
+        posting.add(key)
+
+    @staticmethod
+    def _remove_posting(index: dict[K, _Posting], value: K, key: SortKey) -> None:
+        posting = index.get(value)
+        if posting is None:
+            return
+        posting.remove(key)
+        if not posting.members:
+            del index[value]
+
+
+def _insert_sorted(timeline: list[SortKey], key: SortKey) -> None:
+    if not timeline or timeline[-1] < key:
+        timeline.append(key)
+    else:
+        insort(timeline, key)
+
+
+def _remove_sorted(timeline: list[SortKey], key: SortKey) -> None:
+    position = bisect_left(timeline, key)
+    if position < len(timeline) and timeline[position] == key:
+        del timeline[position]
@@ -0,0 +1,181 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from domain.value_objects.response_columns import (
+    MISSING_CODE,
+    MISSING_INTEGER,
+    EncodedColumn,
+    ResponseColumns,
+)
+from domain.value_objects.response_id import ResponseId
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - EPOCH) // ONE_MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _datetime_to_str(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _datetime_from_str(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def question_to_dict(question: Question) -> dict[str, Any]:
+    return {
+        "id": str(question.id),
+        "type": question.type.value,
+        "text": question.text.translations,
+        "required": question.required,
+        "options": [opt.translations for opt in question.options] if question.options else None,
+        "min_rating": question.min_rating,
+        "max_rating": question.max_rating,
+        "created_at": _datetime_to_str(question.created_at),
+        "updated_at": _datetime_to_str(question.updated_at),
+    }
+
+
+def question_from_dict(data: dict[str, Any]) -> Question:
+    options = data.get("options")
+    return Question(
+        id=QuestionId(data["id"]),
+        type=QuestionType(data["type"]),
+        text=MultilingualText(data["text"]),
+        required=data["required"],
+        options=[MultilingualText(opt) for opt in options] if options else None,
+        min_rating=data.get("min_rating"),
+        max_rating=data.get("max_rating"),
+        created_at=_datetime_from_str(data.get("created_at")),
+        updated_at=_datetime_from_str(data.get("updated_at")),
+    )
+
+
+def form_to_dict(form: Form) -> dict[str, Any]:
+    return {
+        "id": str(form.id),
+        "type": form.type.value,
+        "name": form.name.translations,
+        "description": form.description.translations if form.description else None,
+        "questions": [question_to_dict(q) for q in form.questions],
+        "created_at": _datetime_to_str(form.created_at),
+        "updated_at": _datetime_to_str(form.updated_at),
+    }
+
+
+def form_from_dict(data: dict[str, Any]) -> Form:
+    description = data.get("description")
+    return Form(
+        id=FormId(data["id"]),
+        type=FormType(data["type"]),
+        name=MultilingualText(data["name"]),
+        description=MultilingualText(description) if description else None,
+        questions=[question_from_dict(q) for q in data.get("questions", [])],
+        created_at=_datetime_from_str(data.get("created_at")),
+        updated_at=_datetime_from_str(data.get("updated_at")),
+    )
+
+
+def answers_to_list(answers: list[Answer]) -> list[list[Any]]:
+    return [[str(answer.question_id), answer.value] for answer in answers]
+
+
+def answers_from_list(data: list[list[Any]]) -> list[Answer]:
+    return [Answer(question_id=QuestionId(question_id), value=value) for question_id, value in data]
+
+
+def response_to_dict(response: Response) -> dict[str, Any]:
+    return {
+        "id": str(response.id),
+        "form_id": str(response.form_id),
+        "answers": answers_to_list(response.answers),
+        "tags": response.tags,
+        "user_id": response.user_id,
+        "submitted_at": _datetime_to_str(response.submitted_at),
+    }
+
+
+def response_from_dict(data: dict[str, Any]) -> Response:
+    return Response(
+        id=ResponseId(data["id"]),
+        form_id=FormId(data["form_id"]),
+        answers=answers_from_list(data["answers"]),
+        tags=dict(data.get("tags") or {}),
+        user_id=data.get("user_id"),
+        submitted_at=_datetime_from_str(data.get("submitted_at")),
+    )
+
+
+def responses_to_columns(responses: Sequence[Response]) -> ResponseColumns:
+    rows = len(responses)
+    user_ids = _ColumnEncoder(rows)
+    tags: dict[str, _ColumnEncoder] = {}
+    ratings: dict[str, list[int]] = {}
+    answers: dict[str, list[str | list[str] | None]] = {}
+    for row, response in enumerate(responses):
+        user_ids.set(row, response.user_id)
+        for key, tag_value in response.tags.items():
+            encoder = tags.get(key)
+            if encoder is None:
+                encoder = tags[key] = _ColumnEncoder(rows)
+            encoder.set(row, tag_value)
+        for answer in response.answers:
+            question_id = str(answer.question_id)
+            value = answer.value
+            if isinstance(value, int):
+                column = ratings.get(question_id)
+                if column is None:
+                    column = ratings[question_id] = [MISSING_INTEGER] * rows
+                column[row] = value
+            else:
+                other = answers.get(question_id)
+                if other is None:
+                    other = answers[question_id] = [None] * rows
+                other[row] = value
+    return ResponseColumns(
+        response_ids=[str(response.id) for response in responses],
+        submitted_at=[
+            to_epoch_micros(response.submitted_at) if response.submitted_at else MISSING_INTEGER
+            for response in responses
+        ],
+        user_ids=user_ids.column(),
+        tags={key: encoder.column() for key, encoder in tags.items()},
+        ratings=ratings,
+        answers=answers,
+    )
+
+
+class _ColumnEncoder:
+    def __init__(self, rows: int) -> None:
+        self._codes = [MISSING_CODE] * rows
+        self._lookup: dict[str, int] = {}
+
+    def set(self, row: int, value: str | None) -> None:
+        if value is None:
+            return
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self._lookup)
+        self._codes[row] = code
+
+    def column(self) -> EncodedColumn:
+        return EncodedColumn(self._codes, list(self._lookup))
@@ -0,0 +1,158 @@
+import asyncio
+import fcntl
+import json
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from domain.entities.form import Form
+from infrastructure.persistence.serialization import form_from_dict, form_to_dict
+
+MAGIC = b"FFCATLG\x00"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQQ")
+_STATE = struct.Struct("<QQQ")
+_STATE_OFFSET = 16
+_READ_ATTEMPTS = 8
+
+Records = dict[str, list[Any]]
+
+
+class SharedFormCatalog:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked(fcntl.LOCK_EX):
+            if os.fstat(self._fd).st_size == 0:
+                os.pwrite(self._fd, _HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0, _HEADER.size, 0), 0)
+        if os.fstat(self._fd).st_size < _HEADER.size:
+            os.close(self._fd)
+            msg = f"{self.path} is not a form catalog"
+            raise ValueError(msg)
+        self._header = mmap.mmap(self._fd, _HEADER.size)
+        magic, version, *_ = _HEADER.unpack_from(self._header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            msg = f"{self.path} is not a version {FORMAT_VERSION} form catalog"
+            raise ValueError(msg)
+        self._generation = -1
+        self._records: Records = {}
+        self._forms: dict[str, Form] = {}
+        self._listeners: list[Callable[[str], None]] = []
+
+    @property
+    def generation(self) -> int:
+        generation, _, _ = _STATE.unpack_from(self._header, _STATE_OFFSET)
+        return int(generation)
+
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        self._listeners.append(listener)
+
+    def refresh(self) -> None:
+        if self.generation > self._generation:
+            self._load(*self._read())
+
+    def get(self, form_id: str) -> Form | None:
+        self.refresh()
+        return self._form(form_id) if form_id in self._records else None
+
+    def forms(self) -> list[Form]:
+        self.refresh()
+        return [self._form(form_id) for form_id in self._records]
+
+    async def put(self, form: Form, *, must_exist: bool = False) -> None:
+        form_id = str(form.id)
+        data = form_to_dict(form)
+
+        def put(generation: int, records: Records) -> None:
+            if must_exist and form_id not in records:
+                msg = f"Form with id {form_id} not found"
+                raise ValueError(msg)
+            records[form_id] = [generation, data]
+
+        self._load(*await asyncio.to_thread(self._update, put))
+
+    async def remove(self, form_id: str) -> None:
+        def remove(_: int, records: Records) -> None:
+            if records.pop(form_id, None) is None:
+                msg = f"Form with id {form_id} not found"
+                raise ValueError(msg)
+
+        self._load(*await asyncio.to_thread(self._update, remove))
+
+    def close(self) -> None:
+        if not self._header.closed:
+            self._header.close()
+            os.close(self._fd)
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._records)
+
+    def _form(self, form_id: str) -> Form:
+        form = self._forms.get(form_id)
+        if form is None:
+            form = self._forms[form_id] = form_from_dict(self._records[form_id][1])
+        return form
+
+    def _read(self) -> tuple[int, Records]:
+        for _ in range(_READ_ATTEMPTS):
+            state = _STATE.unpack_from(self._header, _STATE_OFFSET)
+            generation, offset, length = state
+            body = os.pread(self._fd, length, offset) if length else b"{}"
+            if _STATE.unpack_from(self._header, _STATE_OFFSET) != state:
+                continue
+            try:
+                return int(generation), json.loads(body)
+            except json.JSONDecodeError as e:
+                msg = f"{self.path} has a corrupt body at generation {generation}"
+                raise ValueError(msg) from e
+        msg = f"{self.path} kept changing while it was read"
+        raise ValueError(msg)
+
+    def _update(self, mutate: Callable[[int, Records], None]) -> tuple[int, Records]:
+        with self._locked(fcntl.LOCK_EX):
+            generation, records = self._read()
+            mutate(generation + 1, records)
+            self._write(generation + 1, records)
+        return generation + 1, records
+
+    def _write(self, generation: int, records: Records) -> None:
+        body = json.dumps(records, separators=(",", ":")).encode()
+        _, offset, length = _STATE.unpack_from(self._header, _STATE_OFFSET)
+        start = _HEADER.size if len(body) <= offset - _HEADER.size else offset + length
+        os.pwrite(self._fd, body, start)
+        os.fdatasync(self._fd)
+        _STATE.pack_into(self._header, _STATE_OFFSET, generation, start, len(body))
+        self._header.flush()
+        os.ftruncate(self._fd, start + len(body))
+
+    def _load(self, generation: int, records: Records) -> None:
+        if generation <= self._generation:
+            return
+        previous = self._records
+        self._records = records
+        self._generation = generation
+        changed = [
+            form_id
+            for form_id, record in previous.items()
+            if form_id not in records or records[form_id][0] != record[0]
+        ]
+        for form_id in changed:
+            self._forms.pop(form_id, None)
+            for listener in self._listeners:
+                listener(form_id)
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        fcntl.flock(self._fd, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
@@ -0,0 +1,33 @@
+from domain.entities.form import Form
+from domain.repositories.form_repository import FormRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from infrastructure.persistence.shared_form_catalog import SharedFormCatalog
+
+
+class SharedFormRepository(FormRepository):
+    def __init__(self, catalog: SharedFormCatalog) -> None:
+        self._catalog = catalog
+
+    async def create(self, form: Form) -> Form:
+        await self._catalog.put(form)
+        return form
+
+    async def get_by_id(self, form_id: FormId) -> Form | None:
+        return self._catalog.get(str(form_id))
+
+    async def get_all(self, form_type: FormType | None = None) -> list[Form]:
+        forms = self._catalog.forms()
+        if form_type:
+            forms = [f for f in forms if f.type == form_type]
+        return forms
+
+    async def update(self, form: Form) -> Form:
+        await self._catalog.put(form, must_exist=True)
+        return form
+
+    async def delete(self, form_id: FormId) -> None:
+        await self._catalog.remove(str(form_id))
+
+    def __len__(self) -> int:
+        return len(self._catalog)
@@ -0,0 +1,163 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.entities.response import Response
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE, ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.response_columns import ResponseColumns
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.binary_snapshot import BinarySnapshot, Rows
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+from infrastructure.persistence.response_index import SortKey, sort_key
+from infrastructure.persistence.serialization import responses_to_columns
+
+_MIN_WINDOW = 1_024
+
+
+class SnapshotResponseRepository(ResponseRepository):
+    def __init__(
+        self, snapshot: BinarySnapshot, overlay: MockResponseRepository | None = None
+    ) -> None:
+        self._snapshot = snapshot
+        self._overlay = overlay if overlay is not None else MockResponseRepository()
+        self._deleted: npt.NDArray[np.bool_] | None = None
+        self._deleted_count = 0
+
+    async def create(self, response: Response) -> Response:
+        self._delete_row(self._snapshot.row(str(response.id)))
+        return await self._overlay.create(response)
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        for response in responses:
+            self._delete_row(self._snapshot.row(str(response.id)))
+        return await self._overlay.create_many(responses)
+
+    async def get_by_id(self, response_id: ResponseId) -> Response | None:
+        response = await self._overlay.get_by_id(response_id)
+        if response is not None:
+            return response
+        row = self._snapshot.row(str(response_id))
+        if row is None or self._is_deleted(row):
+            return None
+        return self._snapshot.response(row)
+
+    async def get_by_form_id(self, form_id: FormId) -> list[Response]:
+        rows = self._select(self._snapshot.form_rows(str(form_id)), [], None)
+        return self._responses(rows) + await self._overlay.get_by_form_id(form_id)
+
+    async def get_all(self) -> list[Response]:
+        rows = self._select(range(len(self._snapshot)), [], None)
+        return self._responses(rows) + await self._overlay.get_all()
+
+    async def get_by_user_id(self, user_id: str) -> list[Response]:
+        rows = self._select(self._snapshot.user_rows(user_id), [], None)
+        return self._responses(rows) + await self._overlay.get_by_user_id(user_id)
+
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        rows = self._select(self._snapshot.user_rows(user_id), [], None)
+        deleted = self._responses(rows)
+        for row in rows:
+            self._delete_row(int(row))
+        return deleted + await self._overlay.delete_by_user_id(user_id)
+
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        snapshot = self._snapshot
+        postings: list[Rows] = []
+        if form_id is not None:
+            postings.append(snapshot.form_rows(str(form_id)))
+        if user_id is not None:
+            postings.append(snapshot.user_rows(user_id))
+        postings.extend(snapshot.tag_rows(key, value) for key, value in (tags or {}).items())
+        postings.sort(key=len)
+        start, stop = snapshot.bounds(since=since, until=until, after=after)
+        candidates: Rows | range
+        if postings:
+            smallest = postings[0]
+            candidates = smallest[
+                np.searchsorted(smallest, start) : np.searchsorted(smallest, stop)
+            ]
+        else:
+            candidates = range(start, stop)
+        base = self._responses(self._select(candidates, postings[1:], limit))
+        overlay = await self._overlay.query(
+            form_id=form_id,
+            user_id=user_id,
+            tags=tags,
+            since=since,
+            until=until,
+            after=after,
+            limit=limit,
+        )
+        if not overlay:
+            return base
+        return list(islice(merge(base, overlay, key=_sort_key), limit))
+
+    async def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
+        async for page in self.iter_pages(form_id=form_id, page_size=page_size):
+            yield responses_to_columns(page)
+
+    def __len__(self) -> int:
+        return len(self._snapshot) - self._deleted_count + len(self._overlay)
+
+    def _responses(self, rows: Rows) -> list[Response]:
+        snapshot = self._snapshot
+        return [snapshot.response(int(row)) for row in rows]
+
+    def _select(self, candidates: Rows | range, required: list[Rows], limit: int | None) -> Rows:
+        window = len(candidates) if limit is None else max(limit, _MIN_WINDOW)
+        selected: list[Rows] = []
+        found = 0
+        for position in range(0, len(candidates), max(window, 1)):
+            chunk = candidates[position : position + window]
+            rows = np.arange(chunk.start, chunk.stop) if isinstance(chunk, range) else chunk
+            for posting in required:
+                rows = rows[_contains(posting, rows)]
+            if self._deleted is not None:
+                rows = rows[~self._deleted[rows]]
+            selected.append(rows)
+            found += len(rows)
+            if limit is not None and found >= limit:
+                break
+        if not selected:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(selected)[:limit]
+
+    def _is_deleted(self, row: int) -> bool:
+        return self._deleted is not None and bool(self._deleted[row])
+
+    def _delete_row(self, row: int | None) -> None:
+        if row is None or self._is_deleted(row):
+            return
+        if self._deleted is None:
+            self._deleted = np.zeros(len(self._snapshot), dtype=np.bool_)
+        self._deleted[row] = True
+        self._deleted_count += 1
+
+
+def _contains(posting: Rows, rows: Rows) -> npt.NDArray[np.bool_]:
+    if not len(posting):
+        return np.zeros(len(rows), dtype=np.bool_)
+    positions = np.minimum(np.searchsorted(posting, rows), len(posting) - 1)
+    return np.equal(posting[positions], rows)
+
+
+def _sort_key(response: Response) -> SortKey:
+    return sort_key(response.submitted_at, str(response.id))
@@ -0,0 +1,161 @@
+import asyncio
+import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+BUSY_TIMEOUT_MS = 5000
+CACHED_STATEMENTS = 256
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS forms (
+        id TEXT PRIMARY KEY,
+        type TEXT NOT NULL,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_forms_type ON forms (type)",
+    """
+    CREATE TABLE IF NOT EXISTS responses (
+        id TEXT PRIMARY KEY,
+        form_id TEXT NOT NULL,
+        user_id TEXT,
+        submitted_at INTEGER,
+        tags TEXT NOT NULL,
+        answers TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_responses_form_id ON responses (form_id, submitted_at, id)",
+    "DROP INDEX IF EXISTS ix_responses_user_id",
+    "CREATE INDEX IF NOT EXISTS ix_responses_user ON responses (user_id, submitted_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_responses_submitted_at ON responses (submitted_at, id)",
+    """
+    CREATE TABLE IF NOT EXISTS response_tags (
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        response_id TEXT NOT NULL,
+        PRIMARY KEY (key, value, response_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_response_tags_response_id ON response_tags (response_id)",
+    """
+    CREATE TABLE IF NOT EXISTS form_aggregates (
+        form_id TEXT PRIMARY KEY,
+        response_count INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS question_aggregates (
+        form_id TEXT NOT NULL,
+        question_id TEXT NOT NULL,
+        answer_count INTEGER NOT NULL,
+        rating_count INTEGER NOT NULL,
+        rating_sum INTEGER NOT NULL,
+        rating_sum_squares INTEGER NOT NULL,
+        PRIMARY KEY (form_id, question_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rating_counts (
+        form_id TEXT NOT NULL,
+        question_id TEXT NOT NULL,
+        rating INTEGER NOT NULL,
+        answer_count INTEGER NOT NULL,
+        PRIMARY KEY (form_id, question_id, rating)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS option_counts (
+        form_id TEXT NOT NULL,
+        question_id TEXT NOT NULL,
+        option TEXT NOT NULL,
+        answer_count INTEGER NOT NULL,
+        PRIMARY KEY (form_id, question_id, option)
+    ) WITHOUT ROWID
+    """,
+)
+HAS_RESPONSE_TAGS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'response_tags'"
+BACKFILL_RESPONSE_TAGS = """
+    INSERT OR IGNORE INTO response_tags (key, value, response_id)
+    SELECT tag.key, tag.value, responses.id FROM responses, json_each(responses.tags) AS tag
+"""
+
+HAS_FORM_AGGREGATES = (
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'form_aggregates'"
+)
+RATING_ANSWER = "json_type(answer.value, '$[1]') = 'integer'"
+RATING_VALUE = "json_extract(answer.value, '$[1]')"
+BACKFILL_FORM_AGGREGATES = (
+    """
+    INSERT INTO form_aggregates (form_id, response_count)
+    SELECT form_id, COUNT(*) FROM responses GROUP BY form_id
+    """,
+    f"""
+    INSERT INTO question_aggregates
+        (form_id, question_id, answer_count, rating_count, rating_sum, rating_sum_squares)
+    SELECT
+        responses.form_id,
+        json_extract(answer.value, '$[0]'),
+        COUNT(*),
+        SUM({RATING_ANSWER}),
+        SUM(IIF({RATING_ANSWER}, {RATING_VALUE}, 0)),
+        SUM(IIF({RATING_ANSWER}, {RATING_VALUE} * {RATING_VALUE}, 0))
+    FROM responses, json_each(responses.answers) AS answer
+    GROUP BY 1, 2
+    """,
+    f"""
+    INSERT INTO rating_counts (form_id, question_id, rating, answer_count)
+    SELECT responses.form_id, json_extract(answer.value, '$[0]'), {RATING_VALUE}, COUNT(*)
+    FROM responses, json_each(responses.answers) AS answer
+    WHERE {RATING_ANSWER}
+    GROUP BY 1, 2, 3
+    """,
+    """
+    INSERT INTO option_counts (form_id, question_id, option, answer_count)
+    SELECT responses.form_id, json_extract(answer.value, '$[0]'), option.value, COUNT(*)
+    FROM responses, json_each(responses.answers) AS answer,
+        json_each(answer.value, '$[1]') AS option
+    WHERE json_type(answer.value, '$[1]') = 'array'
+    GROUP BY 1, 2, 3
+    """,
+)
+
+
+class SQLiteDatabase:
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._connection = self._executor.submit(self._connect).result()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        with connection:
+            backfill_tags = connection.execute(HAS_RESPONSE_TAGS).fetchone() is None
+            backfill_aggregates = connection.execute(HAS_FORM_AGGREGATES).fetchone() is None
+            for statement in SCHEMA:
+                connection.execute(statement)
+            if backfill_tags:
+                connection.execute(BACKFILL_RESPONSE_TAGS)
+            if backfill_aggregates:
+                for statement in BACKFILL_FORM_AGGREGATES:
+                    connection.execute(statement)
+        return connection
+
+    async def run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, operation, self._connection)
+
+    def close(self) -> None:
+        self._executor.submit(self._connection.close).result()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,143 @@
+import sqlite3
+from collections.abc import Iterable
+
+from application.analytics.response_aggregator import (
+    FormAggregate,
+    FormAggregateStore,
+    QuestionAggregate,
+    ResponseAggregator,
+)
+from domain.entities.response import Response
+from infrastructure.persistence.sqlite_database import SQLiteDatabase
+
+UPSERT_FORM_AGGREGATE = """
+    INSERT INTO form_aggregates (form_id, response_count) VALUES (?, ?)
+    ON CONFLICT (form_id) DO UPDATE SET response_count = response_count + excluded.response_count
+"""
+UPSERT_QUESTION_AGGREGATE = """
+    INSERT INTO question_aggregates
+        (form_id, question_id, answer_count, rating_count, rating_sum, rating_sum_squares)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (form_id, question_id) DO UPDATE SET
+        answer_count = answer_count + excluded.answer_count,
+        rating_count = rating_count + excluded.rating_count,
+        rating_sum = rating_sum + excluded.rating_sum,
+        rating_sum_squares = rating_sum_squares + excluded.rating_sum_squares
+"""
+UPSERT_RATING_COUNT = """
+    INSERT INTO rating_counts (form_id, question_id, rating, answer_count) VALUES (?, ?, ?, ?)
+    ON CONFLICT (form_id, question_id, rating) DO UPDATE SET
+        answer_count = answer_count + excluded.answer_count
+"""
+UPSERT_OPTION_COUNT = """
+    INSERT INTO option_counts (form_id, question_id, option, answer_count) VALUES (?, ?, ?, ?)
+    ON CONFLICT (form_id, question_id, option) DO UPDATE SET
+        answer_count = answer_count + excluded.answer_count
+"""
+PRUNE_FORM_AGGREGATES = (
+    "DELETE FROM rating_counts WHERE form_id = ? AND answer_count <= 0",
+    "DELETE FROM option_counts WHERE form_id = ? AND answer_count <= 0",
+    "DELETE FROM question_aggregates WHERE form_id = ? AND answer_count <= 0",
+    "DELETE FROM form_aggregates WHERE form_id = ? AND response_count <= 0",
+)
+SELECT_FORM_AGGREGATE = "SELECT response_count FROM form_aggregates WHERE form_id = ?"
+SELECT_QUESTION_AGGREGATES = """
+    SELECT question_id, answer_count, rating_count, rating_sum, rating_sum_squares
+    FROM question_aggregates WHERE form_id = ?
+"""
+SELECT_RATING_COUNTS = (
+    "SELECT question_id, rating, answer_count FROM rating_counts WHERE form_id = ?"
+)
+SELECT_OPTION_COUNTS = (
+    "SELECT question_id, option, answer_count FROM option_counts WHERE form_id = ?"
+)
+
+
+def apply_aggregate_changes(
+    connection: sqlite3.Connection, added: Iterable[Response], removed: Iterable[Response]
+) -> None:
+    removed_form_ids: set[str] = set()
+    for responses, sign in ((added, 1), (removed, -1)):
+        aggregator = ResponseAggregator()
+        aggregator.add_many(responses)
+        for form_id, aggregate in aggregator.aggregates().items():
+            if sign < 0:
+                removed_form_ids.add(form_id)
+            _apply_form_aggregate(connection, form_id, aggregate, sign)
+    for form_id in removed_form_ids:
+        for statement in PRUNE_FORM_AGGREGATES:
+            connection.execute(statement, (form_id,))
+
+
+def _apply_form_aggregate(
+    connection: sqlite3.Connection, form_id: str, aggregate: FormAggregate, sign: int
+) -> None:
+    connection.execute(UPSERT_FORM_AGGREGATE, (form_id, sign * aggregate.response_count))
+    connection.executemany(
+        UPSERT_QUESTION_AGGREGATE,
+        [
+            (
+                form_id,
+                question_id,
+                sign * question.answer_count,
+                sign * question.rating_count,
+                sign * question.rating_sum,
+                sign * question.rating_sum_squares,
+            )
+            for question_id, question in aggregate.questions.items()
+        ],
+    )
+    connection.executemany(
+        UPSERT_RATING_COUNT,
+        [
+            (form_id, question_id, rating, sign * count)
+            for question_id, question in aggregate.questions.items()
+            for rating, count in question.rating_histogram.items()
+        ],
+    )
+    connection.executemany(
+        UPSERT_OPTION_COUNT,
+        [
+            (form_id, question_id, option, sign * count)
+            for question_id, question in aggregate.questions.items()
+            for option, count in question.option_counts.items()
+        ],
+    )
+
+
+class SQLiteFormAggregateStore(FormAggregateStore):
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self._database = database
+
+    async def get(self, form_id: str) -> FormAggregate | None:
+        def select(connection: sqlite3.Connection) -> FormAggregate | None:
+            connection.execute("BEGIN")
+            try:
+                row = connection.execute(SELECT_FORM_AGGREGATE, (form_id,)).fetchone()
+                if row is None:
+                    return None
+                aggregate = FormAggregate(response_count=row[0])
+                for question_id, *counts in connection.execute(
+                    SELECT_QUESTION_AGGREGATES, (form_id,)
+                ):
+                    aggregate.questions[question_id] = QuestionAggregate(*counts)
+                for question_id, rating, count in connection.execute(
+                    SELECT_RATING_COUNTS, (form_id,)
+                ):
+                    _question(aggregate, question_id).rating_histogram[rating] = count
+                for question_id, option, count in connection.execute(
+                    SELECT_OPTION_COUNTS, (form_id,)
+                ):
+                    _question(aggregate, question_id).option_counts[option] = count
+                return aggregate
+            finally:
+                connection.rollback()
+
+        return await self._database.run(select)
+
+
+def _question(aggregate: FormAggregate, question_id: str) -> QuestionAggregate:
+    question = aggregate.questions.get(question_id)
+    if question is None:
+        question = aggregate.questions[question_id] = QuestionAggregate()
+    return question
@@ -0,0 +1,73 @@
+import json
+import sqlite3
+
+from domain.entities.form import Form
+from domain.repositories.form_repository import FormRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from infrastructure.persistence.serialization import form_from_dict, form_to_dict
+from infrastructure.persistence.sqlite_database import SQLiteDatabase
+
+INSERT_FORM = "INSERT OR REPLACE INTO forms (id, type, data) VALUES (?, ?, ?)"
+UPDATE_FORM = "UPDATE forms SET type = ?, data = ? WHERE id = ?"
+SELECT_FORM_BY_ID = "SELECT data FROM forms WHERE id = ?"
+SELECT_ALL_FORMS = "SELECT data FROM forms ORDER BY rowid"
+SELECT_FORMS_BY_TYPE = "SELECT data FROM forms WHERE type = ? ORDER BY rowid"
+DELETE_FORM = "DELETE FROM forms WHERE id = ?"
+
+
+class SQLiteFormRepository(FormRepository):
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self._database = database
+
+    async def create(self, form: Form) -> Form:
+        data = json.dumps(form_to_dict(form), ensure_ascii=False)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute(INSERT_FORM, (str(form.id), form.type.value, data))
+
+        await self._database.run(insert)
+        return form
+
+    async def get_by_id(self, form_id: FormId) -> Form | None:
+        def select(connection: sqlite3.Connection) -> str | None:
+            row = connection.execute(SELECT_FORM_BY_ID, (str(form_id),)).fetchone()
+            return row[0] if row else None
+
+        data = await self._database.run(select)
+        return form_from_dict(json.loads(data)) if data else None
+
+    async def get_all(self, form_type: FormType | None = None) -> list[Form]:
+        def select(connection: sqlite3.Connection) -> list[str]:
+            if form_type:
+                cursor = connection.execute(SELECT_FORMS_BY_TYPE, (form_type.value,))
+            else:
+                cursor = connection.execute(SELECT_ALL_FORMS)
+            return [row[0] for row in cursor]
+
+        rows = await self._database.run(select)
+        return [form_from_dict(json.loads(data)) for data in rows]
+
+    async def update(self, form: Form) -> Form:
+        data = json.dumps(form_to_dict(form), ensure_ascii=False)
+
+        def update(connection: sqlite3.Connection) -> int:
+            with connection:
+                cursor = connection.execute(UPDATE_FORM, (form.type.value, data, str(form.id)))
+            return cursor.rowcount
+
+        if await self._database.run(update) == 0:
+            msg = f"Form with id {form.id} not found"
+            raise ValueError(msg)
+        return form
+
+    async def delete(self, form_id: FormId) -> None:
+        def delete(connection: sqlite3.Connection) -> int:
+            with connection:
+                cursor = connection.execute(DELETE_FORM, (str(form_id),))
+            return cursor.rowcount
+
+        if await self._database.run(delete) == 0:
+            msg = f"Form with id {form_id} not found"
+            raise ValueError(msg)
@@ -0,0 +1,222 @@
+import json
+import sqlite3
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from domain.entities.response import Response
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE, ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.response_columns import ResponseColumns
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.serialization import (
+    answers_from_list,
+    answers_to_list,
+    from_epoch_micros,
+    responses_to_columns,
+    to_epoch_micros,
+)
+from infrastructure.persistence.sqlite_database import SQLiteDatabase
+from infrastructure.persistence.sqlite_form_aggregate_store import apply_aggregate_changes
+
+ResponseRow = tuple[str, str, str | None, int | None, str, str]
+
+RESPONSE_COLUMNS = "id, form_id, user_id, submitted_at, tags, answers"
+INSERT_RESPONSE = f"INSERT OR REPLACE INTO responses ({RESPONSE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+SELECT_RESPONSE_BY_ID = f"SELECT {RESPONSE_COLUMNS} FROM responses WHERE id = ?"
+SELECT_RESPONSES_BY_FORM = (
+    f"SELECT {RESPONSE_COLUMNS} FROM responses WHERE form_id = ? ORDER BY rowid"
+)
+SELECT_RESPONSES_BY_USER = (
+    f"SELECT {RESPONSE_COLUMNS} FROM responses WHERE user_id = ? ORDER BY rowid"
+)
+SELECT_ALL_RESPONSES = f"SELECT {RESPONSE_COLUMNS} FROM responses ORDER BY rowid"
+DELETE_RESPONSE_BY_ID = f"DELETE FROM responses WHERE id = ? RETURNING {RESPONSE_COLUMNS}"
+DELETE_RESPONSES_BY_USER = f"DELETE FROM responses WHERE user_id = ? RETURNING {RESPONSE_COLUMNS}"
+INSERT_RESPONSE_TAG = (
+    "INSERT OR IGNORE INTO response_tags (key, value, response_id) VALUES (?, ?, ?)"
+)
+DELETE_RESPONSE_TAGS = "DELETE FROM response_tags WHERE response_id = ?"
+DELETE_RESPONSE_TAGS_BY_USER = (
+    "DELETE FROM response_tags WHERE response_id IN (SELECT id FROM responses WHERE user_id = ?)"
+)
+TAG_CONDITION = "id IN (SELECT response_id FROM response_tags WHERE key = ? AND value = ?)"
+SELECT_RESPONSES_PAGE = (
+    f"SELECT {RESPONSE_COLUMNS} FROM responses{{where}} ORDER BY submitted_at, id"
+)
+AFTER_TIMESTAMP_CONDITION = "(submitted_at, id) > (?, ?)"
+AFTER_MISSING_TIMESTAMP_CONDITION = (
+    "((submitted_at IS NULL AND id > ?) OR submitted_at IS NOT NULL)"
+)
+
+
+def _to_row(response: Response) -> ResponseRow:
+    return (
+        str(response.id),
+        str(response.form_id),
+        response.user_id,
+        to_epoch_micros(response.submitted_at) if response.submitted_at else None,
+        json.dumps(response.tags, ensure_ascii=False),
+        json.dumps(answers_to_list(response.answers), ensure_ascii=False),
+    )
+
+
+def _to_tag_rows(response: Response) -> list[tuple[str, str, str]]:
+    response_id = str(response.id)
+    return [(key, value, response_id) for key, value in response.tags.items()]
+
+
+def _build_page_query(  # noqa: PLR0913
+    *,
+    form_id: FormId | None,
+    user_id: str | None,
+    tags: dict[str, str] | None,
+    since: datetime | None,
+    until: datetime | None,
+    after: ResponseCursor | None,
+    limit: int | None,
+) -> tuple[str, tuple[Any, ...]]:
+    conditions: list[str] = []
+    parameters: list[Any] = []
+    if form_id is not None:
+        conditions.append("form_id = ?")
+        parameters.append(str(form_id))
+    if user_id is not None:
+        conditions.append("user_id = ?")
+        parameters.append(user_id)
+    for key, value in (tags or {}).items():
+        conditions.append(TAG_CONDITION)
+        parameters.extend((key, value))
+    if since is not None:
+        conditions.append("submitted_at >= ?")
+        parameters.append(to_epoch_micros(since))
+    if until is not None:
+        conditions.append("submitted_at < ?")
+        parameters.append(to_epoch_micros(until))
+    if after is not None and after.submitted_at is not None:
+        conditions.append(AFTER_TIMESTAMP_CONDITION)
+        parameters.extend((to_epoch_micros(after.submitted_at), after.response_id))
+    elif after is not None:
+        conditions.append(AFTER_MISSING_TIMESTAMP_CONDITION)
+        parameters.append(after.response_id)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = SELECT_RESPONSES_PAGE.format(where=where)
+    if limit is not None:
+        query += " LIMIT ?"
+        parameters.append(limit)
+    return query, tuple(parameters)
+
+
+def _from_row(row: tuple[Any, ...]) -> Response:
+    response_id, form_id, user_id, submitted_at, tags, answers = row
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId(form_id),
+        answers=answers_from_list(json.loads(answers)),
+        tags=json.loads(tags),
+        user_id=user_id,
+        submitted_at=from_epoch_micros(submitted_at) if submitted_at is not None else None,
+    )
+
+
+class SQLiteResponseRepository(ResponseRepository):
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self._database = database
+
+    async def create(self, response: Response) -> Response:
+        row = _to_row(response)
+        tag_rows = _to_tag_rows(response)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute(DELETE_RESPONSE_TAGS, (row[0],))
+                replaced = connection.execute(DELETE_RESPONSE_BY_ID, (row[0],)).fetchall()
+                connection.execute(INSERT_RESPONSE, row)
+                connection.executemany(INSERT_RESPONSE_TAG, tag_rows)
+                apply_aggregate_changes(connection, [response], map(_from_row, replaced))
+
+        await self._database.run(insert)
+        return response
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        rows = [_to_row(response) for response in responses]
+        tag_rows = [tag_row for response in responses for tag_row in _to_tag_rows(response)]
+
+        def insert(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.executemany(DELETE_RESPONSE_TAGS, [(row[0],) for row in rows])
+                replaced: list[tuple[Any, ...]] = []
+                for row in rows:
+                    replaced.extend(connection.execute(DELETE_RESPONSE_BY_ID, (row[0],)))
+                    connection.execute(INSERT_RESPONSE, row)
+                connection.executemany(INSERT_RESPONSE_TAG, tag_rows)
+                apply_aggregate_changes(connection, responses, map(_from_row, replaced))
+
+        await self._database.run(insert)
+        return responses
+
+    async def get_by_id(self, response_id: ResponseId) -> Response | None:
+        def select(connection: sqlite3.Connection) -> tuple[Any, ...] | None:
+            row: tuple[Any, ...] | None = connection.execute(
+                SELECT_RESPONSE_BY_ID, (str(response_id),)
+            ).fetchone()
+            return row
+
+        row = await self._database.run(select)
+        return _from_row(row) if row else None
+
+    async def get_by_form_id(self, form_id: FormId) -> list[Response]:
+        return await self._select_many(SELECT_RESPONSES_BY_FORM, (str(form_id),))
+
+    async def get_all(self) -> list[Response]:
+        return await self._select_many(SELECT_ALL_RESPONSES, ())
+
+    async def get_by_user_id(self, user_id: str) -> list[Response]:
+        return await self._select_many(SELECT_RESPONSES_BY_USER, (user_id,))
+
+    async def delete_by_user_id(self, user_id: str) -> list[Response]:
+        def delete(connection: sqlite3.Connection) -> list[Response]:
+            with connection:
+                connection.execute(DELETE_RESPONSE_TAGS_BY_USER, (user_id,))
+                rows = connection.execute(DELETE_RESPONSES_BY_USER, (user_id,)).fetchall()
+                deleted = [_from_row(row) for row in rows]
+                apply_aggregate_changes(connection, [], deleted)
+                return deleted
+
+        return await self._database.run(delete)
+
+    async def query(  # noqa: PLR0913
+        self,
+        *,
+        form_id: FormId | None = None,
+        user_id: str | None = None,
+        tags: dict[str, str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ResponseCursor | None = None,
+        limit: int | None = None,
+    ) -> list[Response]:
+        query, parameters = _build_page_query(
+            form_id=form_id,
+            user_id=user_id,
+            tags=tags,
+            since=since,
+            until=until,
+            after=after,
+            limit=limit,
+        )
+        return await self._select_many(query, parameters)
+
+    async def iter_columns(
+        self, *, form_id: FormId, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[ResponseColumns]:
+        async for page in self.iter_pages(form_id=form_id, page_size=page_size):
+            yield responses_to_columns(page)
+
+    async def _select_many(self, query: str, parameters: tuple[Any, ...]) -> list[Response]:
+        def select(connection: sqlite3.Connection) -> list[tuple[Any, ...]]:
+            return connection.execute(query, parameters).fetchall()
+
+        rows = await self._database.run(select)
+        return [_from_row(row) for row in rows]
@@ -0,0 +1,28 @@
+from fastapi import Response, status
+
+from application.cache.form_payload_cache import FormPayload
+
+WEAK_ETAG_PREFIX = "W/"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for raw_candidate in if_none_match.split(","):
+        candidate = raw_candidate.strip()
+        if candidate == "*" or candidate.removeprefix(WEAK_ETAG_PREFIX) == etag:
+            return True
+    return False
+
+
+def form_payload_response(
+    payload: FormPayload,
+    if_none_match: str | None,
+    vary: str | None = None,
+) -> Response:
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if vary:
+        headers["Vary"] = vary
+    if etag_matches(if_none_match, payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
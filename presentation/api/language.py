@@ -0,0 +1,24 @@
+MAX_ACCEPTED_LANGUAGES = 8
+
+
+def parse_accept_language(header: str | None) -> list[str]:
+    if not header:
+        return []
+    weighted: list[tuple[float, int, str]] = []
+    for position, item in enumerate(header.split(",")):
+        tag, _, params = item.strip().partition(";")
+        tag = tag.strip()
+        if not tag or tag == "*":
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            weighted.append((-quality, position, tag))
+    weighted.sort()
+    return [tag for _, _, tag in weighted[:MAX_ACCEPTED_LANGUAGES]]
@@ -1,4 +1,4 @@
-import json
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -8,31 +8,29 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html
 from fastapi.openapi.utils import get_openapi
-from starlette.responses import HTMLResponse
-
-from infrastructure.config import get_form_repository, get_response_repository, get_settings
+from starlette.responses import HTMLResponse, Response
+
+from infrastructure.config import (
+    get_form_repository,
+    get_response_aggregator,
+    get_response_repository,
+    get_service_metrics,
+    get_settings,
+    get_snapshot,
+    response_aggregator_enabled,
+    seeding_enabled,
+    shutdown_dependencies,
+    snapshot_enabled,
+)
+from infrastructure.config.logging_config import configure_logging
+from infrastructure.metrics import CONTENT_TYPE
+from infrastructure.persistence.binary_snapshot import write_snapshot
 from infrastructure.persistence.seed_data import seed_database
+from presentation.api.middleware.metrics import MetricsMiddleware
 from presentation.api.routers import backoffice, gdpr, mobile
 
-
-class JSONFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
-        log_data = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
-        if hasattr(record, "extra") and record.extra:
-            log_data.update(record.extra)
-        return json.dumps(log_data)
-
-
-handler = logging.StreamHandler()
-handler.setFormatter(JSONFormatter())
-logging.basicConfig(level=logging.INFO, handlers=[handler])
+settings = get_settings()
+configure_logging(settings.log_level, settings.log_sampling, settings.log_queue_size)
 logger = logging.getLogger(__name__)
 
 
@@ -46,10 +44,35 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
 
     form_repository = get_form_repository()
     response_repository = get_response_repository()
-    await seed_database(form_repository, response_repository)
+    snapshot = get_snapshot()
+    if snapshot is None:
+        if seeding_enabled():
+            await seed_database(form_repository, response_repository)
+        if response_aggregator_enabled():
+            await get_response_aggregator().rebuild(response_repository)
+    else:
+        get_response_aggregator().restore(snapshot.aggregates())
+        logger.info(
+            "Loaded snapshot",
+            extra={"snapshot_path": str(snapshot.path), "responses_count": len(snapshot)},
+        )
 
     yield
     logger.info("Shutting down application")
+    if snapshot_enabled() and settings.snapshot_path and settings.snapshot_write_on_shutdown:
+        responses = await response_repository.get_all()
+        await asyncio.to_thread(
+            write_snapshot,
+            settings.snapshot_path,
+            await form_repository.get_all(),
+            responses,
+            get_response_aggregator().aggregates(),
+        )
+        logger.info(
+            "Wrote snapshot",
+            extra={"snapshot_path": settings.snapshot_path, "responses_count": len(responses)},
+        )
+    await shutdown_dependencies()
 
 
 app = FastAPI(
@@ -90,8 +113,6 @@ async def redoc_html() -> HTMLResponse:
     )
 
 
-settings = get_settings()
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -99,6 +120,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware, metrics=get_service_metrics())
 
 app.include_router(
     backoffice.forms.router, prefix="/api/v1/backoffice/forms", tags=["backoffice-forms"]
@@ -118,3 +141,10 @@ app.include_router(gdpr.data.router, prefix="/api/v1/gdpr/data", tags=["gdpr"])
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     return {"status": "healthy", "version": settings.app_version}
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(get_service_metrics().render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,60 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics import ServiceMetrics
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_template(path: str, route_path: str) -> str:
+    if "{" not in route_path:
+        return path
+    template_segments = route_path.strip("/").split("/")
+    path_segments = path.rstrip("/").split("/")
+    prefix = path_segments[: len(path_segments) - len(template_segments)]
+    return "/".join(prefix + template_segments)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: ServiceMetrics) -> None:
+        self._app = app
+        self._requests = metrics.http_requests
+        self._duration = metrics.http_request_duration
+        self._in_flight = metrics.http_requests_in_flight.labels()
+        self._templates: dict[int, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self._in_flight.inc()
+        started = perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - started
+            self._in_flight.dec()
+            template = self._template(scope)
+            method = scope["method"]
+            self._duration.labels(method, template).observe(elapsed)
+            self._requests.labels(method, template, str(status_code)).inc()
+
+    def _template(self, scope: Scope) -> str:
+        route = scope.get("route")
+        route_path = getattr(route, "path", None)
+        if route_path is None:
+            return UNMATCHED_ROUTE
+        template = self._templates.get(id(route))
+        if template is None:
+            template = self._templates[id(route)] = _route_template(scope["path"], route_path)
+        return template
@@ -1,19 +1,26 @@
 import logging
+from functools import partial
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
 from application.dto.requests.create_form_request import CreateFormRequest
 from application.dto.requests.update_form_request import UpdateFormRequest
 from application.dto.responses.form_response import FormResponse
+from application.dto.responses.form_stats_response import FormStatsResponse
+from application.dto.responses.rating_report_response import RatingReportResponse
+from application.use_cases.get_rating_report_use_case import ReportBucket
 from domain.exceptions import FormNotFoundException
 from infrastructure.config import (
     get_create_form_use_case,
     get_delete_form_use_case,
+    get_get_form_stats_use_case,
     get_get_form_use_case,
+    get_get_rating_report_use_case,
     get_list_forms_use_case,
     get_update_form_use_case,
 )
+from presentation.api.conditional import etag_matches, form_payload_response
 from presentation.api.middleware.auth import get_current_backoffice_user
 
 logger = logging.getLogger(__name__)
@@ -63,10 +70,13 @@ async def list_forms(
 async def get_form(
     form_id: str,
     current_user: Annotated[str, Depends(get_current_backoffice_user)] = "",  # noqa: ARG001
-) -> FormResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     try:
         use_case = get_get_form_use_case()
-        return await use_case.execute(form_id)
+        payload = await use_case.execute_serialized(
+            form_id, partial(etag_matches, if_none_match) if if_none_match else None
+        )
     except FormNotFoundException as e:
         logger.warning("Form not found", extra={"form_id": form_id})
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -79,6 +89,8 @@ async def get_form(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred",
         ) from e
+    else:
+        return form_payload_response(payload, if_none_match)
 
 
 @router.put("/{form_id}", response_model=FormResponse)
@@ -127,3 +139,49 @@ async def delete_form(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred",
         ) from e
+
+
+@router.get("/{form_id}/stats", response_model=FormStatsResponse)
+async def get_form_stats(
+    form_id: str,
+    current_user: Annotated[str, Depends(get_current_backoffice_user)] = "",  # noqa: ARG001
+) -> FormStatsResponse:
+    try:
+        use_case = get_get_form_stats_use_case()
+        return await use_case.execute(form_id)
+    except FormNotFoundException as e:
+        logger.warning("Form not found", extra={"form_id": form_id})
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(
+            "Unexpected error getting form stats",
+            extra={"form_id": form_id, "error": str(e)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        ) from e
+
+
+@router.get("/{form_id}/report", response_model=RatingReportResponse)
+async def get_rating_report(
+    form_id: str,
+    bucket: Annotated[ReportBucket, Query()] = ReportBucket.DAY,
+    segment_by: str | None = None,
+    current_user: Annotated[str, Depends(get_current_backoffice_user)] = "",  # noqa: ARG001
+) -> RatingReportResponse:
+    try:
+        use_case = get_get_rating_report_use_case()
+        return await use_case.execute(form_id, bucket=bucket, segment_by=segment_by)
+    except FormNotFoundException as e:
+        logger.warning("Form not found", extra={"form_id": form_id})
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(
+            "Unexpected error building rating report",
+            extra={"form_id": form_id, "error": str(e)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        ) from e
@@ -1,31 +1,132 @@
 import logging
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from application.dto.requests.response_filter_request import ResponseFilterRequest
+from application.dto.responses.response_page_response import ResponsePageResponse
 from application.dto.responses.response_response import ResponseResponse
-from infrastructure.config import get_get_responses_use_case
+from application.use_cases.export_responses_use_case import ExportFormat
+from domain.exceptions import FormNotFoundException, InvalidCursorException
+from infrastructure.config import get_export_responses_use_case, get_get_responses_use_case
 from presentation.api.middleware.auth import get_current_backoffice_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+TAG_SEPARATOR = ":"
 
-@router.get("", response_model=list[ResponseResponse])
-async def get_responses(
+
+def get_response_filter(  # noqa: PLR0913
+    *,
     form_id: str | None = None,
+    campaign: Annotated[str | None, Query(description="Campaign identifier")] = None,
+    source: Annotated[str | None, Query(description="Response source (email, sms, etc.)")] = None,
+    group: Annotated[str | None, Query(description="User group identifier")] = None,
+    tag: Annotated[list[str] | None, Query(description="Any other tag, as key:value")] = None,
+    since: Annotated[datetime | None, Query(description="Submitted at or after")] = None,
+    until: Annotated[datetime | None, Query(description="Submitted before")] = None,
+) -> ResponseFilterRequest:
+    tags: dict[str, str] = {}
+    for pair in tag or []:
+        key, separator, value = pair.partition(TAG_SEPARATOR)
+        if not separator or not key or not value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid tag filter {pair!r}, expected key{TAG_SEPARATOR}value",
+            )
+        tags[key] = value
+    for known_key, known_value in (("campaign", campaign), ("source", source), ("group", group)):
+        if known_value:
+            tags[known_key] = known_value
+    return ResponseFilterRequest(form_id=form_id, tags=tags, since=since, until=until)
+
+
+@router.get("", response_model=list[ResponseResponse], deprecated=True)
+async def get_responses(
+    request: Request,
+    response: Response,
+    filters: Annotated[ResponseFilterRequest, Depends(get_response_filter)],
     current_user: Annotated[str, Depends(get_current_backoffice_user)] = "",  # noqa: ARG001
 ) -> list[ResponseResponse]:
+    response.headers["Deprecation"] = "true"
+    response.headers["Link"] = (
+        f'<{request.url_for("get_responses_page").path}>; rel="successor-version"'
+    )
     try:
         use_case = get_get_responses_use_case()
-        return await use_case.execute(form_id)
+        return await use_case.execute(filters)
     except Exception as e:
         logger.exception(
             "Unexpected error getting responses",
+            extra={"form_id": filters.form_id, "error": str(e)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        ) from None
+
+
+@router.get("/page", response_model=ResponsePageResponse)
+async def get_responses_page(
+    filters: Annotated[ResponseFilterRequest, Depends(get_response_filter)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    current_user: Annotated[str, Depends(get_current_backoffice_user)] = "",  # noqa: ARG001
+) -> ResponsePageResponse:
+    try:
+        use_case = get_get_responses_use_case()
+        return await use_case.execute_page(limit, filters=filters, cursor=cursor)
+    except InvalidCursorException as e:
+        logger.warning("Invalid response cursor", extra={"cursor": cursor})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(
+            "Unexpected error getting response page",
+            extra={"form_id": filters.form_id, "error": str(e)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        ) from None
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_responses(
+    form_id: str | None = None,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    current_user: Annotated[str, Depends(get_current_backoffice_user)] = "",  # noqa: ARG001
+) -> StreamingResponse:
+    try:
+        use_case = get_export_responses_use_case()
+        chunks = await use_case.execute(export_format, form_id=form_id)
+    except FormNotFoundException as e:
+        logger.warning("Form not found for export", extra={"form_id": form_id})
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except ValueError as e:
+        logger.warning("Invalid export request", extra={"form_id": form_id, "error": str(e)})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(
+            "Unexpected error exporting responses",
             extra={"form_id": form_id, "error": str(e)},
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred",
         ) from None
+    filename = f"responses_{form_id or 'all'}.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
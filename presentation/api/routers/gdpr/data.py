@@ -1,6 +1,7 @@
 import logging
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from application.dto.responses.response_response import ResponseResponse
 from infrastructure.config import (
@@ -29,11 +30,11 @@ async def get_user_data(user_id: str) -> list[ResponseResponse]:
         ) from e
 
 
-@router.get("/{user_id}/export")
-async def export_user_data(user_id: str) -> Response:
+@router.get("/{user_id}/export", response_class=StreamingResponse)
+async def export_user_data(user_id: str) -> StreamingResponse:
     try:
         use_case = get_export_user_data_use_case()
-        export_json = await use_case.execute(user_id)
+        chunks = await use_case.execute(user_id)
     except Exception as e:
         logger.exception(
             "Unexpected error exporting user data", extra={"user_id": user_id, "error": str(e)}
@@ -43,8 +44,8 @@ async def export_user_data(user_id: str) -> Response:
             detail="An unexpected error occurred",
         ) from e
     else:
-        return Response(
-            content=export_json,
+        return StreamingResponse(
+            chunks,
             media_type="application/json",
             headers={"Content-Disposition": f'attachment; filename="user_data_{user_id}.json"'},
         )
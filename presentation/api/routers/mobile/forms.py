@@ -1,26 +1,40 @@
 import logging
+from functools import partial
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 
 from application.dto.responses.form_response import FormResponse
+from application.dto.responses.localized_form_response import LocalizedFormResponse
 from domain.exceptions import FormNotFoundException
 from infrastructure.config import get_get_form_use_case
+from presentation.api.conditional import etag_matches, form_payload_response
+from presentation.api.language import parse_accept_language
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.get("/{form_id}", response_model=FormResponse)
-async def get_form(
+@router.get("/{form_id}", response_model=FormResponse | LocalizedFormResponse)
+async def get_form(  # noqa: PLR0913
     form_id: str,
+    *,
     campaign: str | None = Query(None, description="Campaign identifier (for reference)"),  # noqa: ARG001
     source: str | None = Query(None, description="Response source (for reference)"),  # noqa: ARG001
     group: str | None = Query(None, description="User group identifier (for reference)"),  # noqa: ARG001
-) -> FormResponse:
+    lang: str | None = Query(None, description="Return a single-language projection"),
+    accept_language: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    preferred_languages = [lang] if lang else parse_accept_language(accept_language)
+    is_current = partial(etag_matches, if_none_match) if if_none_match else None
     try:
         use_case = get_get_form_use_case()
-        return await use_case.execute(form_id)
+        if preferred_languages:
+            payload = await use_case.execute_localized(form_id, preferred_languages, is_current)
+        else:
+            payload = await use_case.execute_serialized(form_id, is_current)
     except FormNotFoundException as e:
         logger.warning("Form not found", extra={"form_id": form_id})
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -33,3 +47,5 @@ async def get_form(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred",
         ) from e
+    else:
+        return form_payload_response(payload, if_none_match, vary="Accept-Language")
@@ -1,16 +1,44 @@
 import logging
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
 
+from application.dto.requests.bulk_submit_responses_request import BulkSubmitResponsesRequest
 from application.dto.requests.submit_response_request import SubmitResponseRequest
+from application.dto.responses.bulk_submit_responses_response import BulkSubmitResponsesResponse
 from application.dto.responses.response_response import ResponseResponse
-from domain.exceptions import FormNotFoundException, InvalidAnswerException
+from domain.exceptions import (
+    FormNotFoundException,
+    IdempotencyKeyConflictException,
+    InvalidAnswerException,
+)
 from infrastructure.config import get_submit_response_use_case
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+def _with_query_tags(
+    request: SubmitResponseRequest, campaign: str | None, source: str | None, group: str | None
+) -> SubmitResponseRequest:
+    tags = request.tags.copy() if request.tags else {}
+    if campaign:
+        tags["campaign"] = campaign
+    if source:
+        tags["source"] = source
+    if group:
+        tags["group"] = group
+
+    return SubmitResponseRequest(
+        form_id=request.form_id,
+        answers=request.answers,
+        tags=tags,
+        user_id=request.user_id,
+    )
+
 
 @router.post("", response_model=ResponseResponse, status_code=status.HTTP_201_CREATED)
 async def submit_response(
@@ -18,24 +46,12 @@ async def submit_response(
     campaign: str | None = Query(None, description="Campaign identifier"),
     source: str | None = Query(None, description="Response source (email, sms, etc.)"),
     group: str | None = Query(None, description="User group identifier"),
+    idempotency_key: Annotated[str | None, Header(max_length=MAX_IDEMPOTENCY_KEY_LENGTH)] = None,
 ) -> ResponseResponse:
     try:
-        tags = request.tags.copy() if request.tags else {}
-        if campaign:
-            tags["campaign"] = campaign
-        if source:
-            tags["source"] = source
-        if group:
-            tags["group"] = group
-
-        request_with_tags = SubmitResponseRequest(
-            form_id=request.form_id,
-            answers=request.answers,
-            tags=tags,
-            user_id=request.user_id,
-        )
+        request_with_tags = _with_query_tags(request, campaign, source, group)
         use_case = get_submit_response_use_case()
-        return await use_case.execute(request_with_tags)
+        return await use_case.execute(request_with_tags, idempotency_key=idempotency_key)
     except FormNotFoundException as e:
         logger.warning("Form not found for response submission", extra={"form_id": request.form_id})
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -44,9 +60,31 @@ async def submit_response(
             "Invalid answer in response", extra={"form_id": request.form_id, "error": str(e)}
         )
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except IdempotencyKeyConflictException as e:
+        logger.warning("Idempotency key reused", extra={"form_id": request.form_id})
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
     except Exception as e:
         logger.exception("Unexpected error submitting response", extra={"error": str(e)})
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred",
         ) from e
+
+
+@router.post("/bulk", response_model=BulkSubmitResponsesResponse)
+async def submit_responses_bulk(
+    request: BulkSubmitResponsesRequest,
+    campaign: str | None = Query(None, description="Campaign identifier"),
+    source: str | None = Query(None, description="Response source (email, sms, etc.)"),
+    group: str | None = Query(None, description="User group identifier"),
+) -> BulkSubmitResponsesResponse:
+    try:
+        items = [_with_query_tags(item, campaign, source, group) for item in request.items]
+        use_case = get_submit_response_use_case()
+        return await use_case.execute_many(items)
+    except Exception as e:
+        logger.exception("Unexpected error submitting responses in bulk", extra={"error": str(e)})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred",
+        ) from e
@@ -17,7 +17,7 @@ def _reset_repositories():
     yield
 
     shared_form_repository._forms.clear()
-    shared_response_repository._responses.clear()
+    shared_response_repository.clear()
     deps.reset_dependencies()
 
 
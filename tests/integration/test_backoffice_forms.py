@@ -148,3 +148,148 @@ def test_given_existing_form_when_delete_form_then_form_is_deleted():
     # And: Form cannot be retrieved
     get_response = client.get(f"/api/v1/backoffice/forms/{form_id}", auth=("admin", "admin"))
     assert get_response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.integration()
+def test_given_matching_etag_when_get_form_then_returns_not_modified():
+    # Given: A form fetched once from the backoffice
+    client = TestClient(app)
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={"type": "survey", "name": {"en": "Survey"}, "questions": []},
+    )
+    form_id = create_response.json()["id"]
+    etag = client.get(f"/api/v1/backoffice/forms/{form_id}", auth=("admin", "admin")).headers[
+        "etag"
+    ]
+
+    # When: Revalidate with a weak validator list containing the ETag
+    response = client.get(
+        f"/api/v1/backoffice/forms/{form_id}",
+        auth=("admin", "admin"),
+        headers={"If-None-Match": f'"other", W/{etag}'},
+    )
+
+    # Then: 304 is returned
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.integration()
+def test_given_submitted_responses_when_get_form_stats_then_returns_aggregates():
+    # Given: A form with a rating and a multiple choice question, and three responses
+    client = TestClient(app)
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "survey",
+            "name": {"en": "Stats"},
+            "questions": [
+                {
+                    "type": "rating",
+                    "text": {"en": "Rate"},
+                    "required": True,
+                    "min_rating": 1,
+                    "max_rating": 5,
+                },
+                {
+                    "type": "multiple_choice",
+                    "text": {"en": "Pick"},
+                    "required": False,
+                    "options": [{"en": "Yes"}, {"en": "No"}],
+                },
+            ],
+        },
+    )
+    form_id = create_response.json()["id"]
+    rating_id, choice_id = (q["id"] for q in create_response.json()["questions"])
+    for rating, user_id in ((5, "stats-user"), (3, "stats-user"), (4, "other-user")):
+        client.post(
+            "/api/v1/mobile/responses",
+            json={
+                "form_id": form_id,
+                "user_id": user_id,
+                "answers": [
+                    {"question_id": rating_id, "value": rating},
+                    {"question_id": choice_id, "value": ["Yes"]},
+                ],
+            },
+        )
+
+    # When: Get the stats before and after one user's data is erased
+    before = client.get(f"/api/v1/backoffice/forms/{form_id}/stats", auth=("admin", "admin"))
+    client.delete("/api/v1/gdpr/data/stats-user")
+    after = client.get(f"/api/v1/backoffice/forms/{form_id}/stats", auth=("admin", "admin"))
+
+    # Then: Aggregates reflect the submissions and the erasure
+    assert before.status_code == HTTPStatus.OK
+    stats = before.json()
+    assert stats["response_count"] == 3  # noqa: PLR2004
+    rating, choice = stats["questions"]
+    assert rating["rating"]["mean"] == 4.0  # noqa: PLR2004
+    assert rating["rating"]["histogram"] == {"1": 0, "2": 0, "3": 1, "4": 1, "5": 1}
+    assert choice["option_counts"] == {"Yes": 3, "No": 0}
+    assert after.json()["response_count"] == 1
+    assert after.json()["questions"][0]["rating"]["histogram"]["4"] == 1
+
+
+@pytest.mark.integration()
+def test_given_unknown_form_when_get_form_stats_then_returns_404():
+    # Given: A client
+    client = TestClient(app)
+
+    # When: Get stats for a form that does not exist
+    response = client.get("/api/v1/backoffice/forms/missing/stats", auth=("admin", "admin"))
+
+    # Then: Not found is returned
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.integration()
+def test_given_rating_responses_when_get_rating_report_then_returns_nps_and_segments():
+    # Given: A 0-10 rating form with responses from two campaigns
+    client = TestClient(app)
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "survey",
+            "name": {"en": "NPS"},
+            "questions": [
+                {
+                    "type": "rating",
+                    "text": {"en": "Recommend?"},
+                    "required": True,
+                    "min_rating": 0,
+                    "max_rating": 10,
+                },
+            ],
+        },
+    )
+    form_id = create_response.json()["id"]
+    question_id = create_response.json()["questions"][0]["id"]
+    for rating, campaign in ((10, "spring"), (9, "spring"), (3, "summer")):
+        client.post(
+            "/api/v1/mobile/responses",
+            params={"campaign": campaign},
+            json={"form_id": form_id, "answers": [{"question_id": question_id, "value": rating}]},
+        )
+
+    # When: Get the rating report segmented by campaign
+    response = client.get(
+        f"/api/v1/backoffice/forms/{form_id}/report",
+        auth=("admin", "admin"),
+        params={"segment_by": "campaign", "bucket": "hour"},
+    )
+
+    # Then: NPS, time buckets and segments are reported
+    assert response.status_code == HTTPStatus.OK
+    question = response.json()["questions"][0]
+    assert question["count"] == 3  # noqa: PLR2004
+    assert round(question["nps"], 2) == 33.33  # noqa: PLR2004
+    assert sum(b["count"] for b in question["time_buckets"]) == 3  # noqa: PLR2004
+    assert {s["value"]: s["nps"] for s in question["segments"]} == {
+        "spring": 100.0,
+        "summer": -100.0,
+    }
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 
 import pytest
@@ -52,3 +53,219 @@ def test_given_existing_responses_when_get_responses_then_returns_responses():
     assert isinstance(responses, list)
     assert len(responses) >= 1
     assert responses[0]["form_id"] == form_id
+
+
+@pytest.mark.integration()
+def test_given_many_responses_when_paging_with_cursor_then_walks_every_response_once():
+    # Given: A form with five responses
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "product_feedback",
+            "name": {"en": "Paged Form"},
+            "questions": [
+                {
+                    "type": "rating",
+                    "text": {"en": "Rating"},
+                    "required": True,
+                    "min_rating": 1,
+                    "max_rating": 5,
+                },
+            ],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+    submitted_ids = [
+        client.post(
+            "/api/v1/mobile/responses",
+            json={"form_id": form_id, "answers": [{"question_id": question_id, "value": 4}]},
+        ).json()["id"]
+        for _ in range(5)
+    ]
+
+    # When: Follow next_cursor with a page size of two
+    pages: list[list[str]] = []
+    params: dict[str, str | int] = {"form_id": form_id, "limit": 2}
+    while True:
+        response = client.get(
+            "/api/v1/backoffice/responses/page", auth=("admin", "admin"), params=params
+        )
+        assert response.status_code == HTTPStatus.OK
+        body = response.json()
+        assert body["limit"] == 2  # noqa: PLR2004
+        pages.append([item["id"] for item in body["items"]])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    # Then: Every response is returned exactly once, at most two per page
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert sorted(i for page in pages for i in page) == sorted(submitted_ids)
+
+
+@pytest.mark.integration()
+def test_given_invalid_cursor_when_get_responses_page_then_returns_400():
+    # Given: A cursor that was not issued by the API
+    client = TestClient(app)
+
+    # When: Request a page with it
+    response = client.get(
+        "/api/v1/backoffice/responses/page",
+        auth=("admin", "admin"),
+        params={"cursor": "garbage"},
+    )
+
+    # Then: The request is rejected
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.integration()
+def test_given_responses_when_export_csv_then_streams_attachment():
+    # Given: A form with a response
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "product_feedback",
+            "name": {"en": "Export Form"},
+            "questions": [{"type": "text", "text": {"en": "Comment"}, "required": True}],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+    client.post(
+        "/api/v1/mobile/responses",
+        json={"form_id": form_id, "answers": [{"question_id": question_id, "value": "Nice"}]},
+    )
+
+    # When: Export the form's responses as CSV and NDJSON
+    csv_response = client.get(
+        "/api/v1/backoffice/responses/export",
+        auth=("admin", "admin"),
+        params={"form_id": form_id, "format": "csv"},
+    )
+    ndjson_response = client.get(
+        "/api/v1/backoffice/responses/export",
+        auth=("admin", "admin"),
+        params={"form_id": form_id},
+    )
+
+    # Then: Both are downloads with the response in them
+    assert csv_response.status_code == HTTPStatus.OK
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in csv_response.headers["content-disposition"]
+    header, row = csv_response.text.splitlines()
+    assert header.endswith(question_id)
+    assert row.endswith("Nice")
+    assert ndjson_response.headers["content-type"] == "application/x-ndjson"
+    assert len(ndjson_response.text.splitlines()) == 1
+
+
+@pytest.mark.integration()
+def test_given_csv_export_without_form_when_export_then_returns_400():
+    # Given: An authenticated client
+    client = TestClient(app)
+
+    # When: Request a CSV export without form_id
+    response = client.get(
+        "/api/v1/backoffice/responses/export",
+        auth=("admin", "admin"),
+        params={"format": "csv"},
+    )
+
+    # Then: The request is rejected
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.integration()
+def test_given_responses_when_filtering_by_time_range_then_returns_only_that_window():
+    # Given: A response submitted now
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "survey",
+            "name": {"en": "Daily"},
+            "questions": [{"type": "text", "text": {"en": "Comment"}, "required": True}],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+    client.post(
+        "/api/v1/mobile/responses",
+        json={"form_id": form_id, "answers": [{"question_id": question_id, "value": "Hi"}]},
+    )
+    now = datetime.now(tz=UTC)
+
+    # When: Query the last 24 hours and the day before
+    last_day = client.get(
+        "/api/v1/backoffice/responses",
+        auth=("admin", "admin"),
+        params={"form_id": form_id, "since": (now - timedelta(days=1)).isoformat()},
+    )
+    day_before = client.get(
+        "/api/v1/backoffice/responses/page",
+        auth=("admin", "admin"),
+        params={
+            "form_id": form_id,
+            "since": (now - timedelta(days=2)).isoformat(),
+            "until": (now - timedelta(days=1)).isoformat(),
+        },
+    )
+
+    # Then: Only the window containing the response returns it
+    assert last_day.status_code == HTTPStatus.OK
+    assert len(last_day.json()) == 1
+    assert day_before.json()["items"] == []
+
+
+@pytest.mark.integration()
+def test_given_responses_when_get_deprecated_listing_then_returns_all_with_successor_link():
+    # Given: A form with three responses
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "product_feedback",
+            "name": {"en": "Listed Form"},
+            "questions": [
+                {
+                    "type": "rating",
+                    "text": {"en": "Rating"},
+                    "required": True,
+                    "min_rating": 1,
+                    "max_rating": 5,
+                },
+            ],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+    for rating in (1, 2, 3):
+        client.post(
+            "/api/v1/mobile/responses",
+            json={"form_id": form_id, "answers": [{"question_id": question_id, "value": rating}]},
+        )
+
+    # When: Get responses from the unpaged listing
+    response = client.get(
+        "/api/v1/backoffice/responses",
+        auth=("admin", "admin"),
+        params={"form_id": form_id},
+    )
+
+    # Then: Nothing is cut off and clients are pointed at the paged endpoint
+    assert response.status_code == HTTPStatus.OK
+    assert sorted(r["answers"][0]["value"] for r in response.json()) == [1, 2, 3]
+    assert response.headers["deprecation"] == "true"
+    assert response.headers["link"] == (
+        '</api/v1/backoffice/responses/page>; rel="successor-version"'
+    )
+    operation = client.get("/openapi.json").json()["paths"]["/api/v1/backoffice/responses"]["get"]
+    assert operation["deprecated"] is True
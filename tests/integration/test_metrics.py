@@ -0,0 +1,44 @@
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+
+from presentation.api.main import app
+
+
+@pytest.mark.integration()
+def test_given_served_requests_when_get_metrics_then_reports_route_templates():
+    # Given: A form fetched by id and a request to an unknown path
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={"type": "survey", "name": {"en": "Metrics"}, "questions": []},
+    )
+    form_id = create_form_response.json()["id"]
+    client.get(f"/api/v1/mobile/forms/{form_id}")
+    client.get("/api/v1/mobile/forms/unknown-form")
+    client.get("/not-a-route")
+
+    # When: Metrics are scraped
+    response = client.get("/metrics")
+
+    # Then: Requests are grouped by route template, never by raw path
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/mobile/forms/{form_id}",status="200"}'
+        in text
+    )
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/mobile/forms/{form_id}",status="404"}'
+        in text
+    )
+    assert 'http_requests_total{method="POST",route="/api/v1/backoffice/forms",status="201"}' in (
+        text
+    )
+    assert 'route="unmatched",status="404"' in text
+    assert form_id not in text
+    assert "http_requests_in_flight" in text
+    assert 'use_case="GetFormUseCase",method="execute_serialized"' in text
@@ -37,3 +37,162 @@ def test_given_existing_form_when_get_form_then_returns_form():
     assert data["id"] == form_id
     assert data["type"] == "product_feedback"
     assert len(data["questions"]) == 1
+
+
+@pytest.mark.integration()
+def test_given_fetched_form_when_updated_then_mobile_endpoint_returns_new_version():
+    # Given: A form that has already been fetched by a mobile client
+    client = TestClient(app)
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={"type": "survey", "name": {"en": "Before"}, "questions": []},
+    )
+    form_id = create_response.json()["id"]
+    assert client.get(f"/api/v1/mobile/forms/{form_id}").json()["name"] == {"en": "Before"}
+
+    # When: The form is updated and then deleted from the backoffice
+    client.put(
+        f"/api/v1/backoffice/forms/{form_id}",
+        auth=("admin", "admin"),
+        json={"name": {"en": "After"}},
+    )
+    updated = client.get(f"/api/v1/mobile/forms/{form_id}")
+    client.delete(f"/api/v1/backoffice/forms/{form_id}", auth=("admin", "admin"))
+    deleted = client.get(f"/api/v1/mobile/forms/{form_id}")
+
+    # Then: The mobile endpoint never serves the stale cached payload
+    assert updated.status_code == HTTPStatus.OK
+    assert updated.json()["name"] == {"en": "After"}
+    assert deleted.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.integration()
+def test_given_matching_etag_when_get_form_then_returns_not_modified():
+    # Given: A form fetched once by a mobile client
+    client = TestClient(app)
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={"type": "survey", "name": {"en": "Survey"}, "questions": []},
+    )
+    form_id = create_response.json()["id"]
+    first = client.get(f"/api/v1/mobile/forms/{form_id}")
+    etag = first.headers["etag"]
+
+    # When: The client revalidates with If-None-Match
+    response = client.get(f"/api/v1/mobile/forms/{form_id}", headers={"If-None-Match": etag})
+
+    # Then: 304 is returned without a body
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.integration()
+def test_given_stale_etag_when_form_updated_then_returns_new_body_and_etag():
+    # Given: A client holding the ETag of an older version
+    client = TestClient(app)
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={"type": "survey", "name": {"en": "Before"}, "questions": []},
+    )
+    form_id = create_response.json()["id"]
+    old_etag = client.get(f"/api/v1/mobile/forms/{form_id}").headers["etag"]
+    client.put(
+        f"/api/v1/backoffice/forms/{form_id}",
+        auth=("admin", "admin"),
+        json={"name": {"en": "After"}},
+    )
+
+    # When: The client revalidates with the stale ETag
+    response = client.get(f"/api/v1/mobile/forms/{form_id}", headers={"If-None-Match": old_etag})
+
+    # Then: The new version is returned with a different ETag
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["name"] == {"en": "After"}
+    assert response.headers["etag"] != old_etag
+
+
+def _create_multilingual_form(client: TestClient) -> str:
+    create_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "support_ticket",
+            "name": {"en": "Support", "es": "Soporte", "fr": "Assistance"},
+            "questions": [
+                {
+                    "type": "multiple_choice",
+                    "text": {"en": "Priority", "es": "Prioridad"},
+                    "required": True,
+                    "options": [{"en": "Low", "es": "Baja"}, {"en": "High", "es": "Alta"}],
+                },
+            ],
+        },
+    )
+    form_id: str = create_response.json()["id"]
+    return form_id
+
+
+@pytest.mark.integration()
+def test_given_lang_query_when_get_form_then_returns_single_language_projection():
+    # Given: A form translated into several languages
+    client = TestClient(app)
+    form_id = _create_multilingual_form(client)
+
+    # When: Get the form projected to Spanish
+    response = client.get(f"/api/v1/mobile/forms/{form_id}", params={"lang": "es"})
+
+    # Then: Only Spanish texts are returned, options keep their submission values
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["language"] == "es"
+    assert data["name"] == "Soporte"
+    assert data["questions"][0]["text"] == "Prioridad"
+    assert data["questions"][0]["options"] == [
+        {"value": "Low", "label": "Baja"},
+        {"value": "High", "label": "Alta"},
+    ]
+
+
+@pytest.mark.integration()
+def test_given_accept_language_when_get_form_then_negotiates_and_falls_back_per_text():
+    # Given: A form whose question is not translated into French
+    client = TestClient(app)
+    form_id = _create_multilingual_form(client)
+
+    # When: Get the form with a French-first Accept-Language header
+    response = client.get(
+        f"/api/v1/mobile/forms/{form_id}",
+        headers={"Accept-Language": "fr-CH, fr;q=0.9, en;q=0.8"},
+    )
+
+    # Then: French is selected and missing translations fall back to the first one
+    assert response.status_code == HTTPStatus.OK
+    assert "Accept-Language" in response.headers["vary"]
+    data = response.json()
+    assert data["language"] == "fr"
+    assert data["name"] == "Assistance"
+    assert data["questions"][0]["text"] == "Priority"
+
+
+@pytest.mark.integration()
+def test_given_projections_in_two_languages_when_get_form_then_etags_differ():
+    # Given: A multilingual form
+    client = TestClient(app)
+    form_id = _create_multilingual_form(client)
+
+    # When: Fetch the English and Spanish projections
+    english = client.get(f"/api/v1/mobile/forms/{form_id}", params={"lang": "en"})
+    spanish = client.get(f"/api/v1/mobile/forms/{form_id}", params={"lang": "es"})
+
+    # Then: Each projection has its own validator
+    assert english.headers["etag"] != spanish.headers["etag"]
+    revalidated = client.get(
+        f"/api/v1/mobile/forms/{form_id}",
+        params={"lang": "es"},
+        headers={"If-None-Match": spanish.headers["etag"]},
+    )
+    assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
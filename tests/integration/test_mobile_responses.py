@@ -56,3 +56,104 @@ def test_given_existing_form_when_submit_response_then_returns_response():
     assert len(data["answers"]) == expected_answer_count
     assert "id" in data
     assert "submitted_at" in data
+
+
+@pytest.mark.integration()
+def test_given_idempotency_key_when_submission_is_retried_then_stores_a_single_response():
+    # Given: A form and a submission carrying an Idempotency-Key
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "survey",
+            "name": {"en": "Retry"},
+            "questions": [{"type": "text", "text": {"en": "Comment"}, "required": True}],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+    body = {"form_id": form_id, "answers": [{"question_id": question_id, "value": "Hi"}]}
+    headers = {"Idempotency-Key": "retry-1"}
+
+    # When: Submit it twice, then reuse the key with a different body
+    first = client.post("/api/v1/mobile/responses", json=body, headers=headers)
+    retry = client.post("/api/v1/mobile/responses", json=body, headers=headers)
+    conflict = client.post(
+        "/api/v1/mobile/responses",
+        json={**body, "answers": [{"question_id": question_id, "value": "Other"}]},
+        headers=headers,
+    )
+
+    # Then: The retry replays the original response and only one is stored
+    assert first.status_code == retry.status_code == HTTPStatus.CREATED
+    assert retry.json() == first.json()
+    assert conflict.status_code == HTTPStatus.CONFLICT
+    stored = client.get(
+        "/api/v1/backoffice/responses", auth=("admin", "admin"), params={"form_id": form_id}
+    )
+    assert len(stored.json()) == 1
+
+
+@pytest.mark.integration()
+def test_given_bulk_submission_when_posted_then_returns_per_item_results():
+    # Given: A form with a required rating question
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "survey",
+            "name": {"en": "Offline"},
+            "questions": [
+                {
+                    "type": "rating",
+                    "text": {"en": "Rating"},
+                    "required": True,
+                    "min_rating": 1,
+                    "max_rating": 5,
+                }
+            ],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+
+    # When: Upload a queued batch with one invalid rating and one unknown form
+    response = client.post(
+        "/api/v1/mobile/responses/bulk?campaign=offline",
+        json={
+            "items": [
+                {"form_id": form_id, "answers": [{"question_id": question_id, "value": 4}]},
+                {"form_id": form_id, "answers": [{"question_id": question_id, "value": 7}]},
+                {"form_id": "missing", "answers": [{"question_id": question_id, "value": 4}]},
+            ]
+        },
+    )
+
+    # Then: Valid items are stored and failures are reported per item
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    expected_failed = 2
+    assert data["created"] == 1
+    assert data["failed"] == expected_failed
+    assert [item["status"] for item in data["results"]] == [
+        "created",
+        "invalid_answer",
+        "form_not_found",
+    ]
+    assert data["results"][0]["response"]["tags"] == {"campaign": "offline"}
+    stored = client.get(f"/api/v1/backoffice/responses?form_id={form_id}", auth=("admin", "admin"))
+    assert len(stored.json()) == 1
+
+
+@pytest.mark.integration()
+def test_given_empty_bulk_submission_when_posted_then_returns_validation_error():
+    # Given: A client
+    client = TestClient(app)
+
+    # When: Upload an empty batch
+    response = client.post("/api/v1/mobile/responses/bulk", json={"items": []})
+
+    # Then: The request is rejected
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
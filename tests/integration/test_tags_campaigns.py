@@ -79,3 +79,47 @@ def test_given_form_when_submit_response_with_tags_then_tags_are_stored():
     assert responses[0]["tags"]["campaign"] == "summer2024"
     assert responses[0]["tags"]["source"] == "email"
     assert responses[0]["tags"]["group"] == "premium_users"
+
+
+@pytest.mark.integration()
+def test_given_responses_from_several_campaigns_when_filtering_by_tags_then_returns_matches():
+    # Given: Responses submitted with different campaign and source tags
+    client = TestClient(app)
+    create_form_response = client.post(
+        "/api/v1/backoffice/forms",
+        auth=("admin", "admin"),
+        json={
+            "type": "survey",
+            "name": {"en": "Campaigns"},
+            "questions": [{"type": "text", "text": {"en": "Comment"}, "required": True}],
+        },
+    )
+    form_id = create_form_response.json()["id"]
+    question_id = create_form_response.json()["questions"][0]["id"]
+    for campaign, source in (("spring", "email"), ("spring", "sms"), ("autumn", "email")):
+        client.post(
+            "/api/v1/mobile/responses",
+            params={"campaign": campaign, "source": source},
+            json={"form_id": form_id, "answers": [{"question_id": question_id, "value": "Hi"}]},
+        )
+
+    # When: Filter by campaign, and by campaign plus a generic tag filter
+    spring = client.get(
+        "/api/v1/backoffice/responses", auth=("admin", "admin"), params={"campaign": "spring"}
+    )
+    spring_email = client.get(
+        "/api/v1/backoffice/responses/page",
+        auth=("admin", "admin"),
+        params={"campaign": "spring", "tag": "source:email"},
+    )
+    invalid = client.get(
+        "/api/v1/backoffice/responses", auth=("admin", "admin"), params={"tag": "source"}
+    )
+
+    # Then: Only responses with every requested tag are returned
+    assert spring.status_code == HTTPStatus.OK
+    assert [r["tags"]["source"] for r in spring.json()] == ["email", "sms"]
+    assert [r["tags"] for r in spring_email.json()["items"]] == [
+        {"campaign": "spring", "source": "email"}
+    ]
+    assert invalid.status_code == HTTPStatus.BAD_REQUEST
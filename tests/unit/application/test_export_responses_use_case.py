@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from application.use_cases.export_responses_use_case import ExportFormat, ExportResponsesUseCase
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.entities.response import Response
+from domain.exceptions import FormNotFoundException
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_form_repository import MockFormRepository
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+async def _use_case() -> ExportResponsesUseCase:
+    form_repository = MockFormRepository()
+    response_repository = MockResponseRepository()
+    await form_repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.SURVEY,
+            name=MultilingualText({"en": "Survey"}),
+            questions=[
+                Question(
+                    id=QuestionId("q-rating"),
+                    type=QuestionType.RATING,
+                    text=MultilingualText({"en": "Rate"}),
+                    required=True,
+                    min_rating=1,
+                    max_rating=5,
+                ),
+                Question(
+                    id=QuestionId("q-choice"),
+                    type=QuestionType.MULTIPLE_CHOICE,
+                    text=MultilingualText({"en": "Pick"}),
+                    required=False,
+                    options=[MultilingualText({"en": "Yes"}), MultilingualText({"en": "No"})],
+                ),
+            ],
+        )
+    )
+    for i in range(3):
+        await response_repository.create(
+            Response(
+                id=ResponseId(f"response-{i}"),
+                form_id=FormId("form-1"),
+                answers=[Answer(question_id=QuestionId("q-rating"), value=i + 1)]
+                + ([Answer(question_id=QuestionId("q-choice"), value=["Yes", "No"])] if i else []),
+                tags={"campaign": "summer"},
+                submitted_at=datetime(2024, 1, 1, i, tzinfo=UTC),
+            )
+        )
+    return ExportResponsesUseCase(form_repository, response_repository)
+
+
+@pytest.mark.asyncio()
+async def test_given_responses_when_export_ndjson_then_streams_one_json_object_per_line():
+    # Given: A form with three responses
+    use_case = await _use_case()
+
+    # When: Export as NDJSON
+    chunks = [chunk async for chunk in await use_case.execute(ExportFormat.NDJSON)]
+
+    # Then: Each line is a response
+    lines = "".join(chunks).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["response-0", "response-1", "response-2"]
+
+
+@pytest.mark.asyncio()
+async def test_given_responses_when_export_csv_then_has_one_column_per_question():
+    # Given: A form with three responses, one missing an answer
+    use_case = await _use_case()
+
+    # When: Export as CSV
+    chunks = [chunk async for chunk in await use_case.execute(ExportFormat.CSV, form_id="form-1")]
+
+    # Then: The header is streamed first and answers land in their question columns
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert chunks[0].startswith("response_id,")
+    assert rows[0][-2:] == ["q-rating", "q-choice"]
+    assert rows[1][-2:] == ["1", ""]
+    assert rows[2][-2:] == ["2", "Yes;No"]
+    assert json.loads(rows[2][4]) == {"campaign": "summer"}
+
+
+@pytest.mark.asyncio()
+async def test_given_invalid_csv_request_when_export_then_fails_before_streaming():
+    # Given: The export use case
+    use_case = await _use_case()
+
+    # When: Export CSV without a form or for an unknown form
+    # Then: The error is raised by execute itself
+    with pytest.raises(ValueError, match="requires a form_id"):
+        await use_case.execute(ExportFormat.CSV)
+    with pytest.raises(FormNotFoundException):
+        await use_case.execute(ExportFormat.CSV, form_id="missing")
@@ -0,0 +1,105 @@
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from application.use_cases.export_user_data_use_case import ExportUserDataUseCase
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.repositories.response_repository import DEFAULT_PAGE_SIZE
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+async def _repository(response_count: int, user_id: str = "user1") -> MockResponseRepository:
+    repository = MockResponseRepository()
+    for i in range(response_count):
+        await repository.create(
+            Response(
+                id=ResponseId(f"response-{i}"),
+                form_id=FormId("form-1"),
+                answers=[Answer(question_id=QuestionId("q-1"), value="Great")],
+                user_id=user_id if i % 2 == 0 else "someone-else",
+                submitted_at=BASE_TIME + timedelta(seconds=i),
+            )
+        )
+    return repository
+
+
+@pytest.mark.asyncio()
+async def test_given_user_with_several_pages_when_export_then_streams_a_single_json_document():
+    # Given: A user with more responses than fit in one page
+    response_count = DEFAULT_PAGE_SIZE * 2 + 2
+    use_case = ExportUserDataUseCase(await _repository(response_count * 2))
+
+    # When: Collect the streamed chunks
+    chunks = [chunk async for chunk in await use_case.execute("user1")]
+
+    # Then: The chunks form one JSON document with all of the user's responses
+    export_data = json.loads("".join(chunks))
+    assert len(chunks) > 3  # noqa: PLR2004
+    assert export_data["user_id"] == "user1"
+    assert export_data["total_responses"] == response_count
+    assert len(export_data["responses"]) == response_count
+    assert {r["user_id"] for r in export_data["responses"]} == {"user1"}
+    assert export_data["exported_at"] == BASE_TIME.isoformat()
+
+
+@pytest.mark.asyncio()
+async def test_given_user_without_responses_when_export_then_streams_empty_document():
+    # Given: A repository without the user's responses
+    use_case = ExportUserDataUseCase(MockResponseRepository())
+
+    # When: Export the user's data
+    export_data = json.loads("".join([chunk async for chunk in await use_case.execute("nobody")]))
+
+    # Then: An empty export is produced
+    assert export_data == {
+        "user_id": "nobody",
+        "responses": [],
+        "exported_at": None,
+        "total_responses": 0,
+    }
+
+
+@pytest.mark.asyncio()
+async def test_given_large_export_when_streaming_then_other_tasks_run_between_pages():
+    # Given: A large export and a concurrent task counting loop iterations
+    use_case = ExportUserDataUseCase(await _repository(DEFAULT_PAGE_SIZE * 6))
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+
+    # When: Drain the export
+    async for _ in await use_case.execute("user1"):
+        pass
+    task.cancel()
+
+    # Then: The ticker ran while the export was in progress
+    assert ticks >= 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_given_failing_repository_when_export_then_error_is_raised_before_streaming():
+    # Given: A repository that cannot read the user's responses
+    class FailingResponseRepository(MockResponseRepository):
+        async def query(self, **kwargs: object) -> list[Response]:  # noqa: ARG002
+            msg = "Storage unavailable"
+            raise OSError(msg)
+
+    use_case = ExportUserDataUseCase(FailingResponseRepository())
+
+    # When / Then: The error surfaces before any chunk is handed to the response
+    with pytest.raises(OSError, match="Storage unavailable"):
+        await use_case.execute("user1")
@@ -1,6 +1,14 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+
 import pytest
 
+from application.cache.form_payload_cache import FormPayloadCache
+from application.cache.single_flight import SingleFlight
+from application.dto.requests.update_form_request import UpdateFormRequest
 from application.use_cases.get_form_use_case import GetFormUseCase
+from application.use_cases.update_form_use_case import UpdateFormUseCase
 from domain.entities.form import Form
 from domain.exceptions import FormNotFoundException
 from domain.value_objects.form_id import FormId
@@ -30,3 +38,167 @@ async def test_given_nonexistent_form_id_when_get_form_then_raises_exception():
     use_case = GetFormUseCase(repository)
     with pytest.raises(FormNotFoundException):
         await use_case.execute("nonexistent")
+
+
+@pytest.mark.asyncio()
+async def test_given_cached_payload_when_execute_serialized_then_skips_repository():
+    repository = MockFormRepository()
+    await repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.PRODUCT_FEEDBACK,
+            name=MultilingualText({"en": "Product Feedback"}),
+        )
+    )
+    cache = FormPayloadCache()
+    use_case = GetFormUseCase(repository, cache)
+    first = await use_case.execute_serialized("form-1")
+    await repository.delete(FormId("form-1"))
+    second = await use_case.execute_serialized("form-1")
+    assert json.loads(first.body)["id"] == "form-1"
+    assert second is first
+
+
+@pytest.mark.asyncio()
+async def test_given_cached_payload_when_form_updated_then_cache_is_invalidated():
+    repository = MockFormRepository()
+    await repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.PRODUCT_FEEDBACK,
+            name=MultilingualText({"en": "Old Name"}),
+        )
+    )
+    cache = FormPayloadCache()
+    use_case = GetFormUseCase(repository, cache)
+    await use_case.execute_serialized("form-1")
+    await UpdateFormUseCase(repository, cache).execute(
+        "form-1", UpdateFormRequest(name={"en": "New Name"})
+    )
+    payload = await use_case.execute_serialized("form-1")
+    assert json.loads(payload.body)["name"] == {"en": "New Name"}
+
+
+@pytest.mark.asyncio()
+async def test_given_cold_cache_when_concurrent_serialized_gets_then_repository_is_read_once() -> (
+    None
+):
+    # Given: A slow repository and an empty payload cache
+    class SlowFormRepository(MockFormRepository):
+        lookups = 0
+
+        async def get_by_id(self, form_id: FormId) -> Form | None:
+            self.lookups += 1
+            await asyncio.sleep(0.01)
+            return await super().get_by_id(form_id)
+
+    repository = SlowFormRepository()
+    await repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.PRODUCT_FEEDBACK,
+            name=MultilingualText({"en": "Product Feedback"}),
+        )
+    )
+    use_case = GetFormUseCase(repository, FormPayloadCache(), SingleFlight())
+
+    # When: Many clients request the form at the same time
+    payloads = await asyncio.gather(*(use_case.execute_serialized("form-1") for _ in range(20)))
+
+    # Then: One read builds the payload every caller receives
+    assert repository.lookups == 1
+    assert all(payload is payloads[0] for payload in payloads)
+
+
+@pytest.mark.asyncio()
+async def test_given_payload_ttl_when_another_worker_updates_then_fresh_payload_after_expiry():
+    # Given: Two workers sharing one store, each with its own payload cache
+    now = [0.0]
+    repository = MockFormRepository()
+    await repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.PRODUCT_FEEDBACK,
+            name=MultilingualText({"en": "Old Name"}),
+        )
+    )
+    reader = GetFormUseCase(repository, FormPayloadCache(ttl_seconds=30, clock=lambda: now[0]))
+    await reader.execute_serialized("form-1")
+
+    # When: The other worker updates the form and the TTL elapses
+    await UpdateFormUseCase(repository, FormPayloadCache()).execute(
+        "form-1", UpdateFormRequest(name={"en": "New Name"})
+    )
+    stale = await reader.execute_serialized("form-1")
+    now[0] = 30.0
+    fresh = await reader.execute_serialized("form-1")
+
+    # Then: The old payload is served only until it expires
+    assert json.loads(stale.body)["name"] == {"en": "Old Name"}
+    assert json.loads(fresh.body)["name"] == {"en": "New Name"}
+    assert fresh.etag != stale.etag
+
+
+@pytest.mark.asyncio()
+async def test_given_invalidation_during_load_when_load_completes_then_payload_is_not_cached():
+    # Given: A repository whose lookup is overtaken by an update
+    class RacingFormRepository(MockFormRepository):
+        cache: FormPayloadCache | None = None
+
+        async def get_by_id(self, form_id: FormId) -> Form | None:
+            form = await super().get_by_id(form_id)
+            if self.cache is not None:
+                self.cache.invalidate(str(form_id))
+                self.cache = None
+            return form
+
+    repository = RacingFormRepository()
+    await repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.PRODUCT_FEEDBACK,
+            name=MultilingualText({"en": "Product Feedback"}),
+        )
+    )
+    cache = FormPayloadCache()
+    repository.cache = cache
+    use_case = GetFormUseCase(repository, cache)
+
+    # When: The serialized and localized payloads are loaded
+    await use_case.execute_serialized("form-1")
+    repository.cache = cache
+    await use_case.execute_localized("form-1", ["en"])
+
+    # Then: Neither stale payload was stored
+    assert cache.get("form-1") is None
+    assert cache.get("form-1", "en") is None
+
+
+@pytest.mark.asyncio()
+async def test_given_cold_cache_and_current_etag_when_execute_serialized_then_skips_serializing():
+    # Given: A client that already holds the current version of a form
+    repository = MockFormRepository()
+    await repository.create(
+        Form(
+            id=FormId("form-1"),
+            type=FormType.PRODUCT_FEEDBACK,
+            name=MultilingualText({"en": "Product Feedback"}),
+            updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+    )
+    etag = (await GetFormUseCase(repository).execute_serialized("form-1")).etag
+    cache = FormPayloadCache()
+    use_case = GetFormUseCase(repository, cache)
+
+    # When: It revalidates against a cold cache, then another client fetches the form
+    unmodified = await use_case.execute_serialized("form-1", lambda candidate: candidate == etag)
+    cached_before_fetch = len(cache)
+    fetched = await use_case.execute_serialized("form-1", lambda _: False)
+
+    # Then: Only the version is compared; the body is built for the client that needs it
+    assert unmodified.etag == etag
+    assert unmodified.body == b""
+    assert cached_before_fetch == 0
+    assert fetched.etag == etag
+    assert json.loads(fetched.body)["id"] == "form-1"
+    assert cache.get("form-1") is fetched
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from application.cache.idempotency_store import IdempotencyStore
+from domain.exceptions import IdempotencyKeyConflictException
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingOperation:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.calls
+
+
+@pytest.mark.asyncio()
+async def test_given_completed_key_when_run_again_then_returns_stored_result():
+    # Given: A key whose operation already completed
+    store: IdempotencyStore[int] = IdempotencyStore()
+    operation = CountingOperation()
+    first = await store.run("key-1", "fp", operation)
+
+    # When: Run the same key again
+    second = await store.run("key-1", "fp", operation)
+
+    # Then: The stored result is returned without running again
+    assert first == second == 1
+    assert operation.calls == 1
+
+
+@pytest.mark.asyncio()
+async def test_given_concurrent_retries_when_run_then_operation_runs_once():
+    # Given: A store and an operation
+    store: IdempotencyStore[int] = IdempotencyStore()
+    operation = CountingOperation()
+
+    # When: The same key is submitted concurrently
+    results = await asyncio.gather(*(store.run("key-1", "fp", operation) for _ in range(5)))
+
+    # Then: Every caller gets the single result
+    assert results == [1] * 5
+    assert operation.calls == 1
+
+
+@pytest.mark.asyncio()
+async def test_given_expired_or_evicted_key_when_run_then_operation_runs_again():
+    # Given: A store with room for one key and a one-second TTL
+    clock = FakeClock()
+    store: IdempotencyStore[int] = IdempotencyStore(max_entries=1, ttl_seconds=1, clock=clock)
+    operation = CountingOperation()
+    await store.run("key-1", "fp", operation)
+
+    # When: The TTL passes, then another key pushes the first one out
+    clock.now = 2
+    after_expiry = await store.run("key-1", "fp", operation)
+    await store.run("key-2", "fp", operation)
+    after_eviction = await store.run("key-1", "fp", operation)
+
+    # Then: The operation re-runs and the store stays bounded
+    assert (after_expiry, after_eviction) == (2, 4)
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio()
+async def test_given_failed_operation_when_retried_then_failure_is_not_cached():
+    # Given: An operation that fails the first time
+    store: IdempotencyStore[int] = IdempotencyStore()
+    attempts = 0
+
+    async def flaky() -> int:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            msg = "boom"
+            raise RuntimeError(msg)
+        return attempts
+
+    # When: Run it twice with the same key
+    with pytest.raises(RuntimeError, match="boom"):
+        await store.run("key-1", "fp", flaky)
+    result = await store.run("key-1", "fp", flaky)
+
+    # Then: The retry runs the operation again
+    assert result == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_given_key_used_for_other_request_when_run_then_raises_conflict():
+    # Given: A key stored for one request fingerprint
+    store: IdempotencyStore[int] = IdempotencyStore()
+    await store.run("key-1", "fp-1", CountingOperation())
+
+    # When: Reuse it for a different request
+    # Then: A conflict is raised
+    with pytest.raises(IdempotencyKeyConflictException):
+        await store.run("key-1", "fp-2", CountingOperation())
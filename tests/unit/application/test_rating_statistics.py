@@ -0,0 +1,161 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from application.analytics.rating_columns import RatingColumnBuilder, RatingScale
+from application.analytics.rating_statistics import (
+    csat,
+    net_promoter_score,
+    percentiles,
+    segment_breakdown,
+    time_bucket_means,
+)
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from domain.value_objects.response_columns import MISSING_CODE
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.serialization import responses_to_columns
+
+NPS_SCALE = RatingScale("q-nps", 0, 10)
+CSAT_SCALE = RatingScale("q-csat", 1, 5)
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _form() -> Form:
+    return Form(
+        id=FormId("form-1"),
+        type=FormType.SURVEY,
+        name=MultilingualText({"en": "Survey"}),
+        questions=[
+            Question(
+                id=QuestionId("q-comment"),
+                type=QuestionType.TEXT,
+                text=MultilingualText({"en": "Comment"}),
+                required=False,
+            ),
+            Question(
+                id=QuestionId("q-nps"),
+                type=QuestionType.RATING,
+                text=MultilingualText({"en": "Recommend?"}),
+                required=True,
+                min_rating=0,
+                max_rating=10,
+            ),
+        ],
+    )
+
+
+def _response(i: int, rating: int, tags: dict[str, str] | None = None) -> Response:
+    return Response(
+        id=ResponseId(f"response-{i}"),
+        form_id=FormId("form-1"),
+        answers=[
+            Answer(question_id=QuestionId("q-comment"), value="ok"),
+            Answer(question_id=QuestionId("q-nps"), value=rating),
+        ],
+        tags=tags or {},
+        submitted_at=BASE_TIME + timedelta(hours=12 * i),
+    )
+
+
+def test_given_responses_when_building_columns_then_extracts_valid_ratings_and_tag_codes():
+    # Given: Responses with text answers, an out-of-range rating and tags appearing late
+    builder = RatingColumnBuilder(_form())
+
+    # When: Build the columns
+    builder.add([_response(0, 9), _response(1, 11), _response(2, 3, {"campaign": "spring"})])
+    builder.add([_response(3, 10, {"campaign": "summer"}), _response(4, 7, {"campaign": "spring"})])
+    columns = builder.build()
+
+    # Then: Only in-range rating answers become rows, tags are dictionary encoded
+    assert columns.scales == (NPS_SCALE,)
+    assert columns.rating.tolist() == [9, 3, 10, 7]
+    assert columns.question_index.tolist() == [0, 0, 0, 0]
+    assert columns.submitted_at[0] == int(BASE_TIME.timestamp())
+    assert columns.tag_values == {"campaign": ("spring", "summer")}
+    assert columns.tag_codes["campaign"].tolist() == [MISSING_CODE, 0, 1, 0]
+
+
+def test_given_response_columns_when_building_columns_then_matches_row_path():
+    # Given: The same pages as rows and as columns
+    pages = [
+        [_response(0, 9), _response(1, 11), _response(2, 3, {"campaign": "spring"})],
+        [_response(3, 10, {"campaign": "summer"}), _response(4, 7, {"campaign": "spring"})],
+    ]
+    row_builder = RatingColumnBuilder(_form())
+    column_builder = RatingColumnBuilder(_form())
+
+    # When: Build the columns from both representations
+    for page in pages:
+        row_builder.add(page)
+        column_builder.add_columns(responses_to_columns(page))
+    from_rows = row_builder.build()
+    from_columns = column_builder.build()
+
+    # Then: Both builders produce identical columns
+    assert from_columns.rating.tolist() == from_rows.rating.tolist()
+    assert from_columns.question_index.tolist() == from_rows.question_index.tolist()
+    assert from_columns.submitted_at.tolist() == from_rows.submitted_at.tolist()
+    assert from_columns.tag_values == from_rows.tag_values
+    assert from_columns.tag_codes["campaign"].tolist() == from_rows.tag_codes["campaign"].tolist()
+
+
+def test_given_zero_to_ten_ratings_when_net_promoter_score_then_promoters_minus_detractors():
+    # Given: 3 promoters, 2 passives and 5 detractors
+    ratings = np.array([10, 9, 9, 8, 7, 6, 5, 3, 0, 1], dtype=np.int16)
+
+    # When: Compute NPS
+    score = net_promoter_score(ratings, NPS_SCALE)
+
+    # Then: NPS is (3 - 5) / 10
+    assert score == pytest.approx(-20.0)
+
+
+def test_given_five_point_ratings_when_csat_and_percentiles_then_uses_top_two_boxes():
+    # Given: Five-point satisfaction ratings
+    ratings = np.array([5, 4, 3, 2, 5, 1, 4, 4], dtype=np.int16)
+
+    # When: Compute CSAT and percentiles
+    satisfaction = csat(ratings, CSAT_SCALE)
+    quantiles = percentiles(ratings, (50,))
+
+    # Then: Ratings of 4 and 5 are satisfied
+    assert satisfaction == pytest.approx(62.5)
+    assert quantiles == {50: 4.0}
+    assert csat(np.array([], dtype=np.int16), CSAT_SCALE) is None
+
+
+def test_given_timestamps_when_time_bucket_means_then_groups_per_bucket():
+    # Given: Ratings over two days, one without a timestamp
+    day = 86400
+    submitted_at = np.array([0, 3600, day + 60, -1], dtype=np.int64)
+    ratings = np.array([4, 2, 5, 1], dtype=np.int16)
+
+    # When: Bucket by day
+    buckets = time_bucket_means(submitted_at, ratings, day)
+
+    # Then: Each day has its own mean and undated ratings are ignored
+    assert [(b.start, b.count, b.mean) for b in buckets] == [(0, 2, 3.0), (day, 1, 5.0)]
+
+
+def test_given_tag_codes_when_segment_breakdown_then_reports_each_segment():
+    # Given: Ratings segmented by campaign, one without a campaign
+    codes = np.array([0, 1, 0, MISSING_CODE, 1], dtype=np.int32)
+    ratings = np.array([10, 2, 8, 9, 4], dtype=np.int16)
+
+    # When: Break down by segment
+    segments = segment_breakdown(codes, ("spring", "summer"), ratings, NPS_SCALE)
+
+    # Then: Each segment has its own count, mean and NPS
+    assert [(s.value, s.count, s.mean, s.nps) for s in segments] == [
+        ("spring", 2, 9.0, 50.0),
+        ("summer", 2, 3.0, -100.0),
+    ]
@@ -0,0 +1,112 @@
+import statistics
+
+import pytest
+
+from application.analytics.response_aggregator import ResponseAggregator
+from application.use_cases.delete_user_data_use_case import DeleteUserDataUseCase
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+def _response(
+    response_id: str, rating: int, options: list[str] | None = None, user_id: str | None = None
+) -> Response:
+    answers = [Answer(question_id=QuestionId("q-rating"), value=rating)]
+    if options:
+        answers.append(Answer(question_id=QuestionId("q-choice"), value=options))
+    return Response(
+        id=ResponseId(response_id), form_id=FormId("form-1"), answers=answers, user_id=user_id
+    )
+
+
+def test_given_rating_answers_when_aggregated_then_tracks_histogram_mean_and_variance():
+    # Given: An aggregator fed with several ratings
+    aggregator = ResponseAggregator()
+    ratings = [1, 4, 4, 5, 5]
+
+    # When: Add the responses
+    aggregator.add_many(_response(f"response-{i}", r) for i, r in enumerate(ratings))
+
+    # Then: Aggregates match a full recomputation
+    aggregate = aggregator.get("form-1")
+    assert aggregate is not None
+    assert aggregate.response_count == len(ratings)
+    question = aggregate.questions["q-rating"]
+    assert question.rating_histogram == {1: 1, 4: 2, 5: 2}
+    assert question.rating_mean == pytest.approx(statistics.fmean(ratings))
+    assert question.rating_variance == pytest.approx(statistics.pvariance(ratings))
+
+
+def test_given_aggregated_responses_when_removed_then_counts_are_decremented():
+    # Given: Two responses with option answers
+    aggregator = ResponseAggregator()
+    first = _response("response-1", 5, ["Yes"])
+    second = _response("response-2", 3, ["Yes", "No"])
+    aggregator.add(first)
+    aggregator.add(second)
+
+    # When: Remove one of them
+    aggregator.remove(second)
+
+    # Then: Only the remaining response is counted and empty buckets disappear
+    aggregate = aggregator.get("form-1")
+    assert aggregate is not None
+    assert aggregate.response_count == 1
+    assert aggregate.questions["q-choice"].option_counts == {"Yes": 1}
+    assert aggregate.questions["q-rating"].rating_histogram == {5: 1}
+    assert aggregate.questions["q-rating"].rating_variance == 0
+
+    # When: Remove the last one
+    aggregator.remove(first)
+
+    # Then: The form is no longer tracked
+    assert aggregator.get("form-1") is None
+    assert len(aggregator) == 0
+
+
+@pytest.mark.asyncio()
+async def test_given_stored_responses_when_rebuild_then_matches_incremental_aggregates():
+    # Given: A repository with responses and an aggregator fed incrementally
+    repository = MockResponseRepository()
+    incremental = ResponseAggregator()
+    for i in range(7):
+        response = _response(f"response-{i}", i % 5 + 1, ["Yes"] if i % 2 else None)
+        await repository.create(response)
+        incremental.add(response)
+
+    # When: Rebuild a fresh aggregator from the repository
+    rebuilt = ResponseAggregator()
+    await rebuilt.rebuild(repository)
+
+    # Then: Both agree
+    assert rebuilt.get("form-1") == incremental.get("form-1")
+
+
+@pytest.mark.asyncio()
+async def test_given_user_data_deleted_when_aggregating_then_deleted_rows_are_subtracted():
+    # Given: Aggregates fed with two responses from one user and one from another
+    repository = MockResponseRepository()
+    aggregator = ResponseAggregator()
+    responses = [
+        _response("response-1", 5, user_id="user-1"),
+        _response("response-2", 3, user_id="user-1"),
+        _response("response-3", 4, user_id="user-2"),
+    ]
+    for response in responses:
+        await repository.create(response)
+        aggregator.add(response)
+
+    # When: Delete the first user's data
+    deleted_count = await DeleteUserDataUseCase(repository, aggregator).execute("user-1")
+
+    # Then: Exactly the removed responses are subtracted
+    expected_deleted = 2
+    aggregate = aggregator.get("form-1")
+    assert deleted_count == expected_deleted
+    assert aggregate is not None
+    assert aggregate.response_count == 1
+    assert aggregate.questions["q-rating"].rating_histogram == {4: 1}
@@ -0,0 +1,37 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from application.mappers.response_mapper import ResponseMapper
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+
+
+def test_given_response_when_cursor_token_round_trips_then_keeps_sort_key():
+    # Given: A submitted response
+    submitted_at = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+    response = Response(
+        id=ResponseId("response-1"),
+        form_id=FormId("form-1"),
+        submitted_at=submitted_at,
+    )
+
+    # When: Encode and decode its cursor
+    token = ResponseMapper.to_cursor_token(response)
+    cursor = ResponseMapper.cursor_from_token(token)
+
+    # Then: The cursor is opaque and URL safe, and preserves the sort key
+    assert "response-1" not in token
+    assert set(token) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+    assert cursor == ResponseCursor(submitted_at=submitted_at, response_id="response-1")
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", "W10", "WzEsMl0"])
+def test_given_malformed_token_when_decoding_cursor_then_raises_value_error(token: str) -> None:
+    # Given: A token that was not produced by the API
+    # When: Decode it
+    # Then: ValueError is raised
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        ResponseMapper.cursor_from_token(token)
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from application.cache.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio()
+async def test_given_concurrent_callers_when_run_same_key_then_operation_runs_once() -> None:
+    # Given: A slow operation behind a single-flight group
+    flight = SingleFlight()
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "form"
+
+    # When: Many callers ask for the same key at once
+    results = await asyncio.gather(*(flight.run("form-1", load) for _ in range(50)))
+
+    # Then: One load serves everyone and the key is released
+    assert results == ["form"] * 50
+    assert calls == 1
+    assert flight.leaders == 1
+    expected_followers = 49
+    assert flight.followers == expected_followers
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio()
+async def test_given_failing_operation_when_run_concurrently_then_all_callers_get_the_error() -> (
+    None
+):
+    # Given: An operation that fails
+    flight = SingleFlight()
+
+    async def load() -> str:
+        await asyncio.sleep(0.01)
+        msg = "boom"
+        raise ValueError(msg)
+
+    # When: Two callers share the failing call
+    results = await asyncio.gather(
+        flight.run("form-1", load), flight.run("form-1", load), return_exceptions=True
+    )
+
+    # Then: Both see the error and the failure is not remembered
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio()
+async def test_given_cancelled_leader_when_followers_wait_then_they_still_get_the_result() -> None:
+    # Given: A leader and a follower sharing a slow call
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return "form"
+
+    leader = asyncio.create_task(flight.run("form-1", load))
+    follower = asyncio.create_task(flight.run("form-1", load))
+    await asyncio.sleep(0)
+
+    # When: The leader is cancelled before the call completes
+    leader.cancel()
+    release.set()
+
+    # Then: The follower is unaffected
+    assert await follower == "form"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
@@ -0,0 +1,168 @@
+import logging
+
+import pytest
+
+from application.analytics.response_aggregator import ResponseAggregator
+from application.dto.requests.submit_response_request import AnswerRequest, SubmitResponseRequest
+from application.dto.responses.bulk_submit_responses_response import BulkItemStatus
+from application.use_cases.submit_response_use_case import SubmitResponseUseCase
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from infrastructure.persistence.mock_form_repository import MockFormRepository
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+class CountingFormRepository(MockFormRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_by_id(self, form_id: FormId) -> Form | None:
+        self.lookups += 1
+        return await super().get_by_id(form_id)
+
+
+class CountingResponseRepository(MockResponseRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        self.batches.append(len(responses))
+        return await super().create_many(responses)
+
+
+def _rating_form(form_id: str) -> Form:
+    return Form(
+        id=FormId(form_id),
+        type=FormType.SURVEY,
+        name=MultilingualText({"en": "Survey"}),
+        questions=[
+            Question(
+                id=QuestionId("q-rating"),
+                type=QuestionType.RATING,
+                text=MultilingualText({"en": "Rate"}),
+                required=True,
+                min_rating=1,
+                max_rating=5,
+            )
+        ],
+    )
+
+
+def _request(form_id: str, value: int) -> SubmitResponseRequest:
+    return SubmitResponseRequest(
+        form_id=form_id,
+        answers=[AnswerRequest(question_id="q-rating", value=value)],
+        user_id=None,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_mixed_items_when_execute_many_then_returns_results_in_request_order(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Given: Two forms and a batch with valid, invalid and unknown-form items
+    caplog.set_level(logging.INFO)
+    form_repository = CountingFormRepository()
+    response_repository = CountingResponseRepository()
+    await form_repository.create(_rating_form("form-a"))
+    await form_repository.create(_rating_form("form-b"))
+    aggregator = ResponseAggregator()
+    use_case = SubmitResponseUseCase(form_repository, response_repository, aggregator)
+    requests = [
+        _request("form-a", 5),
+        _request("form-b", 9),
+        _request("missing", 3),
+        _request("form-a", 4),
+        _request("form-b", 1),
+    ]
+
+    # When: Submit the batch
+    result = await use_case.execute_many(requests)
+
+    # Then: Each distinct form is read once and valid items are written in one batch
+    assert [item.index for item in result.results] == [0, 1, 2, 3, 4]
+    assert [item.status for item in result.results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.INVALID_ANSWER,
+        BulkItemStatus.FORM_NOT_FOUND,
+        BulkItemStatus.CREATED,
+        BulkItemStatus.CREATED,
+    ]
+    expected_created = 3
+    expected_failed = 2
+    distinct_forms = 3
+    expected_form_a_responses = 2
+    assert result.created == expected_created
+    assert result.failed == expected_failed
+    assert form_repository.lookups == distinct_forms
+    assert response_repository.batches == [expected_created]
+    created_ids = {item.response.id for item in result.results if item.response}
+    assert {str(r.id) for r in await response_repository.get_all()} == created_ids
+    form_a = aggregator.get("form-a")
+    form_b = aggregator.get("form-b")
+    assert form_a is not None
+    assert form_a.response_count == expected_form_a_responses
+    assert form_b is not None
+    assert form_b.response_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_given_only_invalid_items_when_execute_many_then_skips_repository_write() -> None:
+    # Given: A batch in which no item is valid
+    response_repository = CountingResponseRepository()
+    use_case = SubmitResponseUseCase(MockFormRepository(), response_repository)
+
+    # When: Submit the batch
+    result = await use_case.execute_many([_request("missing", 3)])
+
+    # Then: Nothing is written
+    assert result.created == 0
+    assert result.failed == 1
+    assert result.results[0].error == "Form with id missing not found"
+    assert response_repository.batches == []
+
+
+@pytest.mark.asyncio()
+async def test_given_blank_answers_in_batch_when_execute_many_then_only_they_fail() -> None:
+    # Given: A batch mixing valid items with blank text and empty list answers
+    form_repository = MockFormRepository()
+    response_repository = CountingResponseRepository()
+    await form_repository.create(_rating_form("form-a"))
+    use_case = SubmitResponseUseCase(form_repository, response_repository)
+    requests = [
+        _request("form-a", 5),
+        SubmitResponseRequest(
+            form_id="form-a",
+            answers=[AnswerRequest(question_id="q-rating", value="  ")],
+            user_id=None,
+        ),
+        SubmitResponseRequest(
+            form_id="form-a",
+            answers=[AnswerRequest(question_id="q-rating", value=[])],
+            user_id=None,
+        ),
+        _request("form-a", 2),
+    ]
+
+    # When: Submit the batch
+    result = await use_case.execute_many(requests)
+
+    # Then: Blank items are reported per item and the valid ones are stored
+    assert [item.status for item in result.results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.INVALID_ANSWER,
+        BulkItemStatus.INVALID_ANSWER,
+        BulkItemStatus.CREATED,
+    ]
+    expected_created = 2
+    assert result.created == expected_created
+    assert response_repository.batches == [expected_created]
+    assert len(await response_repository.get_all()) == expected_created
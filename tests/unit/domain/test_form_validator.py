@@ -0,0 +1,90 @@
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+
+
+def _choice_question(question_id: str) -> Question:
+    return Question(
+        id=QuestionId(question_id),
+        type=QuestionType.MULTIPLE_CHOICE,
+        text=MultilingualText({"en": "Priority"}),
+        required=True,
+        options=[
+            MultilingualText({"en": "Low", "es": "Baja"}),
+            MultilingualText({"en": "High", "es": "Alta"}),
+        ],
+    )
+
+
+def _rating_question(question_id: str) -> Question:
+    return Question(
+        id=QuestionId(question_id),
+        type=QuestionType.RATING,
+        text=MultilingualText({"en": "Rate"}),
+        required=True,
+        min_rating=1,
+        max_rating=5,
+    )
+
+
+def _form(questions: list[Question]) -> Form:
+    return Form(
+        id=FormId("form-1"),
+        type=FormType.SURVEY,
+        name=MultilingualText({"en": "Survey"}),
+        questions=questions,
+    )
+
+
+def test_given_form_when_get_validator_then_compiles_question_rules():
+    # Given: A form with a multiple choice and a rating question
+    form = _form([_choice_question("q-choice"), _rating_question("q-rating")])
+
+    # When: Get the compiled validator
+    validator = form.get_validator()
+
+    # Then: Rules are keyed by question id with precomputed options and bounds
+    choice = validator.get("q-choice")
+    rating = validator.get("q-rating")
+    assert choice is not None
+    assert choice.allowed_options == frozenset({"Low", "High"})
+    assert rating is not None
+    assert (rating.min_rating, rating.max_rating) == (1, 5)
+    assert validator.get("q-missing") is None
+
+
+def test_given_compiled_rules_when_validate_answers_then_matches_question_semantics():
+    # Given: Compiled rules for a multiple choice and a rating question
+    validator = _form([_choice_question("q-choice"), _rating_question("q-rating")]).get_validator()
+    choice = validator.get("q-choice")
+    rating = validator.get("q-rating")
+    assert choice is not None
+    assert rating is not None
+
+    # When: Validate answers
+    # Then: Results match Question.validate_answer
+    choice_values: list[str | int | list[str]] = [["Low"], ["Low", "High"], ["Baja"], "Low"]
+    rating_values: list[str | int | list[str]] = [1, 5, 0, 6, "3"]
+    for value in choice_values:
+        assert choice.validate_answer(value) is choice.question.validate_answer(value)
+    for value in rating_values:
+        assert rating.validate_answer(value) is rating.question.validate_answer(value)
+
+
+def test_given_compiled_form_when_questions_replaced_then_validator_is_rebuilt():
+    # Given: A form whose validator has been compiled
+    form = _form([_rating_question("q-old")])
+    form.compile_validator()
+
+    # When: Questions are replaced or added
+    form.questions = [_rating_question("q-new")]
+    form.add_question(_choice_question("q-added"))
+
+    # Then: Lookups reflect the current questions
+    assert form.get_question("q-old") is None
+    assert form.get_question("q-new") is not None
+    assert form.get_question("q-added") is not None
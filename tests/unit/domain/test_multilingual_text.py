@@ -41,3 +41,18 @@ def test_given_missing_language_code_when_get_text_without_default_then_returns_
     translations = {"en": "Hello", "fr": "Bonjour"}
     multilingual_text = MultilingualText(translations)
     assert multilingual_text.get_text("es") == "Hello"
+
+
+def test_given_preferred_languages_when_negotiate_language_then_returns_first_available():
+    multilingual_text = MultilingualText({"en": "Hello", "es": "Hola", "fr": "Bonjour"})
+    assert multilingual_text.negotiate_language(["de", "fr", "es"]) == "fr"
+
+
+def test_given_regional_language_tag_when_negotiate_language_then_matches_primary_subtag():
+    multilingual_text = MultilingualText({"en": "Hello", "es": "Hola"})
+    assert multilingual_text.negotiate_language(["es-MX"]) == "es"
+
+
+def test_given_unavailable_languages_when_negotiate_language_then_returns_first_translation():
+    multilingual_text = MultilingualText({"en": "Hello", "es": "Hola"})
+    assert multilingual_text.negotiate_language(["de"]) == "en"
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.batching_response_repository import BatchingResponseRepository
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+class RecordingResponseRepository(MockResponseRepository):
+    def __init__(self, failing_ids: set[str] | None = None) -> None:
+        super().__init__()
+        self.batch_sizes: list[int] = []
+        self._failing_ids = failing_ids or set()
+
+    async def create(self, response: Response) -> Response:
+        if str(response.id) in self._failing_ids:
+            msg = f"Cannot store {response.id}"
+            raise ValueError(msg)
+        return await super().create(response)
+
+    async def create_many(self, responses: list[Response]) -> list[Response]:
+        self.batch_sizes.append(len(responses))
+        if any(str(r.id) in self._failing_ids for r in responses):
+            msg = "Batch rejected"
+            raise ValueError(msg)
+        return await super().create_many(responses)
+
+
+def _response(response_id: str, user_id: str | None = None) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId("form-1"),
+        answers=[Answer(question_id=QuestionId("q-1"), value=5)],
+        user_id=user_id,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_concurrent_submissions_when_create_then_writes_one_batch():
+    # Given: A batching repository in front of a recording repository
+    inner = RecordingResponseRepository()
+    repository = BatchingResponseRepository(inner, max_batch_size=100, max_delay_seconds=0.01)
+
+    # When: Several responses are created concurrently
+    results = await asyncio.gather(*(repository.create(_response(f"r-{i}")) for i in range(10)))
+
+    # Then: Every caller gets its own response and a single batch is written
+    assert [str(r.id) for r in results] == [f"r-{i}" for i in range(10)]
+    assert inner.batch_sizes == [10]
+    assert len(await repository.get_all()) == 10  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_given_batch_size_reached_when_create_then_flushes_without_waiting():
+    # Given: A batching repository with a long delay and a small batch size
+    inner = RecordingResponseRepository()
+    repository = BatchingResponseRepository(inner, max_batch_size=2, max_delay_seconds=60)
+
+    # When: Two responses are created
+    results = await asyncio.wait_for(
+        asyncio.gather(repository.create(_response("r-1")), repository.create(_response("r-2"))),
+        timeout=1,
+    )
+
+    # Then: The batch is flushed as soon as it is full
+    assert len(results) == 2  # noqa: PLR2004
+    assert inner.batch_sizes == [2]
+
+
+@pytest.mark.asyncio()
+async def test_given_one_bad_response_in_batch_when_create_then_only_that_caller_fails():
+    # Given: An inner repository that rejects one response
+    inner = RecordingResponseRepository(failing_ids={"r-bad"})
+    repository = BatchingResponseRepository(inner, max_batch_size=100, max_delay_seconds=0.01)
+
+    # When: Good and bad responses are created in the same batch
+    results = await asyncio.gather(
+        repository.create(_response("r-1")),
+        repository.create(_response("r-bad")),
+        repository.create(_response("r-2")),
+        return_exceptions=True,
+    )
+
+    # Then: Only the bad submission gets an error
+    first, bad, second = results
+    assert isinstance(first, Response)
+    assert str(first.id) == "r-1"
+    assert isinstance(bad, ValueError)
+    assert isinstance(second, Response)
+    assert str(second.id) == "r-2"
+    assert {str(r.id) for r in await repository.get_all()} == {"r-1", "r-2"}
+
+
+@pytest.mark.asyncio()
+async def test_given_queued_write_when_delete_by_user_id_then_write_is_not_resurrected():
+    # Given: A response queued behind a long batching delay
+    inner = RecordingResponseRepository()
+    repository = BatchingResponseRepository(inner, max_batch_size=100, max_delay_seconds=60)
+    pending = asyncio.ensure_future(repository.create(_response("r-1", user_id="user-1")))
+    await asyncio.sleep(0)
+
+    # When: The user's data is deleted before the batch is flushed
+    deleted = await asyncio.wait_for(repository.delete_by_user_id("user-1"), timeout=1)
+
+    # Then: The queued write lands first and is erased with the rest
+    assert str((await pending).id) == "r-1"
+    assert [str(r.id) for r in deleted] == ["r-1"]
+    assert await repository.get_by_user_id("user-1") == []
+
+
+@pytest.mark.asyncio()
+async def test_given_queued_write_when_flush_then_write_is_stored():
+    # Given: A response queued behind a long batching delay
+    inner = RecordingResponseRepository()
+    repository = BatchingResponseRepository(inner, max_batch_size=100, max_delay_seconds=60)
+    pending = asyncio.ensure_future(repository.create(_response("r-1")))
+    await asyncio.sleep(0)
+
+    # When: The repository is flushed, as on shutdown
+    await asyncio.wait_for(repository.flush(), timeout=1)
+
+    # Then: The write reached the inner repository
+    assert pending.done()
+    assert inner.batch_sizes == [1]
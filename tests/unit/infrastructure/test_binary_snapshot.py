@@ -0,0 +1,203 @@
+import struct
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from application.analytics.response_aggregator import ResponseAggregator
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.binary_snapshot import BinarySnapshot, write_snapshot
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+from infrastructure.persistence.snapshot_response_repository import SnapshotResponseRepository
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _response(i: int) -> Response:
+    return Response(
+        id=ResponseId(f"response-{i:03d}"),
+        form_id=FormId(f"form-{i % 3}"),
+        answers=[
+            Answer(question_id=QuestionId("q-rating"), value=i % 5 + 1),
+            Answer(question_id=QuestionId("q-choice"), value=[f"option-{i % 2}"]),
+        ],
+        tags={"campaign": f"campaign-{i % 4}"} if i % 5 else {},
+        user_id=f"user-{i % 7}" if i % 6 else None,
+        submitted_at=BASE_TIME + timedelta(minutes=i // 2) if i % 9 else None,
+    )
+
+
+def _form(form_id: str) -> Form:
+    return Form(id=FormId(form_id), type=FormType.SURVEY, name=MultilingualText({"en": form_id}))
+
+
+async def _repositories(
+    tmp_path: Path, count: int = 60
+) -> tuple[MockResponseRepository, SnapshotResponseRepository]:
+    responses = [_response(i) for i in range(count)]
+    reference = MockResponseRepository()
+    await reference.create_many(responses)
+    path = tmp_path / "state.snapshot"
+    write_snapshot(path, [_form("form-0")], responses, {})
+    return reference, SnapshotResponseRepository(BinarySnapshot(path))
+
+
+async def _assert_same_queries(
+    reference: MockResponseRepository, snapshot: SnapshotResponseRepository
+) -> None:
+    filters: list[dict[str, object]] = [
+        {},
+        {"form_id": FormId("form-1")},
+        {"user_id": "user-3"},
+        {"tags": {"campaign": "campaign-2"}},
+        {"form_id": FormId("form-2"), "tags": {"campaign": "campaign-1"}},
+        {"since": BASE_TIME + timedelta(minutes=5), "until": BASE_TIME + timedelta(minutes=20)},
+        {"form_id": FormId("form-0"), "since": BASE_TIME},
+        {"user_id": "missing-user"},
+    ]
+    for query in filters:
+        expected = [page async for page in reference.iter_pages(page_size=4, **query)]  # type: ignore[arg-type]
+        actual = [page async for page in snapshot.iter_pages(page_size=4, **query)]  # type: ignore[arg-type]
+        assert actual == expected, query
+    assert sorted(await snapshot.get_all(), key=str) == sorted(await reference.get_all(), key=str)
+    assert len(snapshot) == len(reference)
+
+
+@pytest.mark.asyncio()
+async def test_given_snapshot_when_querying_then_results_match_the_in_memory_repository(
+    tmp_path: Path,
+) -> None:
+    # Given: The same responses in memory and in a mapped snapshot
+    reference, snapshot = await _repositories(tmp_path)
+
+    # When / Then: Every filter and page boundary returns the same responses
+    await _assert_same_queries(reference, snapshot)
+    assert await snapshot.get_by_id(ResponseId("response-007")) == _response(7)
+    assert await snapshot.get_by_id(ResponseId("missing")) is None
+
+
+@pytest.mark.asyncio()
+async def test_given_writes_over_snapshot_when_querying_then_overlay_and_deletions_apply(
+    tmp_path: Path,
+) -> None:
+    # Given: A snapshot-backed repository receiving new, replaced and deleted responses
+    reference, snapshot = await _repositories(tmp_path)
+    replaced = Response(
+        id=ResponseId("response-010"),
+        form_id=FormId("form-1"),
+        answers=[Answer(question_id=QuestionId("q-rating"), value=1)],
+        tags={"campaign": "campaign-9"},
+        user_id="user-3",
+        submitted_at=BASE_TIME + timedelta(minutes=3, seconds=30),
+    )
+    added = [_response(i) for i in range(60, 70)]
+
+    # When: The same writes are applied to both repositories
+    for repository in (reference, snapshot):
+        await repository.create(replaced)
+        await repository.create_many(added)
+        deleted = await repository.delete_by_user_id("user-2")
+
+    # Then: Reads see the overlay, the replacement and the deletions
+    expected_deleted = 9
+    assert len(deleted) == expected_deleted
+    await _assert_same_queries(reference, snapshot)
+    assert await snapshot.get_by_id(ResponseId("response-010")) == replaced
+    assert await snapshot.get_by_user_id("user-2") == []
+
+
+@pytest.mark.asyncio()
+async def test_given_cursor_between_equal_timestamps_when_querying_then_resumes_after_it(
+    tmp_path: Path,
+) -> None:
+    # Given: Two responses share every submitted_at minute
+    _, snapshot = await _repositories(tmp_path)
+    cursor = ResponseCursor(
+        submitted_at=BASE_TIME + timedelta(minutes=2), response_id="response-004"
+    )
+
+    # When
+    page = await snapshot.query(after=cursor, limit=2)
+
+    # Then
+    assert [str(response.id) for response in page] == ["response-005", "response-006"]
+
+
+def test_given_forms_and_aggregates_when_snapshotted_then_they_are_restored(
+    tmp_path: Path,
+) -> None:
+    # Given
+    aggregator = ResponseAggregator()
+    aggregator.add_many(_response(i) for i in range(20))
+    path = tmp_path / "state.snapshot"
+
+    # When
+    write_snapshot(path, [_form("form-0"), _form("form-1")], [], aggregator.aggregates())
+    snapshot = BinarySnapshot(path)
+
+    # Then
+    assert snapshot.forms() == [_form("form-0"), _form("form-1")]
+    assert snapshot.aggregates() == aggregator.aggregates()
+    assert len(snapshot) == 0
+
+
+def test_given_other_format_version_when_opening_snapshot_then_raises_value_error(
+    tmp_path: Path,
+) -> None:
+    # Given: A snapshot whose header declares a newer format version
+    path = tmp_path / "state.snapshot"
+    write_snapshot(path, [], [], {})
+    data = bytearray(path.read_bytes())
+    struct.pack_into("<I", data, 8, 99)
+    path.write_bytes(bytes(data))
+
+    # When / Then
+    with pytest.raises(ValueError, match="format version 99"):
+        BinarySnapshot(path)
+
+
+@pytest.mark.asyncio()
+async def test_given_queried_snapshot_when_closed_then_memory_map_is_released(
+    tmp_path: Path,
+) -> None:
+    # Given: A snapshot that has served queries
+    _, repository = await _repositories(tmp_path)
+    snapshot = repository._snapshot
+    await repository.query(form_id=FormId("form-1"), tags={"campaign": "campaign-2"})
+
+    # When
+    snapshot.close()
+
+    # Then
+    assert snapshot._buffer.closed
+    assert len(snapshot) == 0
+
+
+def test_given_concurrent_writers_when_writing_snapshot_then_each_uses_its_own_temp_file(
+    tmp_path: Path,
+) -> None:
+    # Given: Several workers writing the same snapshot path at once
+    path = tmp_path / "state.snapshot"
+    writers = [
+        threading.Thread(target=write_snapshot, args=(path, [_form(f"form-{i}")], [], {}))
+        for i in range(4)
+    ]
+
+    # When
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    # Then: One complete snapshot wins and no temporary file is left behind
+    assert len(BinarySnapshot(path).forms()) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["state.snapshot"]
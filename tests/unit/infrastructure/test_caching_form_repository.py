@@ -0,0 +1,161 @@
+import pytest
+
+from domain.entities.form import Form
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from infrastructure.persistence.caching_form_repository import CachingFormRepository
+from infrastructure.persistence.mock_form_repository import MockFormRepository
+
+
+class CountingFormRepository(MockFormRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_by_id(self, form_id: FormId) -> Form | None:
+        self.lookups += 1
+        return await super().get_by_id(form_id)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _form(form_id: str, name: str = "Survey") -> Form:
+    return Form(id=FormId(form_id), type=FormType.SURVEY, name=MultilingualText({"en": name}))
+
+
+@pytest.mark.asyncio()
+async def test_given_cached_form_when_get_by_id_again_then_skips_repository() -> None:
+    # Given: A form read once through the cache
+    inner = CountingFormRepository()
+    await inner.create(_form("form-1"))
+    repository = CachingFormRepository(inner)
+    await repository.get_by_id(FormId("form-1"))
+
+    # When: It is read again
+    form = await repository.get_by_id(FormId("form-1"))
+
+    # Then: The cached form is served
+    assert form is not None
+    assert str(form.id) == "form-1"
+    assert inner.lookups == 1
+    assert repository.hits == 1
+    assert repository.misses == 1
+
+
+@pytest.mark.asyncio()
+async def test_given_unknown_id_when_get_by_id_twice_then_caches_the_miss() -> None:
+    # Given: A cache in front of an empty repository
+    inner = CountingFormRepository()
+    repository = CachingFormRepository(inner)
+
+    # When: An unknown id is read twice, then the form is created
+    first = await repository.get_by_id(FormId("missing"))
+    second = await repository.get_by_id(FormId("missing"))
+    await repository.create(_form("missing"))
+    created = await repository.get_by_id(FormId("missing"))
+
+    # Then: The miss is cached until the create invalidates it
+    assert first is None
+    assert second is None
+    assert created is not None
+    expected_lookups = 2
+    assert inner.lookups == expected_lookups
+
+
+@pytest.mark.asyncio()
+async def test_given_cached_form_when_updated_or_deleted_then_entry_is_invalidated() -> None:
+    # Given: A cached form
+    inner = CountingFormRepository()
+    await inner.create(_form("form-1"))
+    repository = CachingFormRepository(inner)
+    await repository.get_by_id(FormId("form-1"))
+
+    # When: It is updated, read, deleted and read again
+    await repository.update(_form("form-1", name="Renamed"))
+    updated = await repository.get_by_id(FormId("form-1"))
+    await repository.delete(FormId("form-1"))
+    deleted = await repository.get_by_id(FormId("form-1"))
+
+    # Then: Each read after a write goes back to the repository
+    assert updated is not None
+    assert updated.name.translations == {"en": "Renamed"}
+    assert deleted is None
+    expected_lookups = 3
+    assert inner.lookups == expected_lookups
+
+
+@pytest.mark.asyncio()
+async def test_given_full_cache_when_new_form_read_then_evicts_least_recently_used() -> None:
+    # Given: A two-entry cache holding form-1 and form-2, with form-1 used last
+    inner = CountingFormRepository()
+    for form_id in ("form-1", "form-2", "form-3"):
+        await inner.create(_form(form_id))
+    repository = CachingFormRepository(inner, max_entries=2)
+    await repository.get_by_id(FormId("form-1"))
+    await repository.get_by_id(FormId("form-2"))
+    await repository.get_by_id(FormId("form-1"))
+
+    # When: A third form is read
+    await repository.get_by_id(FormId("form-3"))
+
+    # Then: form-2 is evicted and form-1 is still cached
+    lookups = inner.lookups
+    await repository.get_by_id(FormId("form-1"))
+    assert inner.lookups == lookups
+    await repository.get_by_id(FormId("form-2"))
+    assert inner.lookups == lookups + 1
+    assert repository.evictions >= 1
+    assert len(repository) == repository._max_entries
+
+
+@pytest.mark.asyncio()
+async def test_given_expired_entry_when_get_by_id_then_reloads_form() -> None:
+    # Given: A cached form whose TTL has elapsed
+    inner = CountingFormRepository()
+    await inner.create(_form("form-1"))
+    clock = FakeClock()
+    repository = CachingFormRepository(inner, ttl_seconds=10, clock=clock)
+    await repository.get_by_id(FormId("form-1"))
+    clock.now = 10.0
+
+    # When: It is read again
+    await repository.get_by_id(FormId("form-1"))
+
+    # Then: The repository is queried again
+    expected_lookups = 2
+    assert inner.lookups == expected_lookups
+
+
+@pytest.mark.asyncio()
+async def test_given_invalidation_during_load_when_load_completes_then_result_is_not_cached() -> (
+    None
+):
+    # Given: A repository whose lookup is overtaken by an update
+    class RacingFormRepository(CountingFormRepository):
+        cache: CachingFormRepository | None = None
+
+        async def get_by_id(self, form_id: FormId) -> Form | None:
+            form = await super().get_by_id(form_id)
+            if self.cache is not None and self.lookups == 1:
+                self.cache.invalidate(str(form_id))
+            return form
+
+    inner = RacingFormRepository()
+    await inner.create(_form("form-1"))
+    repository = CachingFormRepository(inner)
+    inner.cache = repository
+
+    # When: The form is read twice
+    await repository.get_by_id(FormId("form-1"))
+    await repository.get_by_id(FormId("form-1"))
+
+    # Then: The stale load was not stored
+    expected_lookups = 2
+    assert inner.lookups == expected_lookups
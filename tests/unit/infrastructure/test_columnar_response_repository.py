@@ -0,0 +1,233 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_columns import MISSING_CODE, MISSING_INTEGER
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.columnar_response_repository import (
+    COMPACTION_BATCH_SIZE,
+    ColumnarResponseRepository,
+)
+from infrastructure.persistence.serialization import to_epoch_micros
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _response(
+    i: int,
+    form_id: str = "form-1",
+    user_id: str | None = None,
+    tags: dict[str, str] | None = None,
+    answers: list[Answer] | None = None,
+) -> Response:
+    return Response(
+        id=ResponseId(f"response-{i}"),
+        form_id=FormId(form_id),
+        answers=answers
+        if answers is not None
+        else [
+            Answer(question_id=QuestionId("q-rating"), value=i % 5 + 1),
+            Answer(question_id=QuestionId("q-choice"), value=["red", "blue"]),
+            Answer(question_id=QuestionId("q-text"), value=f"Comment ñ {i}"),
+        ],
+        tags=tags or {},
+        user_id=user_id,
+        submitted_at=BASE_TIME + timedelta(minutes=i),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_stored_responses_when_reading_back_then_responses_are_reconstructed() -> None:
+    # Given: Responses with rating, choice and text answers, including sparse questions
+    repository = ColumnarResponseRepository()
+    first = _response(1, user_id="user-1", tags={"campaign": "spring"})
+    second = _response(2, answers=[Answer(question_id=QuestionId("q-text"), value="Only text")])
+    await repository.create_many([first, second])
+
+    # When: Read them through the row API
+    by_id = await repository.get_by_id(ResponseId("response-1"))
+    by_form = await repository.get_by_form_id(FormId("form-1"))
+    by_tag = await repository.query(tags={"campaign": "spring"})
+
+    # Then: Every field round-trips, answers keep their order
+    assert by_id == first
+    assert by_form == [first, second]
+    assert by_tag == [first]
+    assert await repository.get_by_id(ResponseId("missing")) is None
+
+
+@pytest.mark.asyncio()
+async def test_given_user_responses_deleted_when_reading_then_other_rows_survive_compaction() -> (
+    None
+):
+    # Given: Two users answering the same form
+    repository = ColumnarResponseRepository()
+    kept = _response(1, user_id="user-2")
+    await repository.create(_response(0, user_id="user-1"))
+    await repository.create(kept)
+    await repository.create(_response(2, user_id="user-1"))
+
+    # When: One user's data is deleted and the segment is compacted
+    deleted = await repository.delete_by_user_id("user-1")
+    before_compaction = await repository.get_by_form_id(FormId("form-1"))
+    await repository.wait_for_compaction()
+
+    # Then: Only the other user's response is left and indexes follow
+    assert [str(r.id) for r in deleted] == ["response-0", "response-2"]
+    assert len(repository) == 1
+    assert before_compaction == [kept]
+    assert await repository.get_by_form_id(FormId("form-1")) == [kept]
+    assert await repository.get_by_user_id("user-1") == []
+    assert await repository.get_by_id(ResponseId("response-1")) == kept
+
+
+@pytest.mark.asyncio()
+async def test_given_few_responses_deleted_when_deleting_then_text_is_erased_without_compaction() -> (
+    None
+):
+    # Given: A form with many responses, one of them from the user being deleted
+    repository = ColumnarResponseRepository()
+    expected_kept = 10
+    await repository.create_many([_response(i) for i in range(expected_kept)])
+    await repository.create(_response(expected_kept, user_id="user-1"))
+    segment = repository._segments["form-1"]
+
+    # When: The user's data is deleted
+    await repository.delete_by_user_id("user-1")
+
+    # Then: The row is a tombstone whose text bytes are overwritten in place
+    assert repository._segments["form-1"] is segment
+    assert not repository._compactions
+    assert f"Comment ñ {expected_kept}".encode() not in segment.texts["q-text"].data
+    assert segment.user_ids.codes[expected_kept] == MISSING_CODE
+    assert len(await repository.get_by_form_id(FormId("form-1"))) == expected_kept
+
+
+@pytest.mark.asyncio()
+async def test_given_compaction_running_when_writing_then_writes_are_kept() -> None:
+    # Given: A segment large enough to compact in several batches
+    repository = ColumnarResponseRepository()
+    total = COMPACTION_BATCH_SIZE * 3
+    await repository.create_many(
+        [_response(i, user_id="user-1" if i % 4 else None) for i in range(total)]
+    )
+    await repository.delete_by_user_id("user-1")
+    assert repository._compactions
+
+    # When: Responses are added and deleted while the compaction yields between batches
+    await asyncio.sleep(0)
+    await repository.create(_response(total, user_id="user-2"))
+    await repository.create(_response(total + 1))
+    await repository.delete_by_user_id("user-2")
+    await repository.wait_for_compaction()
+
+    # Then: The compacted segment holds exactly the surviving responses
+    expected = [_response(i) for i in range(0, total, 4)] + [_response(total + 1)]
+    assert await repository.get_by_form_id(FormId("form-1")) == expected
+    assert len(repository) == len(expected)
+    assert await repository.get_by_user_id("user-2") == []
+
+
+@pytest.mark.asyncio()
+async def test_given_response_recreated_during_compaction_when_swapping_then_it_is_kept() -> None:
+    # Given: A compaction running over a segment with a response about to be replaced
+    repository = ColumnarResponseRepository()
+    total = COMPACTION_BATCH_SIZE * 3
+    await repository.create_many(
+        [_response(i, user_id="user-1" if i % 4 else None) for i in range(total)]
+    )
+    await repository.delete_by_user_id("user-1")
+    assert repository._compactions
+
+    # When: The response is deleted and re-created while the compaction yields
+    await asyncio.sleep(0)
+    await repository.create(_response(total, user_id="user-2"))
+    await repository.delete_by_user_id("user-2")
+    recreated = _response(total, user_id="user-3")
+    await repository.create(recreated)
+    await repository.wait_for_compaction()
+
+    # Then: The compacted segment still holds the re-created response
+    assert await repository.get_by_id(ResponseId(f"response-{total}")) == recreated
+    assert await repository.get_by_user_id("user-3") == [recreated]
+    assert (await repository.get_by_form_id(FormId("form-1")))[-1] == recreated
+    assert len(repository) == len(range(0, total, 4)) + 1
+
+
+@pytest.mark.asyncio()
+async def test_given_few_responses_deleted_when_deleting_then_postings_are_cleared() -> None:
+    # Given: A tagged, rated response among many that survive
+    repository = ColumnarResponseRepository()
+    expected_kept = 10
+    await repository.create_many([_response(i) for i in range(expected_kept)])
+    await repository.create(_response(expected_kept, user_id="user-1", tags={"campaign": "spring"}))
+    segment = repository._segments["form-1"]
+
+    # When: The user's data is deleted without triggering a compaction
+    await repository.delete_by_user_id("user-1")
+
+    # Then: The tombstone no longer carries tag, rating or choice values
+    choices = segment.choices["q-choice"]
+    start, stop = choices.offsets[expected_kept], choices.offsets[expected_kept + 1]
+    assert not repository._compactions
+    assert segment.tags["campaign"].codes[expected_kept] == MISSING_CODE
+    assert segment.ratings["q-rating"].values[expected_kept] == MISSING_INTEGER
+    assert set(choices.codes[start:stop]) == {MISSING_CODE}
+    assert await repository.query(tags={"campaign": "spring"}) == []
+
+
+@pytest.mark.asyncio()
+async def test_given_response_recreated_when_reading_then_latest_version_is_returned() -> None:
+    # Given: A response stored twice under the same id, moving to another form
+    repository = ColumnarResponseRepository()
+    await repository.create(_response(1, form_id="form-1"))
+    moved = _response(1, form_id="form-2", user_id="user-9")
+    await repository.create(moved)
+
+    # When: Query by both forms and by user
+    form1 = await repository.get_by_form_id(FormId("form-1"))
+    form2 = await repository.get_by_form_id(FormId("form-2"))
+
+    # Then: Only the latest version is visible
+    assert form1 == []
+    assert form2 == [moved]
+    assert await repository.get_by_user_id("user-9") == [moved]
+    assert await repository.get_all() == [moved]
+    await repository.wait_for_compaction()
+    assert "form-1" not in repository._segments
+
+
+@pytest.mark.asyncio()
+async def test_given_stored_responses_when_iterating_columns_then_pages_expose_encoded_columns() -> (
+    None
+):
+    # Given: Three responses, one without a rating answer
+    repository = ColumnarResponseRepository()
+    await repository.create(_response(0, user_id="user-1", tags={"source": "ios"}))
+    await repository.create(
+        _response(1, answers=[Answer(question_id=QuestionId("q-text"), value="No rating")])
+    )
+    await repository.create(_response(2, user_id="user-1", tags={"source": "web"}))
+
+    # When: Iterate the form columns two rows at a time
+    pages = [page async for page in repository.iter_columns(form_id=FormId("form-1"), page_size=2)]
+
+    # Then: Columns are sliced per page with dictionary-encoded strings
+    expected_pages = 2
+    first = pages[0]
+    assert len(pages) == expected_pages
+    assert list(first.response_ids) == ["response-0", "response-1"]
+    assert list(first.ratings["q-rating"]) == [1, MISSING_INTEGER]
+    assert first.answers["q-choice"][0] == ["red", "blue"]
+    assert first.answers["q-choice"][1] is None
+    assert first.answers["q-text"][1] == "No rating"
+    assert first.user_ids.get(0) == "user-1"
+    assert first.user_ids.get(1) is None
+    assert first.tags["source"].get(0) == "ios"
+    assert first.submitted_at[1] == to_epoch_micros(BASE_TIME + timedelta(minutes=1))
+    assert pages[1].tags["source"].get(0) == "web"
@@ -0,0 +1,108 @@
+import pytest
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.compact_response import ResponseCompactor
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+def _response(response_id: str, rating: int = 5) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId("".join(["form-", "1"])),
+        answers=[
+            Answer(question_id=QuestionId("q-rating"), value=rating),
+            Answer(question_id=QuestionId("q-choice"), value=["".join(["opt", "ion-a"])]),
+            Answer(question_id=QuestionId("q-text"), value="Great"),
+        ],
+        tags={"campaign": "".join(["spring-", "2024"])},
+        user_id="".join(["user", "-1"]),
+    )
+
+
+def test_given_response_when_compacted_then_it_equals_the_original() -> None:
+    # Given
+    compactor = ResponseCompactor()
+    response = _response("response-1")
+
+    # When
+    compacted = compactor.compact(response)
+
+    # Then
+    assert compacted.to_response() == response
+
+
+def test_given_similar_responses_when_compacted_then_repeated_values_are_shared() -> None:
+    # Given
+    compactor = ResponseCompactor()
+
+    # When
+    first = compactor.compact(_response("response-1"))
+    second = compactor.compact(_response("response-2"))
+    other_rating = compactor.compact(_response("response-3", rating=3))
+
+    # Then
+    assert first.form_id is second.form_id
+    assert first.tags is second.tags
+    assert first.answers[0] is second.answers[0]
+    assert first.answers[0] is not other_rating.answers[0]
+    assert first.answers[1].question_id is second.answers[1].question_id
+    assert isinstance(first.answers[1].value, list)
+    assert isinstance(second.answers[1].value, list)
+    assert first.answers[1].value[0] is second.answers[1].value[0]
+
+
+@pytest.mark.asyncio()
+async def test_given_compacting_repository_when_reading_back_then_responses_are_unchanged() -> None:
+    # Given
+    repository = MockResponseRepository()
+    original = _response("response-1")
+    await repository.create(original)
+
+    # When
+    stored = await repository.get_by_id(ResponseId("response-1"))
+    by_tag = await repository.query(tags={"campaign": "spring-2024"})
+
+    # Then
+    assert stored == original
+    assert by_tag == [original]
+
+
+@pytest.mark.asyncio()
+async def test_given_erased_user_when_deleted_then_their_tag_sets_are_released() -> None:
+    # Given: Two users whose responses carry different tag sets
+    repository = MockResponseRepository()
+    erased = _response("response-1")
+    erased.tags = {"campaign": "private-campaign"}
+    erased.user_id = "user-erased"
+    await repository.create(erased)
+    await repository.create(_response("response-2"))
+
+    # When: The first user is erased
+    await repository.delete_by_user_id("user-erased")
+
+    # Then: Only the remaining response's tag set is still interned
+    assert list(repository._compactor._tags) == [(("campaign", "spring-2024"),)]
+
+
+@pytest.mark.asyncio()
+async def test_given_shared_tags_when_a_returned_response_is_mutated_then_storage_is_unchanged() -> (
+    None
+):
+    # Given: Two stored responses sharing one tag set
+    repository = MockResponseRepository()
+    await repository.create(_response("response-1"))
+    await repository.create(_response("response-2"))
+
+    # When: A caller edits the tags of a response it read
+    first = await repository.get_by_id(ResponseId("response-1"))
+    assert first is not None
+    first.tags["campaign"] = "autumn-2024"
+
+    # Then: Stored responses and the tag index still agree
+    by_tag = await repository.query(tags={"campaign": "spring-2024"})
+    assert [str(r.id) for r in by_tag] == ["response-1", "response-2"]
+    assert all(r.tags == {"campaign": "spring-2024"} for r in by_tag)
@@ -0,0 +1,204 @@
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+import infrastructure.config.dependencies as deps
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.journal import Journal
+from infrastructure.persistence.mock_form_repository import MockFormRepository
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+def _form(form_id: str, name: str = "Survey") -> Form:
+    return Form(id=FormId(form_id), type=FormType.SURVEY, name=MultilingualText({"en": name}))
+
+
+def _response(response_id: str, user_id: str | None = None) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId("form-1"),
+        answers=[Answer(question_id=QuestionId("q-1"), value=4)],
+        tags={"campaign": "spring"},
+        user_id=user_id,
+        submitted_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_journaled_mutations_when_repositories_restart_then_state_is_recovered(
+    tmp_path: Path,
+) -> None:
+    # Given: Forms and responses created, updated and deleted through journaled repositories
+    forms_journal = Journal(tmp_path, "forms")
+    responses_journal = Journal(tmp_path, "responses")
+    forms = MockFormRepository(forms_journal)
+    responses = MockResponseRepository(responses_journal)
+    await forms.create(_form("form-1"))
+    await forms.create(_form("form-2"))
+    await forms.update(_form("form-1", name="Renamed"))
+    await forms.delete(FormId("form-2"))
+    await responses.create_many([_response("r-1", "user-1"), _response("r-2", "user-2")])
+    await responses.delete_by_user_id("user-1")
+    forms_journal.close()
+    responses_journal.close()
+
+    # When: New repositories replay the same journals
+    recovered_forms = MockFormRepository(Journal(tmp_path, "forms"))
+    recovered_responses = MockResponseRepository(Journal(tmp_path, "responses"))
+
+    # Then: The latest state is restored
+    recovered = await recovered_forms.get_all()
+    assert [form.name.translations for form in recovered] == [{"en": "Renamed"}]
+    assert await recovered_responses.get_all() == [_response("r-2", "user-2")]
+    assert await recovered_responses.get_by_user_id("user-1") == []
+
+
+@pytest.mark.asyncio()
+async def test_given_snapshot_threshold_reached_when_writing_then_snapshot_and_log_tail_replay(
+    tmp_path: Path,
+) -> None:
+    # Given: A journal that snapshots every three records
+    journal = Journal(tmp_path, "responses", snapshot_every=3)
+    responses = MockResponseRepository(journal)
+
+    # When: Five responses are written and the snapshot completes
+    for i in range(5):
+        await responses.create(_response(f"r-{i}"))
+        await journal.wait_for_snapshot()
+    journal.close()
+
+    # Then: The snapshot holds the first three, the log only the tail
+    expected_log_records = 2
+    assert (tmp_path / "responses.snapshot").exists()
+    assert not (tmp_path / "responses.log.1").exists()
+    log_lines = (tmp_path / "responses.log").read_text().splitlines()
+    assert len(log_lines) == expected_log_records
+    recovered = MockResponseRepository(Journal(tmp_path, "responses"))
+    assert [str(r.id) for r in await recovered.get_all()] == [f"r-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio()
+async def test_given_snapshot_in_flight_when_shutting_down_then_it_completes_before_unlock(
+    tmp_path: Path,
+) -> None:
+    # Given: A registered journal whose snapshot is still being written
+    journal = Journal(tmp_path, "responses", snapshot_every=3)
+    deps._journals.append(journal)
+    responses = MockResponseRepository(journal)
+    for i in range(3):
+        await responses.create(_response(f"r-{i}"))
+
+    # When: The dependencies are shut down
+    await deps.shutdown_dependencies()
+
+    # Then: The snapshot finished before the journal lock was released
+    assert (tmp_path / "responses.snapshot").exists()
+    assert not (tmp_path / "responses.log.1").exists()
+    recovered = MockResponseRepository(Journal(tmp_path, "responses"))
+    assert [str(r.id) for r in await recovered.get_all()] == [f"r-{i}" for i in range(3)]
+
+
+@pytest.mark.asyncio()
+async def test_given_torn_last_record_when_replaying_then_it_is_discarded_and_truncated(
+    tmp_path: Path,
+) -> None:
+    # Given: A journal whose last write was cut short
+    journal = Journal(tmp_path, "forms")
+    forms = MockFormRepository(journal)
+    await forms.create(_form("form-1"))
+    journal.close()
+    log_path = tmp_path / "forms.log"
+    intact_size = log_path.stat().st_size
+    with log_path.open("a") as log:
+        log.write('{"sequence":2,"op":"put","form":{"id"')
+
+    # When: The journal is replayed and written again
+    recovered_journal = Journal(tmp_path, "forms")
+    recovered = MockFormRepository(recovered_journal)
+    truncated_size = log_path.stat().st_size
+    await recovered.create(_form("form-2"))
+    recovered_journal.close()
+    replayed = MockFormRepository(Journal(tmp_path, "forms"))
+
+    # Then: Only complete records survive and new writes stay readable
+    assert truncated_size == intact_size
+    assert [str(form.id) for form in await replayed.get_all()] == ["form-1", "form-2"]
+
+
+def test_given_corrupt_record_before_the_tail_when_replaying_then_raises_value_error(
+    tmp_path: Path,
+) -> None:
+    # Given: A complete but unreadable record in the middle of the log
+    (tmp_path / "forms.log").write_text('not json\n{"sequence":2,"op":"delete","id":"x"}\n')
+
+    # When / Then: Replay refuses to guess
+    with pytest.raises(ValueError, match="Corrupt journal record"):
+        MockFormRepository(Journal(tmp_path, "forms"))
+
+
+@pytest.mark.asyncio()
+async def test_given_fsync_interval_when_writing_then_fsync_is_batched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: A journal that fsyncs at most once per minute
+    fsyncs: list[int] = []
+    monkeypatch.setattr("infrastructure.persistence.journal.os.fsync", fsyncs.append)
+    journal = Journal(tmp_path, "responses", fsync_interval_seconds=60)
+    responses = MockResponseRepository(journal)
+
+    # When: Several responses are written, then the journal is closed
+    for i in range(10):
+        await responses.create(_response(f"r-{i}"))
+    fsyncs_before_close = len(fsyncs)
+    journal.close()
+
+    # Then: Writes share a single fsync on close
+    assert fsyncs_before_close == 0
+    assert len(fsyncs) == 1
+
+
+@pytest.mark.asyncio()
+async def test_given_fsync_on_every_write_when_writing_then_fsync_runs_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: A journal that fsyncs every write
+    fsync_threads: list[int] = []
+    monkeypatch.setattr(
+        "infrastructure.persistence.journal.os.fsync",
+        lambda _: fsync_threads.append(threading.get_ident()),
+    )
+    journal = Journal(tmp_path, "responses", fsync_interval_seconds=0)
+    responses = MockResponseRepository(journal)
+
+    # When: Responses are written
+    for i in range(3):
+        await responses.create(_response(f"r-{i}"))
+
+    # Then: Each write was fsynced before returning, in a worker thread
+    expected_fsyncs = 3
+    assert len(fsync_threads) == expected_fsyncs
+    assert threading.get_ident() not in fsync_threads
+    journal.close()
+
+
+def test_given_journal_in_use_when_another_opens_it_then_fails_fast(tmp_path: Path) -> None:
+    # Given: A journal replayed by a running process
+    journal = Journal(tmp_path, "forms")
+    MockFormRepository(journal)
+
+    # When / Then: A second writer on the same directory is refused until the first closes
+    with pytest.raises(RuntimeError, match="already in use"):
+        MockFormRepository(Journal(tmp_path, "forms"))
+    journal.close()
+    reopened = Journal(tmp_path, "forms")
+    MockFormRepository(reopened)
+    reopened.close()
@@ -0,0 +1,121 @@
+import io
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from infrastructure.config.logging_config import (
+    DroppingQueueHandler,
+    JSONFormatter,
+    SamplingFilter,
+    configure_logging,
+)
+
+
+def _record(
+    name: str = "app", level: int = logging.INFO, msg: str = "hello %s", **extra: object
+) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, msg, ("world",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture()
+def root_logger_state():
+    root = logging.getLogger()
+    level = root.level
+    handlers = list(root.handlers)
+    yield
+    root.setLevel(level)
+    for handler in root.handlers:
+        if handler not in handlers:
+            root.removeHandler(handler)
+
+
+def test_given_extra_fields_when_formatting_then_they_are_merged_into_json() -> None:
+    # Given
+    record = _record(form_id="f1", created_count=3)
+
+    # When
+    payload = json.loads(JSONFormatter().format(record))
+
+    # Then
+    expected_count = 3
+    assert payload["message"] == "hello world"
+    assert payload["level"] == "INFO"
+    assert payload["form_id"] == "f1"
+    assert payload["created_count"] == expected_count
+    assert "args" not in payload
+
+
+def test_given_record_with_exception_when_queued_then_traceback_survives_formatting() -> None:
+    # Given
+    message = "boom"
+    try:
+        raise RuntimeError(message)  # noqa: TRY301
+    except RuntimeError:
+        record = logging.LogRecord(
+            "app", logging.ERROR, __file__, 1, "failed", (), exc_info=sys.exc_info()
+        )
+    handler = DroppingQueueHandler(queue.Queue())
+
+    # When
+    prepared = handler.prepare(record)
+    payload = json.loads(JSONFormatter().format(prepared))
+
+    # Then
+    assert prepared.exc_info is None
+    assert "RuntimeError: boom" in payload["exception"]
+
+
+def test_given_zero_rate_when_filtering_then_info_is_dropped_but_warnings_are_kept() -> None:
+    # Given
+    sampling = SamplingFilter({"app.noisy": 0.0}, random_value=lambda: 0.5)
+
+    # When / Then
+    assert sampling.filter(_record("app.noisy.child")) is False
+    assert sampling.filter(_record("app.noisy", logging.WARNING)) is True
+    assert sampling.filter(_record("app.other")) is True
+
+
+def test_given_partial_rate_when_filtering_then_most_specific_logger_rate_applies() -> None:
+    # Given
+    sampling = SamplingFilter({"app": 0.0, "app.api": 0.5}, random_value=lambda: 0.25)
+
+    # When / Then
+    assert sampling.filter(_record("app.api.routes")) is True
+    assert sampling.filter(_record("app.store")) is False
+
+
+def test_given_full_queue_when_logging_then_record_is_dropped_and_counted() -> None:
+    # Given
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+
+    # When
+    handler.handle(_record())
+    handler.handle(_record())
+
+    # Then
+    assert handler.dropped == 1
+
+
+@pytest.mark.usefixtures("root_logger_state")
+def test_given_configured_pipeline_when_logging_then_listener_writes_json_lines() -> None:
+    # Given
+    stream = io.StringIO()
+    pipeline = configure_logging("INFO", {"tests.sampled": 0.0}, stream=stream)
+    logger = logging.getLogger("tests.pipeline")
+
+    # When
+    logger.info("submitted", extra={"response_id": "r1"})
+    logging.getLogger("tests.sampled").info("dropped")
+    logging.getLogger("tests.sampled").warning("kept")
+    pipeline.stop()
+    logging.getLogger().removeHandler(pipeline.handler)
+
+    # Then
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["submitted", "kept"]
+    assert lines[0]["response_id"] == "r1"
@@ -0,0 +1,87 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from domain.entities.form import Form
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from infrastructure.metrics.instrumentation import (
+    InstrumentedFormRepository,
+    UseCaseInstrumentation,
+)
+from infrastructure.metrics.service_metrics import ServiceMetrics
+from infrastructure.persistence.mock_form_repository import MockFormRepository
+
+
+class EchoUseCase:
+    def __init__(self) -> None:
+        self.name = "echo"
+
+    async def execute(self, value: str) -> str:
+        if not value:
+            msg = "empty"
+            raise ValueError(msg)
+        return value
+
+    async def stream(self, count: int) -> AsyncIterator[int]:
+        for i in range(count):
+            yield i
+
+
+@pytest.mark.asyncio()
+async def test_given_instrumented_use_case_when_executed_then_records_outcomes() -> None:
+    # Given: An instrumented use case
+    metrics = ServiceMetrics()
+    use_case = UseCaseInstrumentation(metrics.use_case_duration).wrap(EchoUseCase())
+
+    # When: It succeeds once, fails once and streams once
+    result = await use_case.execute("hello")
+    with pytest.raises(ValueError, match="empty"):
+        await use_case.execute("")
+    streamed = [item async for item in use_case.stream(3)]
+
+    # Then: Results pass through and every call is timed under its outcome
+    text = metrics.render()
+    assert result == "hello"
+    assert streamed == [0, 1, 2]
+    assert use_case.name == "echo"
+    assert (
+        'use_case_duration_seconds_count{use_case="EchoUseCase",method="execute",outcome="ok"} 1'
+        in text
+    )
+    assert (
+        'use_case_duration_seconds_count{use_case="EchoUseCase",method="execute",outcome="error"} 1'
+        in text
+    )
+    assert (
+        'use_case_duration_seconds_count{use_case="EchoUseCase",method="stream",outcome="ok"} 1'
+        in text
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_instrumented_repository_when_called_then_records_operation_timings() -> None:
+    # Given: An instrumented in-memory form repository
+    metrics = ServiceMetrics()
+    repository = InstrumentedFormRepository(MockFormRepository(), metrics.repository_duration)
+    form = Form(id=FormId("form-1"), type=FormType.SURVEY, name=MultilingualText({"en": "Survey"}))
+
+    # When: A form is created, read and deleted twice
+    await repository.create(form)
+    loaded = await repository.get_by_id(FormId("form-1"))
+    await repository.delete(FormId("form-1"))
+    with pytest.raises(ValueError, match="not found"):
+        await repository.delete(FormId("form-1"))
+
+    # Then: The calls reach the repository and are timed per operation
+    text = metrics.render()
+    assert loaded is form
+    assert (
+        'repository_operation_duration_seconds_count{repository="forms",operation="get_by_id",'
+        'outcome="ok"} 1' in text
+    )
+    assert (
+        'repository_operation_duration_seconds_count{repository="forms",operation="delete",'
+        'outcome="error"} 1' in text
+    )
@@ -0,0 +1,76 @@
+import pytest
+
+from infrastructure.metrics.registry import MetricsRegistry
+
+
+def test_given_labelled_counter_when_render_then_emits_one_sample_per_label_set() -> None:
+    # Given: A counter incremented under two label sets
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("route", "status"))
+    requests.labels("/forms/{form_id}", "200").inc()
+    requests.labels("/forms/{form_id}", "200").inc()
+    requests.labels("/forms/{form_id}", "404").inc()
+
+    # When: The registry is rendered
+    text = registry.render()
+
+    # Then: It is in Prometheus text format
+    assert "# HELP requests_total Requests\n# TYPE requests_total counter\n" in text
+    assert 'requests_total{route="/forms/{form_id}",status="200"} 2.0' in text
+    assert 'requests_total{route="/forms/{form_id}",status="404"} 1.0' in text
+
+
+def test_given_observations_when_render_histogram_then_buckets_are_cumulative() -> None:
+    # Given: A histogram with three buckets
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 2.0):
+        latency.observe(value)
+
+    # When: The registry is rendered
+    lines = registry.render().splitlines()
+
+    # Then: Each bucket counts every observation at or below its bound
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="0.5"} 3' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_sum 2.45" in lines
+    assert "latency_seconds_count 4" in lines
+
+
+def test_given_callback_metric_when_bound_and_unbound_then_sample_follows_source() -> None:
+    # Given: A callback gauge bound to a growing store
+    registry = MetricsRegistry()
+    store: list[int] = [1, 2]
+    size = registry.callback("store_size", "Store size")
+    size.bind(lambda: len(store))
+
+    # When: The store grows, then the source is unbound
+    store.append(3)
+    bound = registry.render()
+    size.bind(None)
+    unbound = registry.render()
+
+    # Then: The value is read at render time and dropped once unbound
+    assert "store_size 3.0" in bound
+    assert not any(line.startswith("store_size ") for line in unbound.splitlines())
+
+
+def test_given_label_with_quotes_when_render_then_value_is_escaped() -> None:
+    # Given: A gauge labelled with a value that needs escaping
+    registry = MetricsRegistry()
+    registry.gauge("queue_depth", "Depth", ("name",)).labels('a"b\\c').set(4)
+
+    # When / Then: The label value is escaped
+    assert 'queue_depth{name="a\\"b\\\\c"} 4.0' in registry.render()
+
+
+def test_given_registered_name_when_registered_again_then_raises_error() -> None:
+    # Given: A registry with a counter
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests")
+
+    # When / Then: Registering the same name fails
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("requests_total", "Requests")
@@ -82,11 +82,12 @@ async def test_given_responses_with_user_id_when_delete_by_user_id_then_deletes_
     await repository.create(response3)
 
     # When: Delete responses by user_id
-    deleted_count = await repository.delete_by_user_id(user1_id)
+    deleted = await repository.delete_by_user_id(user1_id)
 
-    # Then: Matching responses are deleted
+    # Then: Matching responses are deleted and returned
     expected_deleted_count = 2
-    assert deleted_count == expected_deleted_count
+    assert len(deleted) == expected_deleted_count
+    assert {r.user_id for r in deleted} == {user1_id}
 
     # And: Other user's responses remain
     remaining = await repository.get_all()
@@ -95,15 +96,15 @@ async def test_given_responses_with_user_id_when_delete_by_user_id_then_deletes_
 
 
 @pytest.mark.asyncio()
-async def test_given_no_responses_for_user_when_delete_by_user_id_then_returns_zero():
+async def test_given_no_responses_for_user_when_delete_by_user_id_then_returns_nothing():
     # Given: A repository without responses for a user
     repository = MockResponseRepository()
 
     # When: Delete responses by user_id
-    deleted_count = await repository.delete_by_user_id("nonexistent-user")
+    deleted = await repository.delete_by_user_id("nonexistent-user")
 
-    # Then: Zero is returned
-    assert deleted_count == 0
+    # Then: No responses are returned
+    assert deleted == []
 
 
 @pytest.mark.asyncio()
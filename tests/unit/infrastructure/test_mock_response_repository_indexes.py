@@ -0,0 +1,67 @@
+import pytest
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+
+
+def _response(response_id: str, form_id: str, user_id: str | None = None) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId(form_id),
+        answers=[Answer(question_id=QuestionId("q-1"), value=5)],
+        user_id=user_id,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_responses_for_several_forms_when_get_by_form_id_then_returns_only_that_form():
+    # Given: Responses spread across two forms
+    repository = MockResponseRepository()
+    await repository.create(_response("response-1", "form-1"))
+    await repository.create(_response("response-2", "form-2"))
+    await repository.create(_response("response-3", "form-1"))
+
+    # When: Get responses by form_id
+    result = await repository.get_by_form_id(FormId("form-1"))
+
+    # Then: Only that form's responses are returned, in insertion order
+    assert [str(r.id) for r in result] == ["response-1", "response-3"]
+
+
+@pytest.mark.asyncio()
+async def test_given_response_recreated_with_new_owner_when_get_by_user_id_then_indexes_follow():
+    # Given: A response stored twice under the same id with a different form and user
+    repository = MockResponseRepository()
+    await repository.create(_response("response-1", "form-1", user_id="user1"))
+    await repository.create(_response("response-1", "form-2", user_id="user2"))
+
+    # When: Query both indexes
+    user1_responses = await repository.get_by_user_id("user1")
+    user2_responses = await repository.get_by_user_id("user2")
+    form1_responses = await repository.get_by_form_id(FormId("form-1"))
+
+    # Then: Only the latest version is indexed
+    assert user1_responses == []
+    assert [str(r.id) for r in user2_responses] == ["response-1"]
+    assert form1_responses == []
+
+
+@pytest.mark.asyncio()
+async def test_given_user_responses_deleted_when_get_by_form_id_then_form_index_is_updated():
+    # Given: A form with responses from two users
+    repository = MockResponseRepository()
+    await repository.create(_response("response-1", "form-1", user_id="user1"))
+    await repository.create(_response("response-2", "form-1", user_id="user2"))
+
+    # When: Delete one user's data
+    deleted = await repository.delete_by_user_id("user1")
+
+    # Then: The form index no longer returns the deleted response
+    assert [str(r.id) for r in deleted] == ["response-1"]
+    remaining = await repository.get_by_form_id(FormId("form-1"))
+    assert [str(r.id) for r in remaining] == ["response-2"]
+    assert await repository.get_by_user_id("user1") == []
@@ -0,0 +1,226 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from domain.entities.answer import Answer
+from domain.entities.response import Response
+from domain.repositories.response_repository import ResponseRepository
+from domain.value_objects.form_id import FormId
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.response_cursor import ResponseCursor
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.mock_response_repository import MockResponseRepository
+from infrastructure.persistence.sqlite_database import SQLiteDatabase
+from infrastructure.persistence.sqlite_response_repository import SQLiteResponseRepository
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def repository(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> AsyncIterator[ResponseRepository]:
+    if request.param == "memory":
+        yield MockResponseRepository()
+        return
+    database = SQLiteDatabase(str(tmp_path / "feedback.db"))
+    yield SQLiteResponseRepository(database)
+    database.close()
+
+
+def _response(
+    response_id: str,
+    form_id: str,
+    minutes: int | None,
+    user_id: str | None = None,
+    tags: dict[str, str] | None = None,
+) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId(form_id),
+        answers=[Answer(question_id=QuestionId("q-1"), value=5)],
+        tags=tags or {},
+        user_id=user_id,
+        submitted_at=BASE_TIME + timedelta(minutes=minutes) if minutes is not None else None,
+    )
+
+
+async def _walk(
+    repository: ResponseRepository, limit: int, form_id: FormId | None = None
+) -> list[list[str]]:
+    pages: list[list[str]] = []
+    after: ResponseCursor | None = None
+    while True:
+        page = await repository.query(form_id=form_id, after=after, limit=limit)
+        if not page:
+            return pages
+        pages.append([str(r.id) for r in page])
+        after = ResponseCursor(submitted_at=page[-1].submitted_at, response_id=str(page[-1].id))
+
+
+@pytest.mark.asyncio()
+async def test_given_responses_out_of_order_when_query_then_sorted_by_submitted_at_and_id(
+    repository,
+):
+    # Given: Responses inserted out of time order, with a tie and a missing timestamp
+    await repository.create(_response("response-c", "form-1", 2))
+    await repository.create(_response("response-b", "form-1", 1))
+    await repository.create(_response("response-a", "form-1", 2))
+    await repository.create(_response("response-z", "form-1", None))
+
+    # When: Query everything
+    result = await repository.query()
+
+    # Then: Missing timestamps come first, ties are broken by id
+    assert [str(r.id) for r in result] == ["response-z", "response-b", "response-a", "response-c"]
+
+
+@pytest.mark.asyncio()
+async def test_given_cursor_when_query_pages_then_each_response_is_returned_once(repository):
+    # Given: Responses for two forms, one without a timestamp
+    await repository.create(_response("response-0", "form-1", None))
+    for i in range(1, 8):
+        await repository.create(_response(f"response-{i}", f"form-{i % 2 + 1}", i))
+
+    # When: Walk all pages and the pages of a single form
+    all_pages = await _walk(repository, limit=3)
+    form_pages = await _walk(repository, limit=2, form_id=FormId("form-1"))
+
+    # Then: Pages are contiguous and complete
+    assert all_pages == [
+        ["response-0", "response-1", "response-2"],
+        ["response-3", "response-4", "response-5"],
+        ["response-6", "response-7"],
+    ]
+    assert form_pages == [["response-0", "response-2"], ["response-4", "response-6"]]
+
+
+@pytest.mark.asyncio()
+async def test_given_cursor_response_deleted_when_query_then_resumes_after_its_position(
+    repository,
+):
+    # Given: A cursor pointing at a response that no longer exists
+    await repository.create(_response("response-1", "form-1", 1))
+    await repository.create(_response("response-3", "form-1", 3))
+    cursor = ResponseCursor(submitted_at=BASE_TIME + timedelta(minutes=2), response_id="gone")
+
+    # When: Query after the cursor
+    result = await repository.query(after=cursor, limit=10)
+
+    # Then: Responses after its position are returned
+    assert [str(r.id) for r in result] == ["response-3"]
+
+
+@pytest.mark.asyncio()
+async def test_given_responses_when_iter_pages_then_yields_bounded_pages_in_order(repository):
+    # Given: Five responses
+    for i in range(5):
+        await repository.create(_response(f"response-{i}", "form-1", i))
+
+    # When: Iterate with a page size of two
+    pages = [[str(r.id) for r in page] async for page in repository.iter_pages(page_size=2)]
+
+    # Then: Every response is visited once, at most two at a time
+    assert pages == [["response-0", "response-1"], ["response-2", "response-3"], ["response-4"]]
+
+
+@pytest.mark.asyncio()
+async def test_given_form_and_user_filters_when_query_then_returns_intersection(repository):
+    # Given: Responses from two users across two forms
+    for i in range(6):
+        await repository.create(_response(f"response-{i}", f"form-{i % 2}", i, f"user-{i % 3}"))
+
+    # When: Query by user, and by user and form
+    by_user = await repository.query(user_id="user-0")
+    by_user_and_form = await repository.query(form_id=FormId("form-1"), user_id="user-0", limit=5)
+
+    # Then: Only matching responses are returned in order
+    assert [str(r.id) for r in by_user] == ["response-0", "response-3"]
+    assert [str(r.id) for r in by_user_and_form] == ["response-3"]
+
+
+@pytest.mark.asyncio()
+async def test_given_tagged_responses_when_query_by_tags_then_intersects_all_pairs(repository):
+    # Given: Responses across campaigns and sources
+    tag_sets = [
+        {"campaign": "summer", "source": "email"},
+        {"campaign": "summer", "source": "sms"},
+        {"campaign": "winter", "source": "email"},
+        {"campaign": "summer", "source": "email", "group": "premium"},
+        {},
+    ]
+    for i, tags in enumerate(tag_sets):
+        await repository.create(_response(f"response-{i}", f"form-{i % 2}", i, tags=tags))
+
+    # When: Filter by one, two and three tag pairs, combined with a form
+    summer = await repository.query(tags={"campaign": "summer"})
+    summer_email = await repository.query(tags={"campaign": "summer", "source": "email"})
+    premium = await repository.query(
+        tags={"campaign": "summer", "source": "email", "group": "premium"}
+    )
+    summer_form_1 = await repository.query(form_id=FormId("form-1"), tags={"campaign": "summer"})
+    unknown = await repository.query(tags={"campaign": "autumn"})
+
+    # Then: Only responses carrying every pair are returned, in timeline order
+    assert [str(r.id) for r in summer] == ["response-0", "response-1", "response-3"]
+    assert [str(r.id) for r in summer_email] == ["response-0", "response-3"]
+    assert [str(r.id) for r in premium] == ["response-3"]
+    assert [str(r.id) for r in summer_form_1] == ["response-1", "response-3"]
+    assert unknown == []
+
+
+@pytest.mark.asyncio()
+async def test_given_tagged_responses_replaced_or_deleted_when_query_by_tags_then_index_follows(
+    repository,
+):
+    # Given: Tagged responses, one re-stored with a new campaign and one user's data erased
+    await repository.create_many(
+        [
+            _response("response-1", "form-1", 1, "user1", {"campaign": "summer"}),
+            _response("response-2", "form-1", 2, "user2", {"campaign": "summer"}),
+        ]
+    )
+    await repository.create(_response("response-2", "form-1", 2, "user2", {"campaign": "winter"}))
+    await repository.delete_by_user_id("user1")
+
+    # When: Query both campaigns
+    summer = await repository.query(tags={"campaign": "summer"})
+    winter = await repository.query(tags={"campaign": "winter"})
+
+    # Then: Stale postings are gone
+    assert summer == []
+    assert [str(r.id) for r in winter] == ["response-2"]
+
+
+@pytest.mark.asyncio()
+async def test_given_responses_over_time_when_query_since_until_then_returns_half_open_range(
+    repository,
+):
+    # Given: Responses one minute apart, one undated, across two forms
+    await repository.create(_response("response-undated", "form-1", None))
+    for i in range(6):
+        await repository.create(_response(f"response-{i}", f"form-{i % 2}", i))
+    since = BASE_TIME + timedelta(minutes=1)
+    until = BASE_TIME + timedelta(minutes=4)
+
+    # When: Query a window, open-ended windows, a window within a form, and a paged window
+    window = await repository.query(since=since, until=until)
+    only_until = await repository.query(until=BASE_TIME + timedelta(minutes=1))
+    only_since = await repository.query(since=BASE_TIME + timedelta(minutes=5))
+    form_window = await repository.query(form_id=FormId("form-1"), since=since, until=until)
+    first_page = await repository.query(since=since, until=until, limit=2)
+    last = first_page[-1]
+    second_page = await repository.query(
+        since=since,
+        until=until,
+        after=ResponseCursor(submitted_at=last.submitted_at, response_id=str(last.id)),
+    )
+
+    # Then: since is inclusive, until is exclusive and undated responses never match
+    assert [str(r.id) for r in window] == ["response-1", "response-2", "response-3"]
+    assert [str(r.id) for r in only_until] == ["response-0"]
+    assert [str(r.id) for r in only_since] == ["response-5"]
+    assert [str(r.id) for r in form_window] == ["response-1", "response-3"]
+    assert [str(r.id) for r in first_page + second_page] == [str(r.id) for r in window]
@@ -0,0 +1,158 @@
+import asyncio
+import fcntl
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+from application.cache.form_payload_cache import FormPayload, FormPayloadCache
+from domain.entities.form import Form
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from infrastructure.persistence.shared_form_catalog import SharedFormCatalog
+from infrastructure.persistence.shared_form_repository import SharedFormRepository
+
+
+def _form(form_id: str, name: str = "Survey") -> Form:
+    return Form(id=FormId(form_id), type=FormType.SURVEY, name=MultilingualText({"en": name}))
+
+
+def _rename_in_other_process(path: str, form_id: str, name: str) -> None:
+    catalog = SharedFormCatalog(path)
+    asyncio.run(catalog.put(_form(form_id, name), must_exist=True))
+    catalog.close()
+
+
+@pytest.mark.asyncio()
+async def test_given_two_workers_when_one_writes_then_the_other_reads_the_change(
+    tmp_path: Path,
+) -> None:
+    # Given: Two repositories mapping the same catalog, as two workers would
+    path = tmp_path / "forms.catalog"
+    first = SharedFormRepository(SharedFormCatalog(path))
+    second = SharedFormRepository(SharedFormCatalog(path))
+
+    # When: The first worker creates, updates and deletes forms
+    await first.create(_form("form-1"))
+    await first.create(_form("form-2"))
+    await first.update(_form("form-1", name="Renamed"))
+    await first.delete(FormId("form-2"))
+
+    # Then: The second worker sees the latest catalog
+    form = await second.get_by_id(FormId("form-1"))
+    assert form is not None
+    assert form.name.translations == {"en": "Renamed"}
+    assert await second.get_by_id(FormId("form-2")) is None
+    assert [str(f.id) for f in await second.get_all()] == ["form-1"]
+
+
+@pytest.mark.asyncio()
+async def test_given_cached_payload_when_another_process_updates_the_form_then_it_is_invalidated(
+    tmp_path: Path,
+) -> None:
+    # Given: A worker with serialized payloads cached for two forms
+    path = tmp_path / "forms.catalog"
+    catalog = SharedFormCatalog(path)
+    await catalog.put(_form("form-1"))
+    await catalog.put(_form("form-2"))
+    cache = FormPayloadCache(refresh=catalog.refresh)
+    catalog.subscribe(cache.invalidate)
+    payload = FormPayload(body=b"{}", etag='"etag"')
+    cache.set("form-1", payload)
+    cache.set("form-2", payload)
+    generation = catalog.generation
+
+    # When: Another process updates one form
+    process = multiprocessing.get_context("fork").Process(
+        target=_rename_in_other_process, args=(str(path), "form-1", "Renamed")
+    )
+    process.start()
+    process.join()
+
+    # Then: Only the changed form is evicted and the new version is served
+    assert process.exitcode == 0
+    assert catalog.generation == generation + 1
+    assert cache.get("form-1") is None
+    assert cache.get("form-2") == payload
+    form = catalog.get("form-1")
+    assert form is not None
+    assert form.name.translations == {"en": "Renamed"}
+
+
+@pytest.mark.asyncio()
+async def test_given_unknown_form_when_updating_or_deleting_then_raises_value_error(
+    tmp_path: Path,
+) -> None:
+    # Given
+    repository = SharedFormRepository(SharedFormCatalog(tmp_path / "forms.catalog"))
+
+    # When / Then
+    with pytest.raises(ValueError, match="not found"):
+        await repository.update(_form("missing"))
+    with pytest.raises(ValueError, match="not found"):
+        await repository.delete(FormId("missing"))
+
+
+def test_given_file_that_is_not_a_catalog_when_opening_then_raises_value_error(
+    tmp_path: Path,
+) -> None:
+    # Given
+    path = tmp_path / "forms.catalog"
+    path.write_bytes(b"x" * 64)
+
+    # When / Then
+    with pytest.raises(ValueError, match="form catalog"):
+        SharedFormCatalog(path)
+
+
+@pytest.mark.asyncio()
+async def test_given_crash_before_the_header_switch_when_reopening_then_previous_catalog_is_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: A catalog with one form, and a writer that dies after writing the new body
+    path = tmp_path / "forms.catalog"
+    catalog = SharedFormCatalog(path)
+    await catalog.put(_form("form-1"))
+
+    def crash(_: int) -> None:
+        msg = "simulated crash"
+        raise OSError(msg)
+
+    monkeypatch.setattr("infrastructure.persistence.shared_form_catalog.os.fdatasync", crash)
+    with pytest.raises(OSError, match="simulated crash"):
+        await catalog.put(_form("form-2", name="x" * 4096))
+    monkeypatch.undo()
+
+    # When: Another worker opens the catalog
+    reopened = SharedFormCatalog(path)
+
+    # Then: It reads the last complete catalog and can keep writing
+    assert [str(form.id) for form in reopened.forms()] == ["form-1"]
+    await reopened.put(_form("form-3"))
+    assert [str(form.id) for form in SharedFormCatalog(path).forms()] == ["form-1", "form-3"]
+
+
+@pytest.mark.asyncio()
+async def test_given_catalog_locked_by_another_writer_when_writing_then_event_loop_keeps_running(
+    tmp_path: Path,
+) -> None:
+    # Given: Another process holding the catalog write lock
+    path = tmp_path / "forms.catalog"
+    catalog = SharedFormCatalog(path)
+    await catalog.put(_form("form-1"))
+    other = os.open(path, os.O_RDWR)
+    fcntl.flock(other, fcntl.LOCK_EX)
+
+    # When: A write waits for the lock
+    write = asyncio.ensure_future(catalog.put(_form("form-2")))
+    await asyncio.sleep(0.05)
+
+    # Then: Reads are still served and the write completes once the lock is released
+    assert not write.done()
+    assert [str(form.id) for form in catalog.forms()] == ["form-1"]
+    fcntl.flock(other, fcntl.LOCK_UN)
+    os.close(other)
+    await write
+    assert [str(form.id) for form in catalog.forms()] == ["form-1", "form-2"]
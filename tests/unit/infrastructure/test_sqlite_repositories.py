@@ -0,0 +1,251 @@
+from datetime import UTC, datetime
+
+import pytest
+
+import infrastructure.config.dependencies as deps
+from application.analytics.response_aggregator import ResponseAggregator
+from domain.entities.answer import Answer
+from domain.entities.form import Form
+from domain.entities.question import Question
+from domain.entities.response import Response
+from domain.value_objects.form_id import FormId
+from domain.value_objects.form_type import FormType
+from domain.value_objects.multilingual_text import MultilingualText
+from domain.value_objects.question_id import QuestionId
+from domain.value_objects.question_type import QuestionType
+from domain.value_objects.response_id import ResponseId
+from infrastructure.persistence.sqlite_database import SQLiteDatabase
+from infrastructure.persistence.sqlite_form_aggregate_store import SQLiteFormAggregateStore
+from infrastructure.persistence.sqlite_form_repository import SQLiteFormRepository
+from infrastructure.persistence.sqlite_response_repository import SQLiteResponseRepository
+
+AGGREGATE_TABLES = ("form_aggregates", "question_aggregates", "rating_counts", "option_counts")
+
+
+@pytest.fixture()
+def database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "feedback.db"))
+    yield database
+    database.close()
+
+
+def _form(form_id: str, form_type: FormType = FormType.SURVEY) -> Form:
+    return Form(
+        id=FormId(form_id),
+        type=form_type,
+        name=MultilingualText({"en": "Survey", "es": "Encuesta"}),
+        questions=[
+            Question(
+                id=QuestionId("q-choice"),
+                type=QuestionType.MULTIPLE_CHOICE,
+                text=MultilingualText({"en": "Pick"}),
+                required=True,
+                options=[MultilingualText({"en": "Yes"}), MultilingualText({"en": "No"})],
+            ),
+        ],
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+def _response(response_id: str, form_id: str, user_id: str | None = None) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId(form_id),
+        answers=[Answer(question_id=QuestionId("q-choice"), value=["Yes"])],
+        tags={"campaign": "summer2024"},
+        user_id=user_id,
+        submitted_at=datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_stored_form_when_get_by_id_then_round_trips_all_fields(database):
+    # Given: A form stored in SQLite
+    repository = SQLiteFormRepository(database)
+    form = _form("form-1")
+    await repository.create(form)
+
+    # When: Read it back
+    result = await repository.get_by_id(FormId("form-1"))
+
+    # Then: The form is equal to the original
+    assert result == form
+
+
+@pytest.mark.asyncio()
+async def test_given_forms_of_several_types_when_get_all_with_type_then_filters(database):
+    # Given: Forms with different types
+    repository = SQLiteFormRepository(database)
+    await repository.create(_form("form-1", FormType.SURVEY))
+    await repository.create(_form("form-2", FormType.CUSTOM))
+
+    # When: List forms of one type
+    result = await repository.get_all(FormType.CUSTOM)
+
+    # Then: Only matching forms are returned
+    assert [str(f.id) for f in result] == ["form-2"]
+
+
+@pytest.mark.asyncio()
+async def test_given_missing_form_when_update_or_delete_then_raises_error(database):
+    # Given: An empty repository
+    repository = SQLiteFormRepository(database)
+
+    # When: Update or delete an unknown form
+    # Then: ValueError is raised
+    with pytest.raises(ValueError, match="not found"):
+        await repository.update(_form("missing"))
+    with pytest.raises(ValueError, match="not found"):
+        await repository.delete(FormId("missing"))
+
+
+@pytest.mark.asyncio()
+async def test_given_stored_responses_when_query_by_form_and_user_then_returns_matches(database):
+    # Given: Responses for two forms and two users
+    repository = SQLiteResponseRepository(database)
+    await repository.create(_response("response-1", "form-1", user_id="user1"))
+    await repository.create(_response("response-2", "form-2", user_id="user2"))
+    await repository.create(_response("response-3", "form-1", user_id="user2"))
+
+    # When: Query by form and by user
+    by_form = await repository.get_by_form_id(FormId("form-1"))
+    by_user = await repository.get_by_user_id("user2")
+
+    # Then: Matching responses are returned in insertion order with all fields
+    assert [str(r.id) for r in by_form] == ["response-1", "response-3"]
+    assert [str(r.id) for r in by_user] == ["response-2", "response-3"]
+    assert by_form[0] == _response("response-1", "form-1", user_id="user1")
+
+
+@pytest.mark.asyncio()
+async def test_given_user_responses_when_delete_by_user_id_then_persists_across_reopen(tmp_path):
+    # Given: A database file with responses from two users
+    path = str(tmp_path / "feedback.db")
+    database = SQLiteDatabase(path)
+    repository = SQLiteResponseRepository(database)
+    await repository.create(_response("response-1", "form-1", user_id="user1"))
+    await repository.create(_response("response-2", "form-1", user_id="user2"))
+
+    # When: Delete one user's data and reopen the database
+    deleted = await repository.delete_by_user_id("user1")
+    database.close()
+    reopened = SQLiteDatabase(path)
+    remaining = await SQLiteResponseRepository(reopened).get_all()
+    reopened.close()
+
+    # Then: Only the other user's response survives
+    assert [str(r.id) for r in deleted] == ["response-1"]
+    assert [r.user_id for r in remaining] == ["user2"]
+
+
+@pytest.mark.asyncio()
+async def test_given_database_without_tag_index_when_reopened_then_backfills_tags(tmp_path):
+    # Given: A database whose responses predate the response_tags table
+    path = str(tmp_path / "feedback.db")
+    database = SQLiteDatabase(path)
+    await SQLiteResponseRepository(database).create(_response("response-1", "form-1"))
+    await database.run(lambda connection: connection.execute("DROP TABLE response_tags"))
+    database.close()
+
+    # When: Reopen it and filter by tag
+    reopened = SQLiteDatabase(path)
+    result = await SQLiteResponseRepository(reopened).query(tags={"campaign": "summer2024"})
+    reopened.close()
+
+    # Then: Existing tags were indexed
+    assert [str(r.id) for r in result] == ["response-1"]
+
+
+def _rated_response(response_id: str, rating: int, user_id: str | None = None) -> Response:
+    return Response(
+        id=ResponseId(response_id),
+        form_id=FormId("form-1"),
+        answers=[
+            Answer(question_id=QuestionId("q-rating"), value=rating),
+            Answer(question_id=QuestionId("q-choice"), value=["Yes", "No"][: rating % 2 + 1]),
+            Answer(question_id=QuestionId("q-text"), value="Fine"),
+        ],
+        user_id=user_id,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_given_writes_and_deletes_when_reading_aggregates_then_match_the_live_responses(
+    database,
+):
+    # Given: Responses created one by one, in a batch, replaced and partly deleted
+    repository = SQLiteResponseRepository(database)
+    await repository.create(_rated_response("response-1", 5, user_id="user1"))
+    await repository.create(_rated_response("response-1", 2, user_id="user1"))
+    await repository.create_many(
+        [_rated_response("response-2", 4, user_id="user2"), _rated_response("response-3", 3)]
+    )
+    await repository.create(_rated_response("response-4", 1, user_id="user1"))
+
+    # When: One user's data is deleted and the aggregates are read
+    await repository.delete_by_user_id("user1")
+    aggregate = await SQLiteFormAggregateStore(database).get("form-1")
+
+    # Then: They equal aggregating the remaining responses from scratch
+    expected = ResponseAggregator()
+    expected.add_many(await repository.get_all())
+    assert aggregate == expected.get("form-1")
+    assert await SQLiteFormAggregateStore(database).get("missing") is None
+
+
+@pytest.mark.asyncio()
+async def test_given_last_response_deleted_when_reading_aggregates_then_form_has_none(database):
+    # Given: A form with a single response
+    repository = SQLiteResponseRepository(database)
+    await repository.create(_rated_response("response-1", 5, user_id="user1"))
+
+    # When: It is deleted
+    await repository.delete_by_user_id("user1")
+
+    # Then: No aggregate rows are left behind
+    assert await SQLiteFormAggregateStore(database).get("form-1") is None
+    count_rows = " + ".join(f"(SELECT COUNT(*) FROM {table})" for table in AGGREGATE_TABLES)
+    row = await database.run(
+        lambda connection: connection.execute(f"SELECT {count_rows}").fetchone()
+    )
+    assert row == (0,)
+
+
+@pytest.mark.asyncio()
+async def test_given_database_without_aggregates_when_reopened_then_backfills_them(tmp_path):
+    # Given: A database whose responses predate the aggregate tables
+    path = str(tmp_path / "feedback.db")
+    database = SQLiteDatabase(path)
+    repository = SQLiteResponseRepository(database)
+    await repository.create_many([_rated_response(f"response-{i}", i % 5 + 1) for i in range(7)])
+    responses = await repository.get_all()
+    drop_tables = ";".join(f"DROP TABLE {table}" for table in AGGREGATE_TABLES)
+    await database.run(lambda connection: connection.executescript(drop_tables))
+    database.close()
+
+    # When: Reopen it and read the aggregates
+    reopened = SQLiteDatabase(path)
+    aggregate = await SQLiteFormAggregateStore(reopened).get("form-1")
+    reopened.close()
+
+    # Then: They were rebuilt from the stored responses
+    expected = ResponseAggregator()
+    expected.add_many(responses)
+    assert aggregate == expected.get("form-1")
+
+
+def test_given_sqlite_repositories_when_close_dependencies_then_singletons_are_cleared(tmp_path):
+    # Given: Repository singletons bound to an open SQLite database
+    database = SQLiteDatabase(str(tmp_path / "feedback.db"))
+    deps._sqlite_database = database
+    deps._form_repository = SQLiteFormRepository(database)
+    deps._response_repository = SQLiteResponseRepository(database)
+
+    # When: The dependencies are closed
+    deps.close_dependencies()
+
+    # Then: No singleton still points at the closed database
+    assert deps._sqlite_database is None
+    assert deps._form_repository is None
+    assert deps._response_repository is None